@@ -5,12 +5,17 @@ Used for GEX and Dark Pool data where UW provides direct data
 but Polygon can calculate approximations.
 """
 
+import datetime
+import math
 import time
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
 
 from ifds.events.logger import EventLogger
 from ifds.events.types import EventType, Severity
+from ifds.utils.io import atomic_write_json, json_loads
 
 
 class GEXProvider(ABC):
@@ -103,14 +108,15 @@ class UWGEXProvider(GEXProvider):
         net_gex = sum(gex_by_strike.values())
         call_wall = max(call_gex, key=call_gex.get) if call_gex else 0
         put_wall = max(put_gex, key=lambda k: abs(put_gex[k])) if put_gex else 0
-        zero_gamma = _find_zero_gamma(gex_by_strike)
+        strike_items = sorted(gex_by_strike.items())
+        zero_gamma = _zero_gamma_from_sorted(strike_items)
 
         return {
             "net_gex": net_gex,
             "call_wall": call_wall,
             "put_wall": put_wall,
             "zero_gamma": zero_gamma,
-            "gex_by_strike": [{"strike": s, "gex": g} for s, g in sorted(gex_by_strike.items())],
+            "gex_by_strike": [{"strike": s, "gex": g} for s, g in strike_items],
             "source": "unusual_whales",
         }
 
@@ -132,75 +138,8 @@ class PolygonGEXProvider(GEXProvider):
         return self._calculate_gex(ticker, options, max_dte=self._max_dte)
 
     def _calculate_gex(self, ticker: str, options: list[dict], max_dte: int = 90) -> dict:
-        """Calculate GEX from raw options chain data.
-
-        GEX per strike = Gamma * OI * 100 * Spot^2 * 0.01
-        Options beyond max_dte are excluded (front-month filter).
-        If DTE filter leaves <5 contracts, all contracts are used as fallback.
-        """
-        from datetime import date as _date
-
-        today = _date.today()
-
-        # Pre-filter by DTE, with <5 contract fallback
-        filtered = options
-        if max_dte > 0:
-            dte_filtered = []
-            for opt in options:
-                exp_str = opt.get("details", {}).get("expiration_date")
-                if exp_str:
-                    try:
-                        exp_date = _date.fromisoformat(exp_str)
-                        if (exp_date - today).days > max_dte:
-                            continue
-                    except ValueError:
-                        pass  # Bad date format → include
-                dte_filtered.append(opt)
-            if len(dte_filtered) >= 5:
-                filtered = dte_filtered
-            # else: <5 contracts after DTE filter → use all
-
-        gex_by_strike: dict[float, float] = {}
-        call_gex: dict[float, float] = {}
-        put_gex: dict[float, float] = {}
-
-        for opt in filtered:
-            details = opt.get("details", {})
-            greeks = opt.get("greeks", {})
-            day = opt.get("day", {})
-
-            strike = details.get("strike_price", 0)
-            gamma = greeks.get("gamma", 0)
-            oi = opt.get("open_interest", day.get("open_interest", 0))
-            spot = opt.get("underlying_asset", {}).get("price", 0)
-            contract_type = details.get("contract_type", "").lower()
-
-            if not all([strike, gamma, spot]):
-                continue
-
-            gex = gamma * oi * 100 * (spot**2) * 0.01
-
-            if contract_type == "call":
-                call_gex[strike] = call_gex.get(strike, 0) + gex
-                gex_by_strike[strike] = gex_by_strike.get(strike, 0) + gex
-            elif contract_type == "put":
-                put_gex[strike] = put_gex.get(strike, 0) + gex
-                gex_by_strike[strike] = gex_by_strike.get(strike, 0) - gex
-
-        net_gex = sum(call_gex.values()) - sum(put_gex.values())
-        call_wall = max(call_gex, key=call_gex.get) if call_gex else 0
-        put_wall = max(put_gex, key=lambda k: abs(put_gex[k])) if put_gex else 0
-
-        zero_gamma = _find_zero_gamma(gex_by_strike)
-
-        return {
-            "net_gex": net_gex,
-            "call_wall": call_wall,
-            "put_wall": put_wall,
-            "zero_gamma": zero_gamma,
-            "gex_by_strike": [{"strike": s, "gex": g} for s, g in sorted(gex_by_strike.items())],
-            "source": "polygon_calculated",
-        }
+        """Calculate GEX from raw options chain data (see _calculate_polygon_gex)."""
+        return _calculate_polygon_gex(options, max_dte=max_dte)
 
     def provider_name(self) -> str:
         return "polygon"
@@ -228,6 +167,10 @@ class UWBatchDarkPoolProvider(DarkPoolProvider):
     Fetches all recent DP trades in ~15 paginated calls,
     groups by ticker, serves from in-memory cache.
     Replaces ~882 per-ticker API calls.
+
+    With ``cache_dir`` set, a prefetch is also persisted as
+    ``dp_{date}.json`` and a later process (notebook restart, repeated
+    scan) reuses it for ``cache_ttl_s`` seconds instead of re-paginating.
     """
 
     def __init__(
@@ -236,18 +179,36 @@ class UWBatchDarkPoolProvider(DarkPoolProvider):
         logger: EventLogger | None = None,
         max_pages: int = 15,
         page_delay: float = 0.5,
+        cache_dir: str | Path | None = None,
+        cache_ttl_s: float = 900.0,
     ):
         self._client = uw_client
         self._logger = logger
         self._max_pages = max_pages
         self._page_delay = page_delay
-        self._cache: dict[str, list[dict]] = {}
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_ttl_s = cache_ttl_s
+        self._cache: dict[str, list[_DPTrade]] = {}
+        # Aggregates memoised per ticker — get_dark_pool() is called again for
+        # the same ticker across passes; callers treat the dict as read-only.
+        self._agg_cache: dict[str, dict] = {}
         self._prefetched = False
 
     def prefetch(self, date: str | None = None) -> None:
         """Fetch all recent DP trades and group by ticker."""
         self._cache.clear()
+        self._agg_cache.clear()
+        disk_path = _dp_disk_path(self._cache_dir, date)
+        if disk_path is not None:
+            cached = _load_dp_disk_cache(disk_path, self._cache_ttl_s)
+            if cached is not None:
+                self._cache = cached
+                self._prefetched = True
+                self._log_prefetch(source=" (disk cache)")
+                return
+
         older_than = None
+        seen: set[tuple] = set()
 
         for page in range(self._max_pages):
             records = self._client.get_dark_pool_recent(
@@ -258,10 +219,7 @@ class UWBatchDarkPoolProvider(DarkPoolProvider):
             if not records:
                 break
 
-            for record in records:
-                ticker = record.get("ticker", "")
-                if ticker:
-                    self._cache.setdefault(ticker, []).append(record)
+            _group_dp_page(self._cache, _unseen_dp_records(records, seen))
 
             older_than = records[-1].get("executed_at")
             if not older_than:
@@ -271,22 +229,30 @@ class UWBatchDarkPoolProvider(DarkPoolProvider):
                 time.sleep(self._page_delay)
 
         self._prefetched = True
+        if disk_path is not None:
+            _save_dp_disk_cache(disk_path, self._cache)
+        self._log_prefetch()
+
+    def _log_prefetch(self, source: str = "") -> None:
         if self._logger:
             self._logger.log(
                 EventType.DATA_PREFETCH,
                 Severity.INFO,
                 phase=4,
                 message=f"Dark Pool batch: {sum(len(v) for v in self._cache.values())} "
-                f"trades across {len(self._cache)} tickers",
+                f"trades across {len(self._cache)} tickers{source}",
             )
 
     def get_dark_pool(self, ticker: str) -> dict | None:
         if not self._prefetched:
             self.prefetch()
-        records = self._cache.get(ticker)
-        if not records:
-            return None
-        return _aggregate_dp_records(records)
+        agg = self._agg_cache.get(ticker)
+        if agg is None:
+            records = self._cache.get(ticker)
+            if not records:
+                return None
+            agg = self._agg_cache[ticker] = _aggregate_dp_trades(records)
+        return agg
 
     def provider_name(self) -> str:
         return "unusual_whales_batch"
@@ -375,18 +341,142 @@ class FallbackDarkPoolProvider(DarkPoolProvider):
         return self._primary.provider_name()
 
 
+# Indexed by sign(dp_buys - dp_sells): 0 → NEUTRAL, 1 → BULLISH, -1 → BEARISH
+_DP_SIGNALS = ("NEUTRAL", "BULLISH", "BEARISH")
+
+
+class _DPTrade(NamedTuple):
+    """A dark-pool trade with its numeric fields parsed once, at ingest."""
+
+    size: int
+    premium: float
+    volume: int
+    price: float
+    market_center: str
+    nbbo_ask: float
+    nbbo_bid: float
+
+
+_new_trade = tuple.__new__
+
+
+def _normalize_dp_record(record: dict) -> _DPTrade:
+    """Parse the fields _aggregate_dp_trades needs out of a raw UW record.
+
+    UW sends numerics as strings; None and unparseable values become 0
+    (same semantics as _safe_int/_safe_float, without the per-field calls).
+    """
+    get = record.get
+    try:
+        size = int(get("size", 0))
+    except (ValueError, TypeError):
+        size = 0
+    try:
+        premium = float(get("premium", 0))
+    except (ValueError, TypeError):
+        premium = 0.0
+    try:
+        volume = int(get("volume", 0))
+    except (ValueError, TypeError):
+        volume = 0
+    try:
+        price = float(get("price", 0))
+    except (ValueError, TypeError):
+        price = 0.0
+    try:
+        nbbo_ask = float(get("nbbo_ask", 0))
+    except (ValueError, TypeError):
+        nbbo_ask = 0.0
+    try:
+        nbbo_bid = float(get("nbbo_bid", 0))
+    except (ValueError, TypeError):
+        nbbo_bid = 0.0
+    # tuple.__new__ skips the NamedTuple's Python-level __new__ (hot path)
+    return _new_trade(
+        _DPTrade,
+        (size, premium, volume, price, get("market_center", "UNKNOWN"), nbbo_ask, nbbo_bid),
+    )
+
+
+def _unseen_dp_records(records: list[dict], seen: set[tuple]) -> list[dict]:
+    """Drop records an earlier page already delivered, then remember this page's.
+
+    ``older_than`` pagination can repeat trades that share the boundary
+    timestamp; counting them twice would inflate dp_volume. Keys are only
+    checked against *previous* pages, so identical fills within one page
+    (distinct trades) are all kept.
+    """
+    keys = [(r.get("ticker"), r.get("executed_at"), r.get("size"), r.get("price")) for r in records]
+    fresh = [r for r, key in zip(records, keys) if key not in seen] if seen else records
+    seen.update(keys)
+    return fresh
+
+
+def _group_dp_page(cache: dict[str, list[_DPTrade]], records: list[dict]) -> None:
+    """Normalize one page of /darkpool/recent records into per-ticker buckets.
+
+    Each record is parsed exactly once here, and the bucket keeps the small
+    _DPTrade tuple rather than the full API dict. One dict lookup per record,
+    and a new list only for a ticker's first trade. Records without a
+    ticker are dropped.
+    """
+    for record in records:
+        ticker = record.get("ticker")
+        if ticker:
+            trade = _normalize_dp_record(record)
+            bucket = cache.get(ticker)
+            if bucket is None:
+                cache[ticker] = [trade]
+            else:
+                bucket.append(trade)
+
+
+def _dp_disk_path(cache_dir: Path | None, date: str | None) -> Path | None:
+    """``dp_{date}.json`` under cache_dir (today when date is None), or None if off."""
+    if cache_dir is None:
+        return None
+    day = date or datetime.date.today().isoformat()
+    return cache_dir / f"dp_{day}.json"
+
+
+def _load_dp_disk_cache(path: Path, ttl_s: float) -> dict[str, list[_DPTrade]] | None:
+    """Load a persisted prefetch if it is younger than ttl_s; None if missing/stale/corrupt."""
+    try:
+        if time.time() - path.stat().st_mtime > ttl_s:
+            return None
+        data = json_loads(path.read_bytes())
+        return {t: [_DPTrade(*row) for row in rows] for t, rows in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _save_dp_disk_cache(path: Path, cache: dict[str, list[_DPTrade]]) -> None:
+    """Persist a non-empty prefetch; a failed write never fails the prefetch."""
+    if not cache:
+        return
+    try:
+        atomic_write_json(
+            path, {t: [tuple(trade) for trade in trades] for t, trades in cache.items()}
+        )
+    except OSError:
+        pass  # cache is an optimisation — the in-memory result stands
+
+
 def _aggregate_dp_records(records: list[dict]) -> dict:
     """Aggregate raw DP trade records into signal dict.
 
     Classifies buy/sell by NBBO midpoint comparison.
-    Reused by UWDarkPoolProvider and UWBatchDarkPoolProvider.
+    Used by UWDarkPoolProvider; the batch providers normalize at ingest
+    and call _aggregate_dp_trades directly.
 
     Uses the 'volume' field from DP records (total stock day volume)
     to compute dp_pct = dp_volume / total_volume * 100.
     """
-    import math
-    from collections import Counter
+    return _aggregate_dp_trades(map(_normalize_dp_record, records))
+
 
+def _aggregate_dp_trades(trades: Iterable[_DPTrade]) -> dict:
+    """Aggregate normalized DP trades into the dark-pool signal dict."""
     dp_buys = 0
     dp_sells = 0
     dp_volume = 0
@@ -394,23 +484,18 @@ def _aggregate_dp_records(records: list[dict]) -> dict:
     total_volume = 0
     block_trade_count = 0
     block_trade_dollars = 0.0
-    venue_counts: Counter = Counter()
+    venue_counts: dict[str, int] = {}
 
-    for record in records:
-        size = _safe_int(record.get("size", 0))
+    for size, premium, vol, price, mc, nbbo_ask, nbbo_bid in trades:
         dp_volume += size
 
         # premium = trade dollar value (size × price, server-precomputed)
-        premium = _safe_float(record.get("premium", 0))
         dp_volume_dollars += premium
 
         # Each DP record carries the stock's total day volume
-        vol = _safe_int(record.get("volume", 0))
         if vol > total_volume:
             total_volume = vol
 
-        price = _safe_float(record.get("price", 0))
-
         # Block trade detection ($500K+ notional)
         notional = size * price
         if notional > 500_000:
@@ -418,11 +503,7 @@ def _aggregate_dp_records(records: list[dict]) -> dict:
             block_trade_dollars += notional
 
         # Venue tracking for Shannon entropy
-        mc = record.get("market_center", "UNKNOWN")
-        venue_counts[mc] += size
-
-        nbbo_ask = _safe_float(record.get("nbbo_ask", 0))
-        nbbo_bid = _safe_float(record.get("nbbo_bid", 0))
+        venue_counts[mc] = venue_counts.get(mc, 0) + size
 
         if nbbo_ask > 0 and nbbo_bid > 0 and price > 0:
             midpoint = (nbbo_ask + nbbo_bid) / 2
@@ -431,12 +512,7 @@ def _aggregate_dp_records(records: list[dict]) -> dict:
             else:
                 dp_sells += size
 
-    if dp_buys > dp_sells:
-        signal = "BULLISH"
-    elif dp_sells > dp_buys:
-        signal = "BEARISH"
-    else:
-        signal = "NEUTRAL"
+    signal = _DP_SIGNALS[(dp_buys > dp_sells) - (dp_sells > dp_buys)]
 
     dp_pct = round((dp_volume / total_volume) * 100, 2) if total_volume > 0 else 0.0
 
@@ -463,20 +539,116 @@ def _aggregate_dp_records(records: list[dict]) -> dict:
     }
 
 
+def _calculate_polygon_gex(
+    options: list[dict], max_dte: int = 90, today: datetime.date | None = None
+) -> dict:
+    """Calculate GEX from a raw Polygon options chain (pure computation).
+
+    GEX per strike = Gamma * OI * 100 * Spot^2 * 0.01
+    Options beyond max_dte are excluded (front-month filter).
+    If DTE filter leaves <5 contracts, all contracts are used as fallback.
+
+    Single pass per chain: expirations are parsed once per distinct date
+    (a 5-10k contract chain has only a few dozen) and the per-contract loop
+    avoids temporaries, including the day-block OI fallback unless a
+    contract actually lacks a snapshot OI. Arithmetic order matches the
+    original formula.
+
+    ``today`` anchors DTE; the wall clock is read once per chain when omitted.
+    """
+    if today is None:
+        today = datetime.date.today()
+
+    # Pre-filter by DTE, with <5 contract fallback
+    filtered = options
+    if max_dte > 0:
+        within_dte: dict[str, bool] = {}
+        dte_filtered = []
+        for opt in options:
+            exp_str = opt.get("details", {}).get("expiration_date")
+            if exp_str:
+                keep = within_dte.get(exp_str)
+                if keep is None:
+                    try:
+                        keep = (datetime.date.fromisoformat(exp_str) - today).days <= max_dte
+                    except ValueError:
+                        keep = True  # Bad date format → include
+                    within_dte[exp_str] = keep
+                if not keep:
+                    continue
+            dte_filtered.append(opt)
+        if len(dte_filtered) >= 5:
+            filtered = dte_filtered
+        # else: <5 contracts after DTE filter → use all
+
+    gex_by_strike: dict[float, float] = {}
+    call_gex: dict[float, float] = {}
+    put_gex: dict[float, float] = {}
+    # Spot is the chain's underlying price — square it once per distinct value
+    # rather than per contract (same operands, so results are bit-identical).
+    last_spot = None
+    spot_sq = 0.0
+
+    for opt in filtered:
+        details = opt.get("details", {})
+
+        strike = details.get("strike_price", 0)
+        gamma = opt.get("greeks", {}).get("gamma", 0)
+        spot = opt.get("underlying_asset", {}).get("price", 0)
+        if not (strike and gamma and spot):
+            continue
+
+        # Snapshot-level OI, else the day block; the fallback is only built
+        # when needed (an eager .get() default allocated it per contract).
+        oi = opt.get("open_interest")
+        if oi is None and "open_interest" not in opt:
+            oi = opt.get("day", {}).get("open_interest", 0)
+        if spot != last_spot:
+            spot_sq = spot**2
+            last_spot = spot
+        gex = gamma * oi * 100 * spot_sq * 0.01
+
+        contract_type = details.get("contract_type", "").lower()
+        if contract_type == "call":
+            call_gex[strike] = call_gex.get(strike, 0) + gex
+            gex_by_strike[strike] = gex_by_strike.get(strike, 0) + gex
+        elif contract_type == "put":
+            put_gex[strike] = put_gex.get(strike, 0) + gex
+            gex_by_strike[strike] = gex_by_strike.get(strike, 0) - gex
+
+    net_gex = sum(call_gex.values()) - sum(put_gex.values())
+    call_wall = max(call_gex, key=call_gex.get) if call_gex else 0
+    put_wall = max(put_gex, key=lambda k: abs(put_gex[k])) if put_gex else 0
+
+    strike_items = sorted(gex_by_strike.items())  # one sort serves both outputs
+    zero_gamma = _zero_gamma_from_sorted(strike_items)
+
+    return {
+        "net_gex": net_gex,
+        "call_wall": call_wall,
+        "put_wall": put_wall,
+        "zero_gamma": zero_gamma,
+        "gex_by_strike": [{"strike": s, "gex": g} for s, g in strike_items],
+        "source": "polygon_calculated",
+    }
+
+
 def _find_zero_gamma(gex_by_strike: dict[float, float]) -> float:
     """Find the price level where cumulative GEX crosses zero.
 
     Iterates strikes in sorted order accumulating GEX values.
     Uses linear interpolation between bracketing strikes for precision.
     """
-    if not gex_by_strike:
-        return 0.0
+    return _zero_gamma_from_sorted(sorted(gex_by_strike.items()))
+
 
+def _zero_gamma_from_sorted(strike_items: list[tuple[float, float]]) -> float:
+    """_find_zero_gamma over (strike, gex) pairs already sorted by strike."""
     cumulative = 0.0
     prev_strike = 0.0
-    for strike in sorted(gex_by_strike):
+    for strike, gex in strike_items:
         prev_cum = cumulative
-        cumulative += gex_by_strike[strike]
+        cumulative += gex
         if prev_cum != 0 and (
             (prev_cum < 0 and cumulative >= 0) or (prev_cum > 0 and cumulative <= 0)
         ):
@@ -5,11 +5,20 @@ Async version of adapters.py — reuses pure-computation functions
 """
 
 import asyncio
+from pathlib import Path
 
 from ifds.data.adapters import (
     _safe_float,
-    _find_zero_gamma,
     _aggregate_dp_records,
+    _aggregate_dp_trades,
+    _DPTrade,
+    _calculate_polygon_gex,
+    _dp_disk_path,
+    _group_dp_page,
+    _load_dp_disk_cache,
+    _save_dp_disk_cache,
+    _unseen_dp_records,
+    _zero_gamma_from_sorted,
 )
 from ifds.events.logger import EventLogger
 from ifds.events.types import EventType, Severity
@@ -48,14 +57,15 @@ def _calculate_uw_gex(strikes: list[dict]) -> dict | None:
     net_gex = sum(gex_by_strike.values())
     call_wall = max(call_gex, key=call_gex.get) if call_gex else 0
     put_wall = max(put_gex, key=lambda k: abs(put_gex[k])) if put_gex else 0
-    zero_gamma = _find_zero_gamma(gex_by_strike)
+    strike_items = sorted(gex_by_strike.items())
+    zero_gamma = _zero_gamma_from_sorted(strike_items)
 
     return {
         "net_gex": net_gex,
         "call_wall": call_wall,
         "put_wall": put_wall,
         "zero_gamma": zero_gamma,
-        "gex_by_strike": [{"strike": s, "gex": g} for s, g in sorted(gex_by_strike.items())],
+        "gex_by_strike": [{"strike": s, "gex": g} for s, g in strike_items],
         "source": "unusual_whales",
     }
 
@@ -110,75 +120,8 @@ class AsyncPolygonGEXProvider(AsyncGEXProvider):
         return self._calculate_gex(ticker, options, max_dte=self._max_dte)
 
     def _calculate_gex(self, ticker: str, options: list[dict], max_dte: int = 90) -> dict:
-        """Calculate GEX from raw options chain data.
-
-        GEX per strike = Gamma * OI * 100 * Spot^2 * 0.01
-        Options beyond max_dte are excluded (front-month filter).
-        If DTE filter leaves <5 contracts, all contracts are used as fallback.
-        """
-        from datetime import date as _date
-
-        today = _date.today()
-
-        # Pre-filter by DTE, with <5 contract fallback
-        filtered = options
-        if max_dte > 0:
-            dte_filtered = []
-            for opt in options:
-                exp_str = opt.get("details", {}).get("expiration_date")
-                if exp_str:
-                    try:
-                        exp_date = _date.fromisoformat(exp_str)
-                        if (exp_date - today).days > max_dte:
-                            continue
-                    except ValueError:
-                        pass  # Bad date format → include
-                dte_filtered.append(opt)
-            if len(dte_filtered) >= 5:
-                filtered = dte_filtered
-            # else: <5 contracts after DTE filter → use all
-
-        gex_by_strike: dict[float, float] = {}
-        call_gex: dict[float, float] = {}
-        put_gex: dict[float, float] = {}
-
-        for opt in filtered:
-            details = opt.get("details", {})
-            greeks = opt.get("greeks", {})
-            day = opt.get("day", {})
-
-            strike = details.get("strike_price", 0)
-            gamma = greeks.get("gamma", 0)
-            oi = opt.get("open_interest", day.get("open_interest", 0))
-            spot = opt.get("underlying_asset", {}).get("price", 0)
-            contract_type = details.get("contract_type", "").lower()
-
-            if not all([strike, gamma, spot]):
-                continue
-
-            gex = gamma * oi * 100 * (spot**2) * 0.01
-
-            if contract_type == "call":
-                call_gex[strike] = call_gex.get(strike, 0) + gex
-                gex_by_strike[strike] = gex_by_strike.get(strike, 0) + gex
-            elif contract_type == "put":
-                put_gex[strike] = put_gex.get(strike, 0) + gex
-                gex_by_strike[strike] = gex_by_strike.get(strike, 0) - gex
-
-        net_gex = sum(call_gex.values()) - sum(put_gex.values())
-        call_wall = max(call_gex, key=call_gex.get) if call_gex else 0
-        put_wall = max(put_gex, key=lambda k: abs(put_gex[k])) if put_gex else 0
-
-        zero_gamma = _find_zero_gamma(gex_by_strike)
-
-        return {
-            "net_gex": net_gex,
-            "call_wall": call_wall,
-            "put_wall": put_wall,
-            "zero_gamma": zero_gamma,
-            "gex_by_strike": [{"strike": s, "gex": g} for s, g in sorted(gex_by_strike.items())],
-            "source": "polygon_calculated",
-        }
+        """Calculate GEX from raw options chain data (see _calculate_polygon_gex)."""
+        return _calculate_polygon_gex(options, max_dte=max_dte)
 
     def provider_name(self) -> str:
         return "polygon"
@@ -201,7 +144,11 @@ class AsyncUWDarkPoolProvider(AsyncDarkPoolProvider):
 
 
 class AsyncUWBatchDarkPoolProvider(AsyncDarkPoolProvider):
-    """Async Dark Pool batch prefetch via /api/darkpool/recent."""
+    """Async Dark Pool batch prefetch via /api/darkpool/recent.
+
+    ``cache_dir`` / ``cache_ttl_s`` persist and reuse the prefetch on disk
+    exactly as in :class:`~ifds.data.adapters.UWBatchDarkPoolProvider`.
+    """
 
     def __init__(
         self,
@@ -209,20 +156,49 @@ class AsyncUWBatchDarkPoolProvider(AsyncDarkPoolProvider):
         logger: EventLogger | None = None,
         max_pages: int = 15,
         page_delay: float = 0.3,
+        cache_dir: str | Path | None = None,
+        cache_ttl_s: float = 900.0,
     ):
         self._client = uw_client
         self._logger = logger
         self._max_pages = max_pages
         self._page_delay = page_delay
-        self._cache: dict[str, list[dict]] = {}
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_ttl_s = cache_ttl_s
+        self._cache: dict[str, list[_DPTrade]] = {}
+        # Aggregates memoised per ticker — get_dark_pool() is called again for
+        # the same ticker across passes; callers treat the dict as read-only.
+        self._agg_cache: dict[str, dict] = {}
         self._prefetched = False
+        # Page-spacing sleep hook — tests swap in a recorder
+        self._sleep = asyncio.sleep
 
     async def prefetch(self, date: str | None = None) -> None:
-        """Fetch all recent DP trades and group by ticker."""
+        """Fetch all recent DP trades and group by ticker.
+
+        Pages are cursor-chained (``older_than`` = last record of the previous
+        page), so they cannot be fetched speculatively in parallel. Instead
+        ``page_delay`` is the minimum spacing between request *starts*: the
+        round-trip and grouping time of a page count toward the delay rather
+        than being added on top of it.
+        """
         self._cache.clear()
+        self._agg_cache.clear()
+        disk_path = _dp_disk_path(self._cache_dir, date)
+        if disk_path is not None:
+            cached = _load_dp_disk_cache(disk_path, self._cache_ttl_s)
+            if cached is not None:
+                self._cache = cached
+                self._prefetched = True
+                self._log_prefetch(source=" (disk cache)")
+                return
+
         older_than = None
+        seen: set[tuple] = set()
+        loop = asyncio.get_running_loop()
 
         for page in range(self._max_pages):
+            started = loop.time()
             records = await self._client.get_dark_pool_recent(
                 limit=200,
                 date=date,
@@ -231,35 +207,42 @@ class AsyncUWBatchDarkPoolProvider(AsyncDarkPoolProvider):
             if not records:
                 break
 
-            for record in records:
-                ticker = record.get("ticker", "")
-                if ticker:
-                    self._cache.setdefault(ticker, []).append(record)
+            _group_dp_page(self._cache, _unseen_dp_records(records, seen))
 
             older_than = records[-1].get("executed_at")
             if not older_than:
                 break
 
             if page < self._max_pages - 1 and self._page_delay > 0:
-                await asyncio.sleep(self._page_delay)
+                remaining = self._page_delay - (loop.time() - started)
+                if remaining > 0:
+                    await self._sleep(remaining)
 
         self._prefetched = True
+        if disk_path is not None:
+            _save_dp_disk_cache(disk_path, self._cache)
+        self._log_prefetch()
+
+    def _log_prefetch(self, source: str = "") -> None:
         if self._logger:
             self._logger.log(
                 EventType.DATA_PREFETCH,
                 Severity.INFO,
                 phase=4,
                 message=f"Dark Pool batch: {sum(len(v) for v in self._cache.values())} "
-                f"trades across {len(self._cache)} tickers",
+                f"trades across {len(self._cache)} tickers{source}",
             )
 
     async def get_dark_pool(self, ticker: str) -> dict | None:
         if not self._prefetched:
             await self.prefetch()
-        records = self._cache.get(ticker)
-        if not records:
-            return None
-        return _aggregate_dp_records(records)
+        agg = self._agg_cache.get(ticker)
+        if agg is None:
+            records = self._cache.get(ticker)
+            if not records:
+                return None
+            agg = self._agg_cache[ticker] = _aggregate_dp_trades(records)
+        return agg
 
     def provider_name(self) -> str:
         return "unusual_whales_batch"
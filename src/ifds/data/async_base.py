@@ -7,16 +7,43 @@ from typing import Any
 
 import aiohttp
 
+from ifds.data.base import RETRIABLE_STATUSES
 from ifds.models.market import APIHealthResult, APIStatus
+from ifds.utils.io import json_loads
+
+# Connector pool caps shared by owned and injected sessions (Polygon/FMP host concentration)
+POOL_LIMIT = 200
+POOL_LIMIT_PER_HOST = 50
+
+
+def create_shared_session(
+    limit: int = POOL_LIMIT,
+    limit_per_host: int = POOL_LIMIT_PER_HOST,
+    ttl_dns_cache: int = 300,
+    keepalive_timeout: int = 60,
+) -> aiohttp.ClientSession:
+    """Build one pooled session for a phase run, shared by all provider clients.
+
+    Must be called from inside a running event loop. The caller owns it and
+    closes it after the clients; timeouts stay per-client (per request).
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=ttl_dns_cache,
+        keepalive_timeout=keepalive_timeout,
+    )
+    return aiohttp.ClientSession(connector=connector)
 
 
 class AsyncBaseAPIClient:
     """Async base class for all IFDS API clients.
 
     Mirrors BaseAPIClient but uses aiohttp.ClientSession with:
-    - Per-provider asyncio.Semaphore for rate limiting
+    - Per-provider asyncio.BoundedSemaphore for rate limiting
     - Async retry with asyncio.sleep() backoff
-    - Lazy session creation (created on first request)
+    - Lazy session creation (created on first request), or an injected
+      session shared across providers — only an owned session is closed
     """
 
     def __init__(
@@ -28,20 +55,43 @@ class AsyncBaseAPIClient:
         provider_name: str = "unknown",
         semaphore: asyncio.Semaphore | None = None,
         circuit_breaker=None,
+        session: aiohttp.ClientSession | None = None,
+        pool_limit: int = POOL_LIMIT,
+        limit_per_host: int = POOL_LIMIT_PER_HOST,
+        ttl_dns_cache: int = 300,
+        connect_timeout: float = 5,
+        sock_read_timeout: float = 15,
     ):
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
-        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        # Per-request bounds so one stalled provider can't pin a semaphore slot
+        self._timeout = aiohttp.ClientTimeout(
+            total=timeout, connect=connect_timeout, sock_read=sock_read_timeout
+        )
         self._max_retries = max_retries
         self._provider = provider_name
-        self._semaphore = semaphore or asyncio.Semaphore(10)
+        self._semaphore = semaphore or asyncio.BoundedSemaphore(10)
         self._circuit_breaker = circuit_breaker
-        self._session: aiohttp.ClientSession | None = None
+        self._session: aiohttp.ClientSession | None = session
+        self._owns_session = session is None
+        # Connector tuning for the lazily-created (owned) session only
+        self._pool_limit = pool_limit
+        self._limit_per_host = limit_per_host
+        self._ttl_dns_cache = ttl_dns_cache
+        # Backoff sleep hook — tests swap in a no-op instead of patching asyncio
+        self._sleep = asyncio.sleep
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Lazily create aiohttp session on first use."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=self._ttl_dns_cache,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self._timeout)
+            self._owns_session = True
         return self._session
 
     async def _get(
@@ -56,10 +106,14 @@ class AsyncBaseAPIClient:
         """
         # Circuit breaker pre-check
         if self._circuit_breaker and not self._circuit_breaker.allow_request():
-            print(
-                f"  [CIRCUIT BREAKER] {self._provider} OPEN — skipping {endpoint}",
-                file=sys.stderr,
-            )
+            # Report once per OPEN episode, not once per refused call
+            if self._circuit_breaker.note_rejection() == 1:
+                state = self._circuit_breaker.state.value.upper()
+                print(
+                    f"  [CIRCUIT BREAKER] {self._provider} {state} — skipping {endpoint} "
+                    f"(further skips silent until the breaker changes state)",
+                    file=sys.stderr,
+                )
             return None
 
         url = f"{self._base_url}{endpoint}"
@@ -69,18 +123,19 @@ class AsyncBaseAPIClient:
         for attempt in range(1, self._max_retries + 1):
             try:
                 async with self._semaphore:
-                    async with session.get(url, params=params, headers=headers) as resp:
+                    async with session.get(
+                        url, params=params, headers=headers, timeout=self._timeout
+                    ) as resp:
                         if resp.status >= 400:
                             last_error = (
                                 f"HTTP {resp.status} (attempt {attempt}/{self._max_retries})"
                             )
-                            # Don't retry 4xx except 429
-                            if resp.status < 500 and resp.status != 429:
+                            if resp.status not in RETRIABLE_STATUSES:
                                 break
                         else:
                             if self._circuit_breaker:
                                 self._circuit_breaker.record_success()
-                            return await resp.json()
+                            return json_loads(await resp.read())
             except asyncio.TimeoutError:
                 last_error = f"Timeout (attempt {attempt}/{self._max_retries})"
             except aiohttp.ClientConnectionError:
@@ -89,7 +144,7 @@ class AsyncBaseAPIClient:
                 last_error = f"{type(e).__name__}: {e} (attempt {attempt}/{self._max_retries})"
 
             if attempt < self._max_retries:
-                await asyncio.sleep(1.0 * attempt)
+                await self._sleep(1.0 * attempt)
 
         # All retries exhausted — record failure
         if self._circuit_breaker:
@@ -116,6 +171,7 @@ class AsyncBaseAPIClient:
                         url,
                         params=self._health_check_params(),
                         headers=self._auth_headers(),
+                        timeout=self._timeout,
                     ) as resp:
                         elapsed_ms = (time.monotonic() - start) * 1000
 
@@ -130,7 +186,7 @@ class AsyncBaseAPIClient:
                             )
                         else:
                             error = f"HTTP {resp.status}"
-                            if resp.status < 500 and resp.status != 429:
+                            if resp.status not in RETRIABLE_STATUSES:
                                 return APIHealthResult(
                                     provider=self._provider,
                                     endpoint=endpoint,
@@ -149,7 +205,7 @@ class AsyncBaseAPIClient:
                 error = f"{type(e).__name__}: {e}"
 
             if attempt < self._max_retries:
-                await asyncio.sleep(1.0 * attempt)
+                await self._sleep(1.0 * attempt)
 
         elapsed_ms = (time.monotonic() - start) * 1000
         return APIHealthResult(
@@ -175,6 +231,8 @@ class AsyncBaseAPIClient:
         return self._provider
 
     async def close(self) -> None:
-        """Close the underlying aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the underlying aiohttp session (injected sessions are left open)."""
+        session = self._session
+        if session is None or session.closed or not self._owns_session:
+            return
+        await session.close()
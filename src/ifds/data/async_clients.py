@@ -14,6 +14,8 @@ from ifds.data.async_base import AsyncBaseAPIClient
 from ifds.models.market import APIHealthResult, APIStatus
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from ifds.data.cache import FileCache
 
 
@@ -28,6 +30,7 @@ class AsyncPolygonClient(AsyncBaseAPIClient):
         semaphore: asyncio.Semaphore | None = None,
         cache: FileCache | None = None,
         circuit_breaker=None,
+        session: aiohttp.ClientSession | None = None,
     ):
         super().__init__(
             base_url="https://api.polygon.io",
@@ -37,11 +40,14 @@ class AsyncPolygonClient(AsyncBaseAPIClient):
             provider_name="polygon",
             semaphore=semaphore,
             circuit_breaker=circuit_breaker,
+            session=session,
         )
         self._cache = cache
+        # Built once — _auth_headers() runs on every request
+        self._cached_auth = {"Authorization": f"Bearer {api_key}"}
 
     def _auth_headers(self) -> dict[str, str]:
-        return {"Authorization": f"Bearer {self._api_key}"}
+        return self._cached_auth
 
     def _health_check_params(self) -> dict[str, Any]:
         return {"adjusted": "true"}
@@ -114,6 +120,7 @@ class AsyncFMPClient(AsyncBaseAPIClient):
         semaphore: asyncio.Semaphore | None = None,
         cache: FileCache | None = None,
         circuit_breaker=None,
+        session: aiohttp.ClientSession | None = None,
     ):
         super().__init__(
             base_url="https://financialmodelingprep.com",
@@ -123,6 +130,7 @@ class AsyncFMPClient(AsyncBaseAPIClient):
             provider_name="fmp",
             semaphore=semaphore,
             circuit_breaker=circuit_breaker,
+            session=session,
         )
         self._cache = cache
 
@@ -271,6 +279,7 @@ class AsyncUWClient(AsyncBaseAPIClient):
         semaphore: asyncio.Semaphore | None = None,
         cache: FileCache | None = None,
         circuit_breaker=None,
+        session: aiohttp.ClientSession | None = None,
     ):
         super().__init__(
             base_url="https://api.unusualwhales.com",
@@ -280,18 +289,23 @@ class AsyncUWClient(AsyncBaseAPIClient):
             provider_name="unusual_whales",
             semaphore=semaphore,
             circuit_breaker=circuit_breaker,
+            session=session,
         )
         self._cache = cache
-
-    def _auth_headers(self) -> dict[str, str]:
-        if self._api_key:
-            return {
-                "Authorization": f"Bearer {self._api_key}",
+        # Built once — _auth_headers() runs on every request
+        self._cached_auth: dict[str, str] = (
+            {
+                "Authorization": f"Bearer {api_key}",
                 "UW-CLIENT-API-ID": "100001",
                 "User-Agent": "PythonClient",
                 "Accept": "application/json",
             }
-        return {}
+            if api_key
+            else {}
+        )
+
+    def _auth_headers(self) -> dict[str, str]:
+        return self._cached_auth
 
     async def check_health(self) -> APIHealthResult:
         if not self._api_key:
@@ -391,6 +405,7 @@ class AsyncFREDClient(AsyncBaseAPIClient):
         semaphore: asyncio.Semaphore | None = None,
         cache: FileCache | None = None,
         circuit_breaker=None,
+        session: aiohttp.ClientSession | None = None,
     ):
         super().__init__(
             base_url="https://api.stlouisfed.org",
@@ -400,6 +415,7 @@ class AsyncFREDClient(AsyncBaseAPIClient):
             provider_name="fred",
             semaphore=semaphore,
             circuit_breaker=circuit_breaker,
+            session=session,
         )
         self._cache = cache
 
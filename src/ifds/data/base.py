@@ -1,19 +1,61 @@
 """Base API client with retry logic and health check."""
 
+import functools
+import http.cookiejar
+import random
 import sys
 import time
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ifds.models.market import APIHealthResult, APIStatus
+from ifds.utils.io import json_loads
+
+# Transient HTTP statuses worth retrying; any other error status fails fast
+RETRIABLE_STATUSES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+# Sessions handed out by _shared_session, so close_shared_sessions() can close them
+_open_sessions: list[requests.Session] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_session(base_url: str, pool_maxsize: int) -> requests.Session:
+    """One pooled session per API host, reused by every client for that host.
+
+    The pool is sized for the threaded fan-outs (Phase 2 earnings runs 20
+    workers on one FMPClient) so connections are reused instead of discarded.
+    Adapter-level retries stay off — BaseAPIClient._get() owns retry. The
+    cookie jar refuses every cookie and clients only pass per-request
+    params/headers, so sharing leaks no auth state between clients.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    _open_sessions.append(session)
+    return session
+
+
+def close_shared_sessions() -> None:
+    """Close every pooled per-host session and forget it.
+
+    Clients created afterwards get a fresh session. Called at the end of a
+    pipeline run; tests use it to release connections between cases.
+    """
+    _shared_session.cache_clear()
+    while _open_sessions:
+        _open_sessions.pop().close()
 
 
 class BaseAPIClient:
     """Base class for all IFDS API clients.
 
     Provides:
-    - Retry logic with configurable attempts and timeout
+    - Retry logic with configurable attempts, timeout and decorrelated-jitter backoff
     - Health check endpoint testing
     - Common request handling
     """
@@ -26,6 +68,10 @@ class BaseAPIClient:
         max_retries: int = 3,
         provider_name: str = "unknown",
         circuit_breaker=None,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        pool_maxsize: int = 32,
     ):
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
@@ -33,7 +79,25 @@ class BaseAPIClient:
         self._max_retries = max_retries
         self._provider = provider_name
         self._circuit_breaker = circuit_breaker
-        self._session = requests.Session()
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        # Shared per (base_url, pool size): the runner builds a fresh client per
+        # phase, and a process-wide session keeps their TLS connections warm.
+        self._session = _shared_session(self._base_url, pool_maxsize)
+
+    def _backoff_delay(self, attempt: int, prev_delay: float) -> float:
+        """Next retry sleep — decorrelated jitter: uniform(base, prev*3), capped.
+
+        Randomising each client's schedule keeps concurrent clients that fail
+        together from retrying in lockstep against the same upstream. With
+        ``jitter=False`` the delay is plain exponential (base, 2x, 4x, ...).
+        """
+        if self._jitter:
+            delay = random.uniform(self._base_delay, prev_delay * 3)
+        else:
+            delay = self._base_delay * 2 ** (attempt - 1)
+        return min(self._max_delay, delay)
 
     def _get(
         self,
@@ -47,14 +111,19 @@ class BaseAPIClient:
         """
         # Circuit breaker pre-check
         if self._circuit_breaker and not self._circuit_breaker.allow_request():
-            print(
-                f"  [CIRCUIT BREAKER] {self._provider} OPEN — skipping {endpoint}",
-                file=sys.stderr,
-            )
+            # Report once per OPEN episode, not once per refused call
+            if self._circuit_breaker.note_rejection() == 1:
+                state = self._circuit_breaker.state.value.upper()
+                print(
+                    f"  [CIRCUIT BREAKER] {self._provider} {state} — skipping {endpoint} "
+                    f"(further skips silent until the breaker changes state)",
+                    file=sys.stderr,
+                )
             return None
 
         url = f"{self._base_url}{endpoint}"
         last_error = "Unknown error"
+        delay = self._base_delay
 
         for attempt in range(1, self._max_retries + 1):
             try:
@@ -67,7 +136,7 @@ class BaseAPIClient:
                 resp.raise_for_status()
                 if self._circuit_breaker:
                     self._circuit_breaker.record_success()
-                return resp.json()
+                return json_loads(resp.content)
             except requests.exceptions.Timeout:
                 last_error = (
                     f"Timeout after {self._timeout}s (attempt {attempt}/{self._max_retries})"
@@ -78,14 +147,19 @@ class BaseAPIClient:
                 last_error = (
                     f"HTTP {e.response.status_code} (attempt {attempt}/{self._max_retries})"
                 )
-                # Don't retry on 4xx client errors (except 429 rate limit)
-                if e.response.status_code < 500 and e.response.status_code != 429:
+                if e.response.status_code not in RETRIABLE_STATUSES:
                     break
             except Exception as e:
                 last_error = f"{type(e).__name__}: {e} (attempt {attempt}/{self._max_retries})"
 
             if attempt < self._max_retries:
-                time.sleep(1.0 * attempt)  # Simple linear backoff
+                # Provider tripped meanwhile (e.g. by sibling threads sharing
+                # this client) — stop retrying instead of sleeping into it.
+                # A read-only check: a HALF_OPEN probe already holds the permit.
+                if self._circuit_breaker and self._circuit_breaker.is_open():
+                    break
+                delay = self._backoff_delay(attempt, delay)
+                time.sleep(delay)
 
         # All retries exhausted — record failure
         if self._circuit_breaker:
@@ -110,6 +184,7 @@ class BaseAPIClient:
         start = time.monotonic()
         retries_used = 0
         error = "Unknown error"
+        delay = self._base_delay
 
         for attempt in range(1, self._max_retries + 1):
             retries_used = attempt - 1
@@ -133,7 +208,7 @@ class BaseAPIClient:
                     )
                 else:
                     error = f"HTTP {resp.status_code}"
-                    if resp.status_code < 500 and resp.status_code != 429:
+                    if resp.status_code not in RETRIABLE_STATUSES:
                         return APIHealthResult(
                             provider=self._provider,
                             endpoint=endpoint,
@@ -152,7 +227,8 @@ class BaseAPIClient:
                 error = f"{type(e).__name__}: {e}"
 
             if attempt < self._max_retries:
-                time.sleep(1.0 * attempt)
+                delay = self._backoff_delay(attempt, delay)
+                time.sleep(delay)
 
         elapsed_ms = (time.monotonic() - start) * 1000
         return APIHealthResult(
@@ -178,5 +254,9 @@ class BaseAPIClient:
         return self._provider
 
     def close(self) -> None:
-        """Close the underlying HTTP session."""
+        """Release this host's pooled connections.
+
+        The session object stays cached and usable (its pools refill on the
+        next request); close_shared_sessions() discards the sessions entirely.
+        """
         self._session.close()
@@ -1,7 +1,8 @@
 """Per-provider circuit breaker with sliding window error tracking."""
 
+import threading
 import time
-from collections import deque
+from collections.abc import Callable
 from enum import Enum
 
 
@@ -19,7 +20,8 @@ class ProviderCircuitBreaker:
     States:
         CLOSED   → normal, tracking errors
         OPEN     → halted, rejects all calls until cooldown expires
-        HALF_OPEN → allows 1 probe call to test recovery
+        HALF_OPEN → admits exactly 1 probe call; others are rejected until
+                    it is recorded (or stalls for a full cooldown)
 
     Usage:
         cb = ProviderCircuitBreaker("fmp", window_size=50, threshold=0.3)
@@ -37,14 +39,27 @@ class ProviderCircuitBreaker:
         window_size: int = 50,
         threshold: float = 0.3,
         cooldown_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
     ):
         self._provider = provider
+        self._clock = clock  # injectable so tests can advance time without sleeping
         self._window_size = window_size
         self._threshold = threshold
         self._cooldown = cooldown_seconds
-        self._results: deque[bool] = deque(maxlen=window_size)
+        # Ring buffer of outcomes (1 = failure) with a running failure count,
+        # so recording and error_rate are O(1) regardless of window size.
+        self._results = bytearray(window_size)
+        self._head = 0
+        self._filled = 0
+        self._failures = 0
         self._state = CBState.CLOSED
         self._opened_at: float = 0.0
+        # Guards transitions and ring writes only; reads of _state are a
+        # plain attribute load, so the CLOSED fast path never takes it.
+        self._lock = threading.Lock()
+        # monotonic start of the in-flight HALF_OPEN probe, 0.0 when free
+        self._probe_started: float = 0.0
+        self._rejections = 0  # calls refused since the last transition
 
     @property
     def provider(self) -> str:
@@ -53,50 +68,101 @@ class ProviderCircuitBreaker:
     @property
     def state(self) -> CBState:
         """Current state (auto-transitions OPEN → HALF_OPEN on cooldown expiry)."""
-        if self._state == CBState.OPEN:
-            if time.monotonic() - self._opened_at >= self._cooldown:
-                self._state = CBState.HALF_OPEN
-        return self._state
+        state = self._state
+        if state is CBState.OPEN and self._clock() - self._opened_at >= self._cooldown:
+            self._transition(CBState.OPEN, CBState.HALF_OPEN)
+            state = self._state
+        return state
 
     @property
     def error_rate(self) -> float:
         """Current error rate in the sliding window."""
-        if not self._results:
+        if not self._filled:
             return 0.0
-        errors = sum(1 for r in self._results if not r)
-        return errors / len(self._results)
+        return self._failures / self._filled
 
     @property
     def call_count(self) -> int:
         """Total calls in the sliding window."""
-        return len(self._results)
+        return self._filled
 
     def allow_request(self) -> bool:
         """Check if a request should be allowed."""
-        s = self.state
-        if s == CBState.CLOSED:
-            return True
-        if s == CBState.HALF_OPEN:
-            return True  # Allow probe
-        return False  # OPEN
+        if self._state is CBState.CLOSED:
+            return True  # Hot path: one attribute load, no lock
+        if self.state is CBState.OPEN:
+            return False
+        return self._acquire_probe()
+
+    def is_open(self) -> bool:
+        """Read-only OPEN check — unlike allow_request(), never takes the probe permit.
+
+        For mid-retry checks by a caller that already holds a permit.
+        """
+        return self.state is CBState.OPEN
 
     def record_success(self) -> None:
         """Record a successful API call."""
-        self._results.append(True)
-        if self._state == CBState.HALF_OPEN:
-            self._state = CBState.CLOSED
+        self._record(0)
+        if self._state is CBState.HALF_OPEN:
+            self._transition(CBState.HALF_OPEN, CBState.CLOSED)
 
     def record_failure(self) -> None:
         """Record a failed API call."""
-        self._results.append(False)
-        if self._state == CBState.HALF_OPEN:
-            self._state = CBState.OPEN
-            self._opened_at = time.monotonic()
-        elif self._state == CBState.CLOSED:
+        self._record(1)
+        state = self._state
+        if state is CBState.HALF_OPEN:
+            self._transition(CBState.HALF_OPEN, CBState.OPEN)
+        elif state is CBState.CLOSED:
             self._check_threshold()
 
+    def _record(self, failed: int) -> None:
+        """Overwrite the oldest slot and keep the failure count in step."""
+        with self._lock:
+            head = self._head
+            self._failures += failed - self._results[head]
+            self._results[head] = failed
+            self._head = (head + 1) % self._window_size
+            if self._filled < self._window_size:
+                self._filled += 1
+
+    def note_rejection(self) -> int:
+        """Count a refused call; returns its 1-based index in this OPEN episode.
+
+        Callers report only the first (== 1) so a breaker refusing thousands
+        of calls logs once per transition rather than once per call.
+        """
+        with self._lock:
+            self._rejections += 1
+            return self._rejections
+
+    def _acquire_probe(self) -> bool:
+        """Single-permit gate for HALF_OPEN so recovery is one call, not a burst."""
+        now = self._clock()
+        with self._lock:
+            if self._state is CBState.CLOSED:
+                return True
+            if self._state is not CBState.HALF_OPEN:
+                return False
+            # A probe whose outcome never got recorded must not wedge the breaker.
+            if self._probe_started and now - self._probe_started < self._cooldown:
+                return False
+            self._probe_started = now
+            return True
+
+    def _transition(self, expected: CBState, new: CBState) -> bool:
+        """Compare-and-set the state; only one racing thread wins a transition."""
+        with self._lock:
+            if self._state is not expected:
+                return False
+            self._state = new
+            self._probe_started = 0.0
+            self._rejections = 0
+            if new is CBState.OPEN:
+                self._opened_at = self._clock()
+            return True
+
     def _check_threshold(self) -> None:
         """Check if error rate exceeds threshold → transition to OPEN."""
-        if len(self._results) >= 10 and self.error_rate >= self._threshold:
-            self._state = CBState.OPEN
-            self._opened_at = time.monotonic()
+        if self._filled >= 10 and self.error_rate >= self._threshold:
+            self._transition(CBState.CLOSED, CBState.OPEN)
@@ -9,53 +9,81 @@ from pathlib import Path
 
 
 class SignalDedup:
-    """SHA256-based signal deduplication with 24h TTL.
+    """BLAKE2b-based signal deduplication with 24h TTL.
 
-    Hash: SHA256(f"{ticker}|{direction}|{date}")[:16]
-    State: state/signal_hashes.json (date-scoped, auto-cleanup)
+    Hash: BLAKE2b-64(f"{ticker}|{direction}|{date}") as 16 hex chars — an
+    idempotency key, not a security boundary, so no SHA256 is needed.
+    State: state/signal_hashes.json (date-scoped, auto-cleanup); held in
+    memory as 64-bit ints, persisted as a list of hex strings.
+
+    The trading day is fixed when the instance is created (one per Phase 6
+    run), so lookups, records and the saved file all agree on the date even
+    if a run straddles midnight, and the clock is not read per signal.
     """
 
     def __init__(self, state_file: str = "state/signal_hashes.json"):
         self._path = Path(state_file)
-        self._hashes: dict[str, str] = {}  # hash → ticker
+        self._today = date.today()
+        self._day = self._today.isoformat()
+        self._hashes: set[int] = set()
+        self._dirty = False  # unsaved record() calls since load/save
         self._load()
 
     def _load(self) -> None:
         """Load and cleanup expired hashes (only keep today's)."""
-        if not self._path.exists():
-            return
+        today = self._today
         try:
+            # Not modified today → cannot hold today's hashes; skip the parse.
+            # Files touched today still get the content date check below.
+            if date.fromtimestamp(self._path.stat().st_mtime) != today:
+                return
             with open(self._path) as f:
                 data = json.load(f)
         except (json.JSONDecodeError, OSError):
             return
 
-        today = date.today().isoformat()
-        if data.get("date") == today:
-            self._hashes = data.get("hashes", {})
+        if data.get("date") == self._day:
+            raw = data.get("hashes", ())
+            if isinstance(raw, dict):
+                # Pre-upgrade layout {sha256_prefix: ticker} — re-key for today
+                self._hashes = _parse_legacy_hashes(raw, self._day)
+            else:
+                self._hashes = _parse_hashes(raw)
 
     def is_duplicate(self, ticker: str, direction: str) -> bool:
         """Check if this signal was already generated today."""
-        h = self._compute_hash(ticker, direction)
-        return h in self._hashes
+        return self._compute_key(ticker, direction, self._day) in self._hashes
 
     def record(self, ticker: str, direction: str) -> None:
         """Record a signal hash."""
-        h = self._compute_hash(ticker, direction)
-        self._hashes[h] = ticker
+        key = self._compute_key(ticker, direction, self._day)
+        if key not in self._hashes:
+            self._hashes.add(key)
+            self._dirty = True
+
+    def save(self, durable: bool = False) -> None:
+        """Persist to disk (atomic write via tempfile + os.replace).
 
-    def save(self) -> None:
-        """Persist to disk (atomic write via tempfile + os.replace)."""
+        No-op when nothing was recorded since the last load/save, so callers
+        can save once per phase without rewriting an unchanged file.
+        ``durable=True`` fsyncs the temp file before the rename.
+        """
+        if not self._dirty:
+            return
         self._path.parent.mkdir(parents=True, exist_ok=True)
         data = {
-            "date": date.today().isoformat(),
-            "hashes": self._hashes,
+            "date": self._day,
+            "hashes": sorted(f"{h:016x}" for h in self._hashes),
         }
         fd, tmp = tempfile.mkstemp(dir=str(self._path.parent), suffix=".tmp")
         try:
             with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2)
+                json.dump(data, f, separators=(",", ":"))
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp, str(self._path))
+            self._dirty = False
         except Exception:
             try:
                 os.unlink(tmp)
@@ -63,14 +91,63 @@ class SignalDedup:
                 pass
             raise
 
+    @staticmethod
+    def _compute_key(ticker: str, direction: str, day: str | None = None) -> int:
+        """BLAKE2b-64(ticker|direction|date) as an int; ``day`` defaults to today."""
+        if day is None:
+            day = date.today().isoformat()
+        raw = f"{ticker}|{direction}|{day}"
+        return int.from_bytes(hashlib.blake2b(raw.encode(), digest_size=8).digest(), "big")
+
     @staticmethod
     def _compute_hash(ticker: str, direction: str) -> str:
-        """SHA256(ticker|direction|date)[:16]."""
-        today = date.today().isoformat()
-        raw = f"{ticker}|{direction}|{today}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+        """BLAKE2b-64(ticker|direction|date) as 16 hex chars."""
+        return f"{SignalDedup._compute_key(ticker, direction):016x}"
 
     @property
     def count(self) -> int:
         """Number of recorded hashes."""
         return len(self._hashes)
+
+
+# Directions Phase 6 records signals under (LONG → BUY, SHORT → SELL_SHORT)
+_DIRECTIONS = ("BUY", "SELL_SHORT")
+
+
+def _parse_hashes(raw) -> set[int]:
+    """Hex hash strings → set of ints; junk skipped.
+
+    Validation is an int(h, 16) round trip in C: anything that does not
+    format back to the same 16 lowercase hex chars ("0x…", "_" separators,
+    short keys) is not one of our hashes.
+    """
+    hashes: set[int] = set()
+    for h in raw:
+        try:
+            value = int(h, 16)
+        except (TypeError, ValueError):
+            continue
+        if f"{value:016x}" == h:
+            hashes.add(value)
+    return hashes
+
+
+def _parse_legacy_hashes(raw: dict, day: str) -> set[int]:
+    """Pre-upgrade ``{hash: ticker}`` state → current BLAKE2b keys.
+
+    The old key was SHA256(ticker|direction|date)[:16], which can never equal
+    a BLAKE2b key. The file kept the ticker, so each entry is recomputed for
+    the Phase 6 directions; an entry matching the old (or current) key for a
+    direction is carried over as that signal's current key, so a deploy
+    mid-day does not re-emit signals recorded earlier that day.
+    """
+    hashes: set[int] = set()
+    for h, ticker in raw.items():
+        if not isinstance(ticker, str):
+            continue
+        for direction in _DIRECTIONS:
+            key = SignalDedup._compute_key(ticker, direction, day)
+            raw_key = f"{ticker}|{direction}|{day}".encode()
+            if h in (hashlib.sha256(raw_key).hexdigest()[:16], f"{key:016x}"):
+                hashes.add(key)
+    return hashes
@@ -49,6 +49,37 @@ class EventLogger:
             data: Additional structured data.
             message: Human-readable message.
         """
+        event = self._build_event(event_type, severity, phase, ticker, data, message)
+        self._events.append(event)
+        self._write_event(event)
+
+    def log_batch(self, entries: list[dict[str, Any]]) -> None:
+        """Log several events with a single file write + flush.
+
+        Each entry holds the keyword arguments of ``log()`` (``event_type``
+        required). For loops that emit one event per ticker — the per-event
+        flush of ``log()`` is a syscall each.
+        """
+        if not entries:
+            return
+        events = [self._build_event(**entry) for entry in entries]
+        self._events.extend(events)
+        self._file_handle.write(
+            "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        )
+        self._file_handle.flush()
+        for event in events:
+            self._echo_event(event)
+
+    def _build_event(
+        self,
+        event_type: EventType,
+        severity: Severity = Severity.INFO,
+        phase: int | None = None,
+        ticker: str | None = None,
+        data: dict[str, Any] | None = None,
+        message: str = "",
+    ) -> dict:
         event = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "run_id": self._run_id,
@@ -66,8 +97,7 @@ class EventLogger:
         if data:
             event["data"] = data
 
-        self._events.append(event)
-        self._write_event(event)
+        return event
 
     def phase_start(self, phase: int, name: str, input_count: int | None = None) -> None:
         """Log the start of a pipeline phase."""
@@ -163,8 +193,11 @@ class EventLogger:
         line = json.dumps(event, ensure_ascii=False)
         self._file_handle.write(line + "\n")
         self._file_handle.flush()
+        self._echo_event(event)
 
-        # Only print ERROR and CRITICAL to stderr — rest goes to JSONL only
+    @staticmethod
+    def _echo_event(event: dict) -> None:
+        """Print ERROR and CRITICAL events to stderr — rest goes to JSONL only."""
         severity = event["severity"]
         if severity in ("error", "critical"):
             prefix = f"[{severity}]"
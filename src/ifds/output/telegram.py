@@ -16,9 +16,15 @@ except ImportError:
     from backports.zoneinfo import ZoneInfo  # type: ignore[no-redef]
 
 import requests
+from requests.adapters import HTTPAdapter
 
 _CET = ZoneInfo("Europe/Budapest")
 
+# Keep-alive session for api.telegram.org: multi-part reports (and the
+# runner's status pings) reuse one TLS connection instead of a handshake each.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 from ifds.config.loader import Config
 from ifds.events.logger import EventLogger
 from ifds.events.types import EventType, Severity
@@ -42,6 +48,18 @@ _BREADTH_SHORT = {
     "CONSOLIDATING": "CONSOL",
 }
 
+# MMS regime abbreviations for the execution table
+_MMS_SHORT = {
+    "gamma_positive": "G+",
+    "gamma_negative": "G-",
+    "dark_dominant": "DD",
+    "absorption": "ABS",
+    "distribution": "DST",
+    "neutral": "NEU",
+    "undetermined": "UND",
+    "volatile": "VOL",
+}
+
 
 def send_daily_report(
     ctx: PipelineContext, config: Config, logger: EventLogger, duration: float, fmp=None
@@ -240,9 +258,9 @@ def _format_success(
     lines_04 = _format_phases_0_to_4(ctx, duration, config)
     lines_56 = _format_phases_5_to_6(ctx, config, fmp=fmp)
 
-    full = lines_04 + "\n" + lines_56
-    if len(full) <= _MAX_MSG_LEN:
-        return full, ""
+    # Size check on the parts, so the joined copy is only built when it is sent
+    if len(lines_04) + 1 + len(lines_56) <= _MAX_MSG_LEN:
+        return lines_04 + "\n" + lines_56, ""
 
     # Split: Phase 0-4 in first message, Phase 5-6 in second
     return lines_04, lines_56
@@ -535,18 +553,6 @@ def _format_exec_table(
         header = base_header
     rows.append(header)
 
-    # MMS regime abbreviations
-    _MMS_SHORT = {
-        "gamma_positive": "G+",
-        "gamma_negative": "G-",
-        "dark_dominant": "DD",
-        "absorption": "ABS",
-        "distribution": "DST",
-        "neutral": "NEU",
-        "undetermined": "UND",
-        "volatile": "VOL",
-    }
-
     for p in positions:
         mms_str = _MMS_SHORT.get(p.mm_regime, p.mm_regime[:3].upper() if p.mm_regime else "---")
         row = (
@@ -584,6 +590,6 @@ def _send_message(token: str, chat_id: str, text: str, timeout: int = 5) -> bool
         "text": text,
         "parse_mode": "HTML",
     }
-    resp = requests.post(url, json=payload, timeout=timeout)
+    resp = _SESSION.post(url, json=payload, timeout=timeout)
     resp.raise_for_status()
     return True
@@ -20,8 +20,8 @@ SEC Filing Exclusion (Fázis 1, 2026-05-16):
 - Plugs the AGNC-style hole where FMP's earnings_calendar misses the SEC filing event.
 """
 
-import json
 import os
+import re
 import time
 from datetime import date, timedelta
 from pathlib import Path
@@ -32,6 +32,10 @@ from ifds.data.sec_edgar import SecEdgarClient
 from ifds.events.logger import EventLogger
 from ifds.events.types import EventType, Severity
 from ifds.models.market import Phase2Result, StrategyMode, Ticker
+from ifds.utils.io import json_dumps, json_loads
+
+# Universe snapshot files are named YYYY-MM-DD.json; ISO dates sort chronologically
+_SNAPSHOT_NAME = re.compile(r"\d{4}-\d{2}-\d{2}\.json")
 
 
 def run_phase2(
@@ -370,18 +374,22 @@ def _exclude_earnings(
     # Pass 1 filter
     filtered = []
     excluded = []
+    exclusion_events = []
     for ticker in tickers:
         if ticker.symbol.upper() in bulk_earnings_symbols:
             excluded.append(ticker.symbol)
-            logger.log(
-                EventType.EARNINGS_EXCLUSION,
-                Severity.DEBUG,
-                phase=2,
-                ticker=ticker.symbol,
-                message=f"{ticker.symbol} excluded: earnings within {exclusion_days} days (bulk calendar)",
+            exclusion_events.append(
+                {
+                    "event_type": EventType.EARNINGS_EXCLUSION,
+                    "severity": Severity.DEBUG,
+                    "phase": 2,
+                    "ticker": ticker.symbol,
+                    "message": f"{ticker.symbol} excluded: earnings within {exclusion_days} days (bulk calendar)",
+                }
             )
         else:
             filtered.append(ticker)
+    logger.log_batch(exclusion_events)
 
     bulk_excluded_count = len(excluded)
 
@@ -556,19 +564,23 @@ def _save_universe_snapshot(tickers: list[Ticker], config: Config, logger: Event
         ]
 
         # Save today's snapshot
-        snap_path = os.path.join(snap_dir, f"{today}.json")
-        with open(snap_path, "w") as f:
-            json.dump(snapshot, f)
+        today_name = f"{today}.json"
+        snap_path = os.path.join(snap_dir, today_name)
+        with open(snap_path, "wb") as f:
+            f.write(json_dumps(snapshot))
 
-        # Compare with most recent previous snapshot
-        existing = sorted(
-            [fn for fn in os.listdir(snap_dir) if fn.endswith(".json") and fn != f"{today}.json"],
-            reverse=True,
+        # One directory listing serves both the diff and the prune, newest
+        # first; stray JSON files in the directory are neither diffed nor pruned.
+        all_snaps = sorted(
+            (fn for fn in os.listdir(snap_dir) if _SNAPSHOT_NAME.fullmatch(fn)), reverse=True
         )
+
+        # Compare with most recent previous snapshot
+        existing = [fn for fn in all_snaps if fn != today_name]
         if existing:
             prev_path = os.path.join(snap_dir, existing[0])
-            with open(prev_path) as f:
-                prev_data = json.load(f)
+            with open(prev_path, "rb") as f:
+                prev_data = json_loads(f.read())
             prev_symbols = {r["symbol"] for r in prev_data}
             curr_symbols = {t.symbol for t in tickers}
 
@@ -600,10 +612,6 @@ def _save_universe_snapshot(tickers: list[Ticker], config: Config, logger: Event
                 )
 
         # Prune old snapshots beyond max
-        all_snaps = sorted(
-            [fn for fn in os.listdir(snap_dir) if fn.endswith(".json")],
-            reverse=True,
-        )
         for old in all_snaps[max_snaps:]:
             os.remove(os.path.join(snap_dir, old))
 
@@ -396,33 +396,23 @@ def _build_ticker_close_history(
     # grouped_daily_bars is a list of dicts, each representing one day's data
     # Each day dict has ticker keys with bar data (o, h, l, c, v, etc.)
     # Also has metadata keys like _buy_count, _sell_count, _ticker_count
-    histories: dict[str, list[float | None]] = {t: [] for t in tickers}
+    # One close list per ticker; days without a close for it are skipped.
+    histories: dict[str, list[float]] = {t: [] for t in tickers}
 
     for day in grouped_daily_bars:
-        day_tickers = set()
         # Extract closes from the day's bars (Phase 1 uses "bars" key)
         bars = day.get("bars", day.get("results", []))
         day_map: dict[str, float] = {}
         for bar in bars:
             t = bar.get("T", "")
-            if t in tickers:
+            if t in histories:
                 day_map[t] = bar.get("c", 0.0)
-                day_tickers.add(t)
+        for t, close in day_map.items():
+            if close is not None:
+                histories[t].append(close)
 
-        for t in tickers:
-            if t in day_map:
-                histories[t].append(day_map[t])
-            else:
-                histories[t].append(None)
-
-    # Filter: only keep tickers with ≥20 non-None values
-    result: dict[str, list[float]] = {}
-    for t, vals in histories.items():
-        clean = [v for v in vals if v is not None]
-        if len(clean) >= 20:
-            result[t] = clean
-
-    return result
+    # Filter: only keep tickers with ≥20 data points
+    return {t: closes for t, closes in histories.items() if len(closes) >= 20}
 
 
 def _calculate_breadth(
@@ -432,24 +422,26 @@ def _calculate_breadth(
     periods = config.core.get("breadth_sma_periods", [20, 50, 200])
     weights = config.core.get("breadth_composite_weights", (0.20, 0.50, 0.30))
 
-    pct_above = {}
-    total_with_data = 0
-
-    for period in periods:
-        above = 0
-        counted = 0
-        for ticker in holdings:
-            hist = ticker_histories.get(ticker)
-            if hist is None or len(hist) < period:
-                continue
-            counted += 1
+    # Holdings outer, periods inner: each history is looked up once
+    above = [0] * len(periods)
+    counted = [0] * len(periods)
+    for ticker in holdings:
+        hist = ticker_histories.get(ticker)
+        if not hist:
+            continue
+        last = hist[-1]
+        for i, period in enumerate(periods):
             sma = _compute_sma(hist, period)
-            if sma is not None and hist[-1] > sma:
-                above += 1
-        pct = (above / counted * 100) if counted > 0 else 0.0
-        pct_above[period] = pct
-        if period == periods[0]:
-            total_with_data = counted
+            if sma is None:
+                continue
+            counted[i] += 1
+            if last > sma:
+                above[i] += 1
+
+    pct_above = {}
+    for i, period in enumerate(periods):
+        pct_above[period] = (above[i] / counted[i] * 100) if counted[i] > 0 else 0.0
+    total_with_data = counted[0] if periods else 0
 
     pct_20 = pct_above.get(periods[0], 0.0) if len(periods) > 0 else 0.0
     pct_50 = pct_above.get(periods[1], 0.0) if len(periods) > 1 else 0.0
@@ -480,10 +472,11 @@ def _compute_pct_above_sma_n_days_ago(
         hist = ticker_histories.get(ticker)
         if hist is None or len(hist) < period + days_ago:
             continue
-        sliced = hist[:-days_ago] if days_ago > 0 else hist
+        # Window ending `days_ago` bars back, without copying the whole history
+        end = len(hist) - days_ago
         counted += 1
-        sma = _compute_sma(sliced, period)
-        if sma is not None and sliced[-1] > sma:
+        sma = _compute_sma(hist[end - period : end], period)
+        if sma is not None and hist[end - 1] > sma:
             above += 1
     if counted == 0:
         return None
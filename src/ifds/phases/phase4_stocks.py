@@ -15,6 +15,7 @@ import asyncio
 import time
 from datetime import date, timedelta
 from pathlib import Path
+from typing import NamedTuple
 
 from ifds.config.loader import Config
 from ifds.data.adapters import DarkPoolProvider
@@ -551,6 +552,21 @@ def _calculate_sma(values: list[float], period: int) -> float:
     return sum(values[-period:]) / period
 
 
+class _SMAs(NamedTuple):
+    sma_20: float
+    sma_50: float
+    sma_200: float
+
+
+def _compute_smas(closes: list[float], config: Config) -> _SMAs:
+    """Short/mid/long SMAs of one ticker's closes, computed together."""
+    return _SMAs(
+        sma_20=_calculate_sma(closes, config.core["sma_short_period"]),
+        sma_50=_calculate_sma(closes, config.core["sma_mid_period"]),
+        sma_200=_calculate_sma(closes, config.core["sma_long_period"]),
+    )
+
+
 def _calculate_rsi(bars: list[dict], period: int = 14) -> float:
     """Calculate RSI (Relative Strength Index).
 
@@ -560,7 +576,8 @@ def _calculate_rsi(bars: list[dict], period: int = 14) -> float:
     if len(bars) < period + 1:
         return 50.0  # Neutral if insufficient data
 
-    closes = [b["c"] for b in bars]
+    # Only the last `period` changes are averaged — walk just that window
+    closes = [b["c"] for b in bars[-(period + 1) :]]
     gains = []
     losses = []
 
@@ -569,11 +586,8 @@ def _calculate_rsi(bars: list[dict], period: int = 14) -> float:
         gains.append(max(change, 0))
         losses.append(max(-change, 0))
 
-    if len(gains) < period:
-        return 50.0
-
-    avg_gain = sum(gains[-period:]) / period
-    avg_loss = sum(losses[-period:]) / period
+    avg_gain = sum(gains) / period
+    avg_loss = sum(losses) / period
 
     if avg_loss == 0:
         return 100.0 if avg_gain > 0 else 50.0
@@ -591,8 +605,9 @@ def _calculate_atr(bars: list[dict], period: int = 14) -> float:
     if len(bars) < 2:
         return 0.0
 
+    # Only the last `period` true ranges are averaged — walk just that window
     true_ranges = []
-    for i in range(1, len(bars)):
+    for i in range(max(1, len(bars) - period), len(bars)):
         high = bars[i]["h"]
         low = bars[i]["l"]
         close_prev = bars[i - 1]["c"]
@@ -604,11 +619,9 @@ def _calculate_atr(bars: list[dict], period: int = 14) -> float:
         )
         true_ranges.append(tr)
 
-    if not true_ranges:
-        return 0.0
     if len(true_ranges) < period:
         return sum(true_ranges) / len(true_ranges)
-    return sum(true_ranges[-period:]) / period
+    return sum(true_ranges) / period
 
 
 def _check_trend_filter(price: float, sma_200: float, strategy_mode: StrategyMode) -> bool:
@@ -645,12 +658,12 @@ def _analyze_technical(
     spy_3m_return: float | None = None,
 ) -> TechnicalAnalysis:
     """Analyze all technical indicators for a ticker."""
-    closes = [b["c"] for b in bars]
+    # Longest lookback is SMA200 (or the 63-bar RS window) — skip older bars
+    lookback = max(config.core["sma_long_period"], 63)
+    closes = [b["c"] for b in bars[-lookback:]]
     current_price = closes[-1]
 
-    sma_200 = _calculate_sma(closes, config.core["sma_long_period"])
-    sma_20 = _calculate_sma(closes, config.core["sma_short_period"])
-    sma_50 = _calculate_sma(closes, config.core["sma_mid_period"])
+    sma_20, sma_50, sma_200 = _compute_smas(closes, config)
     rsi_14 = _calculate_rsi(bars, config.core["rsi_period"])
     atr_14 = _calculate_atr(bars, config.core["atr_period"])
 
@@ -715,6 +728,48 @@ def _analyze_flow(
     return _analyze_flow_from_data(ticker, bars, dp_data, config, options_data=options_data)
 
 
+_MIN_FLOW_BARS = 5
+
+
+def _tally_option_volumes(
+    options_data: list[dict], current_price: float, max_dte: int
+) -> tuple[int, int, int, int]:
+    """Sum call, put and OTM-call volume over contracts within ``max_dte``.
+
+    One pass with no intermediate list; ``max_dte <= 0`` counts every
+    contract. Returns ``(call_vol, put_vol, otm_call_vol, n_contracts)``.
+    """
+    today = date.today()
+    fromisoformat = date.fromisoformat
+    # A chain has thousands of contracts but only a few dozen expiries
+    beyond_dte: dict[str, bool] = {}
+    call_vol = put_vol = otm_call_vol = n_contracts = 0
+    for opt in options_data:
+        details = opt.get("details", {})
+        if max_dte > 0:
+            exp_str = details.get("expiration_date")
+            if exp_str:
+                skip = beyond_dte.get(exp_str)
+                if skip is None:
+                    try:
+                        skip = (fromisoformat(exp_str) - today).days > max_dte
+                    except ValueError:
+                        skip = False
+                    beyond_dte[exp_str] = skip
+                if skip:
+                    continue
+        n_contracts += 1
+        ctype = details.get("contract_type", "").lower()
+        vol = opt.get("day", {}).get("volume", 0) or 0
+        if ctype == "call":
+            call_vol += vol
+            if details.get("strike_price", 0) > current_price:
+                otm_call_vol += vol
+        elif ctype == "put":
+            put_vol += vol
+    return call_vol, put_vol, otm_call_vol, n_contracts
+
+
 def _analyze_flow_from_data(
     ticker: str,
     bars: list[dict],
@@ -723,14 +778,21 @@ def _analyze_flow_from_data(
     options_data: list[dict] | None = None,
 ) -> FlowAnalysis:
     """Analyze flow metrics from pre-fetched data (no API calls)."""
-    # RVOL
-    volumes = [b["v"] for b in bars]
+    # Halted / newly listed symbols: too little history for RVOL or spread
+    # ratios — neutral flow instead of scoring noise (or IndexError on []).
+    if len(bars) < _MIN_FLOW_BARS:
+        return FlowAnalysis()
+
+    tuning = config.tuning  # ~20 threshold reads below; resolve the section once
+    # RVOL (only the SMA window's tail is read)
+    sma_short = config.core["sma_short_period"]
+    volumes = [b["v"] for b in bars[-sma_short:]]
     volume_today = volumes[-1]
-    volume_sma_20 = _calculate_sma(volumes, config.core["sma_short_period"])
+    volume_sma_20 = _calculate_sma(volumes, sma_short)
     rvol = volume_today / volume_sma_20 if volume_sma_20 > 0 else 1.0
 
     # Spread analysis
-    spreads = [b["h"] - b["l"] for b in bars]
+    spreads = [b["h"] - b["l"] for b in bars[-10:]]
     spread_today = spreads[-1]
     spread_sma_10 = _calculate_sma(spreads, 10)
     spread_ratio = spread_today / spread_sma_10 if spread_sma_10 > 0 else 1.0
@@ -740,10 +802,9 @@ def _analyze_flow_from_data(
 
     # Squat bar detection
     squat = (
-        rvol > config.tuning["squat_bar_rvol_min"]
-        and spread_ratio < config.tuning["squat_bar_spread_ratio_max"]
+        rvol > tuning["squat_bar_rvol_min"] and spread_ratio < tuning["squat_bar_spread_ratio_max"]
     )
-    squat_bonus = config.tuning["squat_bar_bonus"] if squat else 0
+    squat_bonus = tuning["squat_bar_bonus"] if squat else 0
 
     # Dark pool — recalculate dp_pct using Polygon daily volume
     dp_pct = 0.0
@@ -756,7 +817,7 @@ def _analyze_flow_from_data(
         if daily_volume > 0 and dp_volume > 0:
             dp_pct = round((dp_volume / daily_volume) * 100, 2)
 
-        threshold = config.tuning["dark_pool_volume_threshold_pct"]
+        threshold = tuning["dark_pool_volume_threshold_pct"]
         if dp_pct > threshold:
             raw_signal = dp_data.get("signal", "")
             if raw_signal == "BULLISH":
@@ -771,12 +832,12 @@ def _analyze_flow_from_data(
         # (now negative); dp_pct ≥ dp_high → high_bonus (now negative).
         # 2026-05-26 (Day 63 §3.2): gated by uw_dark_pool_scoring_enabled.
         # When disabled the raw dp_pct is still captured by the UW shadow log.
-        if config.tuning.get("uw_dark_pool_scoring_enabled", True):
-            dp_high = config.tuning["dp_pct_high_threshold"]
+        if tuning.get("uw_dark_pool_scoring_enabled", True):
+            dp_high = tuning["dp_pct_high_threshold"]
             if dp_pct >= dp_high:
-                dp_pct_score = config.tuning["dp_pct_high_bonus"]
+                dp_pct_score = tuning["dp_pct_high_bonus"]
             elif dp_pct >= threshold:
-                dp_pct_score = config.tuning["dp_pct_bonus"]
+                dp_pct_score = tuning["dp_pct_bonus"]
 
     # Buy Pressure + VWAP
     last_bar = bars[-1]
@@ -796,19 +857,19 @@ def _analyze_flow_from_data(
     if bar_range > 0:
         buy_pos = (close - low) / bar_range
         if buy_pos > 0.7:
-            buy_pressure_score += config.tuning["buy_pressure_strong_bonus"]
+            buy_pressure_score += tuning["buy_pressure_strong_bonus"]
         elif buy_pos < 0.3:
-            buy_pressure_score += config.tuning["buy_pressure_weak_penalty"]
+            buy_pressure_score += tuning["buy_pressure_weak_penalty"]
 
     # VWAP accumulation signal
     if vwap > 0:
         if close > vwap:
-            buy_pressure_score += config.tuning["vwap_accumulation_bonus"]
+            buy_pressure_score += tuning["vwap_accumulation_bonus"]
             # Strong accumulation: > 1% above VWAP
             if (close - vwap) / vwap > 0.01:
                 buy_pressure_score += 5
         elif close < vwap:
-            buy_pressure_score += config.tuning["vwap_distribution_penalty"]
+            buy_pressure_score += tuning["vwap_distribution_penalty"]
 
     # Options flow scoring (PCR, OTM call ratio)
     pcr = None
@@ -817,58 +878,33 @@ def _analyze_flow_from_data(
     otm_score = 0
     if options_data:
         # Front-month DTE filter with <5 contract fallback
-        max_dte = config.tuning.get("gex_max_dte", 90)
-        from datetime import date as _date
-
-        today = _date.today()
-        filtered_opts = []
-        if max_dte > 0:
-            for opt in options_data:
-                exp_str = opt.get("details", {}).get("expiration_date")
-                if exp_str:
-                    try:
-                        exp_date = _date.fromisoformat(exp_str)
-                        if (exp_date - today).days > max_dte:
-                            continue
-                    except ValueError:
-                        pass
-                filtered_opts.append(opt)
-            if len(filtered_opts) < 5:
-                filtered_opts = list(options_data)  # Fallback: use all
-        else:
-            filtered_opts = list(options_data)
-
+        max_dte = tuning.get("gex_max_dte", 90)
         current_price = bars[-1]["c"]
-        call_vol = put_vol = otm_call_vol = 0
-        for opt in filtered_opts:
-            details = opt.get("details", {})
-            day_data = opt.get("day", {})
-            ctype = details.get("contract_type", "").lower()
-            strike = details.get("strike_price", 0)
-            vol = day_data.get("volume", 0) or 0
-            if ctype == "call":
-                call_vol += vol
-                if strike > current_price:
-                    otm_call_vol += vol
-            elif ctype == "put":
-                put_vol += vol
+        call_vol, put_vol, otm_call_vol, n_used = _tally_option_volumes(
+            options_data, current_price, max_dte
+        )
+        if n_used < 5 and max_dte > 0:
+            # Fallback: use all
+            call_vol, put_vol, otm_call_vol, _ = _tally_option_volumes(
+                options_data, current_price, 0
+            )
         if call_vol > 0:
             pcr = round(put_vol / call_vol, 3)
-            if pcr < config.tuning["pcr_bullish_threshold"]:
-                pcr_score = config.tuning["pcr_bullish_bonus"]
-            elif pcr > config.tuning["pcr_bearish_threshold"]:
-                pcr_score = config.tuning["pcr_bearish_penalty"]
+            if pcr < tuning["pcr_bullish_threshold"]:
+                pcr_score = tuning["pcr_bullish_bonus"]
+            elif pcr > tuning["pcr_bearish_threshold"]:
+                pcr_score = tuning["pcr_bearish_penalty"]
             otm_call_ratio = round(otm_call_vol / call_vol, 3)
-            if otm_call_ratio > config.tuning["otm_call_ratio_threshold"]:
-                otm_score = config.tuning["otm_call_bonus"]
+            if otm_call_ratio > tuning["otm_call_ratio_threshold"]:
+                otm_score = tuning["otm_call_bonus"]
 
     # Block trade scoring from DP data
     block_trade_count = dp_data.get("block_trade_count", 0) if dp_data else 0
     block_trade_score = 0
-    if block_trade_count > config.tuning["block_trade_very_high"]:
-        block_trade_score = config.tuning["block_trade_very_high_bonus"]
-    elif block_trade_count > config.tuning["block_trade_significant"]:
-        block_trade_score = config.tuning["block_trade_significant_bonus"]
+    if block_trade_count > tuning["block_trade_very_high"]:
+        block_trade_score = tuning["block_trade_very_high_bonus"]
+    elif block_trade_count > tuning["block_trade_significant"]:
+        block_trade_score = tuning["block_trade_significant_bonus"]
 
     return FlowAnalysis(
         volume_today=volume_today,
@@ -1291,6 +1327,7 @@ async def _run_phase4_async(
     strategy_mode: StrategyMode,
 ) -> Phase4Result:
     """Async Phase 4: process tickers concurrently with semaphore rate limiting."""
+    from ifds.data.async_base import create_shared_session
     from ifds.data.async_clients import AsyncPolygonClient, AsyncFMPClient, AsyncUWClient
     from ifds.data.async_adapters import AsyncUWDarkPoolProvider
 
@@ -1302,17 +1339,21 @@ async def _run_phase4_async(
     sem_fmp = asyncio.Semaphore(config.runtime.get("async_sem_fmp", 8))
     sem_uw = asyncio.Semaphore(config.runtime.get("async_sem_uw", 5))
 
+    # One pooled session for every provider — keep-alive reuse across hosts
+    shared_session = create_shared_session()
     polygon = AsyncPolygonClient(
         api_key=config.get_api_key("polygon"),
         timeout=config.runtime["api_timeout_polygon"],
         max_retries=config.runtime["api_max_retries"],
         semaphore=sem_polygon,
+        session=shared_session,
     )
     fmp = AsyncFMPClient(
         api_key=config.get_api_key("fmp"),
         timeout=config.runtime["api_timeout_fmp"],
         max_retries=config.runtime["api_max_retries"],
         semaphore=sem_fmp,
+        session=shared_session,
     )
 
     # Dark Pool: per-ticker fetch (async). See sync runner.py for rationale.
@@ -1325,6 +1366,7 @@ async def _run_phase4_async(
             timeout=config.runtime["api_timeout_uw"],
             max_retries=config.runtime["api_max_retries"],
             semaphore=sem_uw,
+            session=shared_session,
         )
         dp_provider = AsyncUWDarkPoolProvider(uw_client)
 
@@ -1346,8 +1388,6 @@ async def _run_phase4_async(
         spy_closes = [b["c"] for b in spy_bars]
         spy_3m_return = (spy_closes[-1] - spy_closes[-63]) / spy_closes[-63]
 
-    analyzed = []
-    passed = []
     tech_filter_count = 0
     min_score_count = 0
     clipped_count = 0
@@ -1519,72 +1559,86 @@ async def _run_phase4_async(
                 contradiction_detail=dict(contradiction.detail),
             )
 
-    try:
-        tasks = [process_ticker(t) for t in tickers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
-                continue
-            if result is None:
-                continue
+    async def process_indexed(i: int, ticker_obj: Ticker):
+        try:
+            return i, await process_ticker(ticker_obj)
+        except Exception as e:
+            return i, e
 
-            analyzed.append(result)
+    try:
+        # Book-keep each ticker as it lands (as_completed) instead of waiting
+        # for the slowest; slots restore input order so output is stable.
+        analyzed_slots: list[StockAnalysis | None] = [None] * len(tickers)
+        passed_slots: list[StockAnalysis | None] = [None] * len(tickers)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(process_indexed(i, t)) for i, t in enumerate(tickers)]
+
+            for next_done in asyncio.as_completed(tasks):
+                i, result = await next_done
+                if isinstance(result, BaseException):
+                    continue
+                if result is None:
+                    continue
+
+                analyzed_slots[i] = result
+
+                if result.excluded and result.exclusion_reason == "tech_filter":
+                    tech_filter_count += 1
+                    logger.log(
+                        EventType.TICKER_FILTERED,
+                        Severity.DEBUG,
+                        phase=4,
+                        message=f"{result.ticker} failed SMA200 trend filter",
+                        data={"ticker": result.ticker, "reason": "tech_filter"},
+                    )
+                elif result.excluded and result.exclusion_reason == "danger_zone":
+                    danger_zone_count += 1
+                    logger.log(
+                        EventType.TICKER_FILTERED,
+                        Severity.INFO,
+                        phase=4,
+                        message=f"{result.ticker} filtered: danger zone "
+                        f"(D/E={result.fundamental.debt_equity}, "
+                        f"margin={result.fundamental.net_margin}, "
+                        f"IC={result.fundamental.interest_coverage})",
+                        data={"ticker": result.ticker, "reason": "danger_zone"},
+                    )
+                elif result.combined_score > clipping_threshold:
+                    result.excluded = True
+                    result.exclusion_reason = "clipping"
+                    clipped_count += 1
+                    logger.log(
+                        EventType.CLIPPING_SKIP,
+                        Severity.INFO,
+                        phase=4,
+                        ticker=result.ticker,
+                        message=f"{result.ticker} score {result.combined_score:.1f} — crowded trade (skipping)",
+                        data={"ticker": result.ticker, "score": result.combined_score},
+                    )
+                elif result.combined_score < min_score:
+                    result.excluded = True
+                    result.exclusion_reason = "min_score"
+                    min_score_count += 1
+                else:
+                    passed_slots[i] = result
+                    logger.log(
+                        EventType.TICKER_SCORED,
+                        Severity.INFO,
+                        phase=4,
+                        ticker=result.ticker,
+                        message=(
+                            f"{result.ticker} → {result.combined_score:.1f} "
+                            f"(tech={result.technical.rsi_score}, flow={result.flow.rvol_score}, "
+                            f"funda={result.fundamental.funda_score}, sector={result.sector_adjustment})"
+                        ),
+                        data={
+                            "ticker": result.ticker,
+                            "combined_score": result.combined_score,
+                        },
+                    )
 
-            if result.excluded and result.exclusion_reason == "tech_filter":
-                tech_filter_count += 1
-                logger.log(
-                    EventType.TICKER_FILTERED,
-                    Severity.DEBUG,
-                    phase=4,
-                    message=f"{result.ticker} failed SMA200 trend filter",
-                    data={"ticker": result.ticker, "reason": "tech_filter"},
-                )
-            elif result.excluded and result.exclusion_reason == "danger_zone":
-                danger_zone_count += 1
-                logger.log(
-                    EventType.TICKER_FILTERED,
-                    Severity.INFO,
-                    phase=4,
-                    message=f"{result.ticker} filtered: danger zone "
-                    f"(D/E={result.fundamental.debt_equity}, "
-                    f"margin={result.fundamental.net_margin}, "
-                    f"IC={result.fundamental.interest_coverage})",
-                    data={"ticker": result.ticker, "reason": "danger_zone"},
-                )
-            elif result.combined_score > clipping_threshold:
-                result.excluded = True
-                result.exclusion_reason = "clipping"
-                clipped_count += 1
-                logger.log(
-                    EventType.CLIPPING_SKIP,
-                    Severity.INFO,
-                    phase=4,
-                    ticker=result.ticker,
-                    message=f"{result.ticker} score {result.combined_score:.1f} — crowded trade (skipping)",
-                    data={"ticker": result.ticker, "score": result.combined_score},
-                )
-            elif result.combined_score < min_score:
-                result.excluded = True
-                result.exclusion_reason = "min_score"
-                min_score_count += 1
-            else:
-                passed.append(result)
-                logger.log(
-                    EventType.TICKER_SCORED,
-                    Severity.INFO,
-                    phase=4,
-                    ticker=result.ticker,
-                    message=(
-                        f"{result.ticker} → {result.combined_score:.1f} "
-                        f"(tech={result.technical.rsi_score}, flow={result.flow.rvol_score}, "
-                        f"funda={result.fundamental.funda_score}, sector={result.sector_adjustment})"
-                    ),
-                    data={
-                        "ticker": result.ticker,
-                        "combined_score": result.combined_score,
-                    },
-                )
+        analyzed = [a for a in analyzed_slots if a is not None]
+        passed = [a for a in passed_slots if a is not None]
 
         # Debug: tech score breakdown for first 5 ACCEPTED tickers
         for dbg in passed[:5]:
@@ -1723,3 +1777,4 @@ async def _run_phase4_async(
         await fmp.close()
         if uw_client:
             await uw_client.close()
+        await shared_session.close()
@@ -89,6 +89,7 @@ def run_phase5(
         passed = []
         excluded_count = 0
         negative_count = 0
+        max_atr_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
 
         for stock in sorted_candidates:
             ticker = stock.ticker
@@ -151,12 +152,9 @@ def run_phase5(
             current_price = stock.technical.price
             source = gex_data.get("source", "")
 
-            # Call wall ATR filter: zero out call_wall if too far from price
-            atr = stock.technical.atr_14
-            max_atr_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-            if call_wall > 0 and atr > 0:
-                if abs(call_wall - current_price) > atr * max_atr_dist:
-                    call_wall = 0.0
+            call_wall = _filter_call_wall(
+                call_wall, current_price, stock.technical.atr_14, max_atr_dist
+            )
 
             regime = _classify_gex_regime(current_price, zero_gamma, net_gex)
             multiplier = _get_gex_multiplier(regime, config)
@@ -353,6 +351,16 @@ def _classify_gex_regime(current_price: float, zero_gamma: float, net_gex: float
         return GEXRegime.HIGH_VOL
 
 
+def _filter_call_wall(call_wall: float, price: float, atr: float, max_atr_dist: float) -> float:
+    """Call wall ATR filter: 0.0 when the wall is beyond max_atr_dist × ATR from price.
+
+    Missing walls (<= 0) and missing ATR (<= 0) pass through unchanged.
+    """
+    if call_wall > 0 and atr > 0 and abs(call_wall - price) > atr * max_atr_dist:
+        return 0.0
+    return call_wall
+
+
 def _get_gex_multiplier(regime: GEXRegime, config: Config) -> float:
     """Map GEX regime to position sizing multiplier."""
     if regime == GEXRegime.POSITIVE:
@@ -368,6 +376,17 @@ def _get_gex_multiplier(regime: GEXRegime, config: Config) -> float:
 # ============================================================================
 
 
+async def _settled(coro):
+    """Await coro, returning its exception instead of raising.
+
+    Keeps one ticker's failure from cancelling its TaskGroup siblings.
+    """
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+
 async def _run_phase5_async(
     config: Config,
     logger: EventLogger,
@@ -379,6 +398,7 @@ async def _run_phase5_async(
 
     When run_mms=True, also fetches bars+options for MMS analysis.
     """
+    from ifds.data.async_base import create_shared_session
     from ifds.data.async_clients import AsyncPolygonClient, AsyncUWClient
     from ifds.data.async_adapters import (
         AsyncFallbackGEXProvider,
@@ -405,12 +425,15 @@ async def _run_phase5_async(
             max_age_days=config.runtime.get("cache_max_age_days", 7),
         )
 
+    # One pooled session for every provider — keep-alive reuse across hosts
+    shared_session = create_shared_session()
     polygon = AsyncPolygonClient(
         api_key=config.get_api_key("polygon"),
         timeout=config.runtime.get("api_timeout_polygon_options", 15),
         max_retries=config.runtime["api_max_retries"],
         semaphore=sem_polygon,
         cache=file_cache,
+        session=shared_session,
     )
 
     uw_client = None
@@ -424,6 +447,7 @@ async def _run_phase5_async(
             timeout=config.runtime["api_timeout_uw"],
             max_retries=config.runtime["api_max_retries"],
             semaphore=sem_uw,
+            session=shared_session,
         )
         gex_provider = AsyncFallbackGEXProvider(
             AsyncUWGEXProvider(uw_client),
@@ -460,15 +484,19 @@ async def _run_phase5_async(
             return bars, options
 
     try:
-        # Phase 1: GEX gather
-        gex_tasks = [process_gex(stock) for stock in sorted_candidates]
-        gex_results = await asyncio.gather(*gex_tasks, return_exceptions=True)
+        # Phase 1: GEX fan-out (per-ticker failures come back as values)
+        async with asyncio.TaskGroup() as tg:
+            gex_tasks = [tg.create_task(_settled(process_gex(s))) for s in sorted_candidates]
+        gex_results = [t.result() for t in gex_tasks]
 
-        # Phase 2: MMS data gather (concurrent)
+        # Phase 2: MMS data fan-out — after GEX so option snapshots hit the cache
         mms_data_map: dict[str, tuple] = {}
         if run_mms:
-            mms_tasks = [fetch_mms_data(s.ticker) for s in sorted_candidates]
-            mms_results = await asyncio.gather(*mms_tasks, return_exceptions=True)
+            async with asyncio.TaskGroup() as tg:
+                mms_tasks = [
+                    tg.create_task(_settled(fetch_mms_data(s.ticker))) for s in sorted_candidates
+                ]
+            mms_results = [t.result() for t in mms_tasks]
             for stock, mms_fetch_result in zip(sorted_candidates, mms_results):
                 if not isinstance(mms_fetch_result, BaseException):
                     mms_data_map[stock.ticker] = mms_fetch_result
@@ -486,6 +514,7 @@ async def _run_phase5_async(
             run_mms_fn = run_mms_analysis
 
         # Process GEX results + MMS
+        max_atr_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
         for stock, gex_data in zip(sorted_candidates, gex_results):
             ticker = stock.ticker
 
@@ -552,12 +581,9 @@ async def _run_phase5_async(
             current_price = stock.technical.price
             source = gex_data.get("source", "")
 
-            # Call wall ATR filter: zero out call_wall if too far from price
-            atr = stock.technical.atr_14
-            max_atr_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-            if call_wall > 0 and atr > 0:
-                if abs(call_wall - current_price) > atr * max_atr_dist:
-                    call_wall = 0.0
+            call_wall = _filter_call_wall(
+                call_wall, current_price, stock.technical.atr_14, max_atr_dist
+            )
 
             regime = _classify_gex_regime(current_price, zero_gamma, net_gex)
             multiplier = _get_gex_multiplier(regime, config)
@@ -725,3 +751,4 @@ async def _run_phase5_async(
         await polygon.close()
         if uw_client:
             await uw_client.close()
+        await shared_session.close()
@@ -35,6 +35,7 @@ from ifds.models.market import (
     StockAnalysis,
     StrategyMode,
 )
+from ifds.utils.io import json_loads
 
 _BASE_SCORE = 50  # Neutral starting point for sub-dimension scores
 
@@ -54,8 +55,8 @@ def _ewma_score(current: float, prev_ewma: float | None, span: int = 10) -> floa
 def _load_ewma_scores(path: str) -> dict[str, float]:
     """Load previous EWMA scores from JSON state file."""
     try:
-        with open(path) as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
         today = date.today().isoformat()
         if data.get("date") == today:
             return {}  # Already ran today — don't use stale same-day data
@@ -457,12 +458,17 @@ def run_phase6(
         # Save state files
         if dedup:
             dedup.save()
-        _save_daily_counter(
-            config.runtime.get("daily_trades_file", "state/daily_trades.json"), daily_trades
-        )
-        _save_daily_counter(
-            config.runtime.get("daily_notional_file", "state/daily_notional.json"), daily_notional
-        )
+        # Counters are written only when this run moved them: an unchanged
+        # counter already reads back the same (a stale date resets to 0 on load)
+        if daily_trades["count"] != initial_trade_count:
+            _save_daily_counter(
+                config.runtime.get("daily_trades_file", "state/daily_trades.json"), daily_trades
+            )
+        if daily_notional["count"] != initial_notional_count:
+            _save_daily_counter(
+                config.runtime.get("daily_notional_file", "state/daily_notional.json"),
+                daily_notional,
+            )
 
         total_risk = sum(p.risk_usd for p in final_positions)
         total_exposure = sum(p.quantity * p.entry_price for p in final_positions)
@@ -1179,17 +1185,26 @@ def _apply_position_limits(
         "commodity": config.tuning.get("sector_group_max_commodity", 3),
     }
 
+    # sector → its groups in sector_groups order (Basic Materials is in two);
+    # resolved once per sector instead of scanning every group per position
+    groups_of: dict[str, tuple[str, ...]] = {}
+
     accepted: list[PositionSizing] = []
     sector_counts: dict[str, int] = {}
     group_counts: dict[str, int] = {}
     running_exposure = 0.0
     counts = {"sector": 0, "position": 0, "risk": 0, "exposure": 0, "correlation": 0}
 
-    for pos in positions:
-        # 1. Max positions
+    for i, pos in enumerate(positions):
+        # 1. Max positions — every remaining position fails this check first
         if len(accepted) >= max_positions:
-            counts["position"] += 1
-            continue
+            counts["position"] += len(positions) - i
+            break
+
+        pos_groups = groups_of.get(pos.sector)
+        if pos_groups is None:
+            pos_groups = tuple(g for g, secs in sector_groups.items() if pos.sector in secs)
+            groups_of[pos.sector] = pos_groups
 
         # 2. Sector diversification
         sector_count = sector_counts.get(pos.sector, 0)
@@ -1233,23 +1248,22 @@ def _apply_position_limits(
         # 5. Sector group correlation guard (BC21)
         if correlation_enabled:
             blocked = False
-            for group_name, group_sectors in sector_groups.items():
-                if pos.sector in group_sectors:
-                    if group_counts.get(group_name, 0) >= max_per_group.get(group_name, 99):
-                        counts["correlation"] += 1
-                        logger.log(
-                            EventType.TICKER_FILTERED,
-                            Severity.DEBUG,
-                            phase=6,
-                            message=f"{pos.ticker} excluded: {group_name} group limit ({pos.sector})",
-                            data={
-                                "ticker": pos.ticker,
-                                "reason": "correlation_limit",
-                                "group": group_name,
-                            },
-                        )
-                        blocked = True
-                        break
+            for group_name in pos_groups:
+                if group_counts.get(group_name, 0) >= max_per_group.get(group_name, 99):
+                    counts["correlation"] += 1
+                    logger.log(
+                        EventType.TICKER_FILTERED,
+                        Severity.DEBUG,
+                        phase=6,
+                        message=f"{pos.ticker} excluded: {group_name} group limit ({pos.sector})",
+                        data={
+                            "ticker": pos.ticker,
+                            "reason": "correlation_limit",
+                            "group": group_name,
+                        },
+                    )
+                    blocked = True
+                    break
             if blocked:
                 continue
 
@@ -1275,9 +1289,8 @@ def _apply_position_limits(
         running_exposure += ticker_exposure
 
         # Update group counts
-        for group_name, group_sectors in sector_groups.items():
-            if pos.sector in group_sectors:
-                group_counts[group_name] = group_counts.get(group_name, 0) + 1
+        for group_name in pos_groups:
+            group_counts[group_name] = group_counts.get(group_name, 0) + 1
 
     return accepted, counts
 
@@ -1290,8 +1303,8 @@ def _load_daily_counter(file_path: str) -> dict:
     """
     today = date.today().isoformat()
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = json_loads(f.read())
         if data.get("date") == today:
             return {"date": today, "count": data.get("count", 0)}
     except (FileNotFoundError, json.JSONDecodeError, KeyError):
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from ifds.config.loader import Config
 from ifds.config.validator import ConfigValidationError
+from ifds.data.base import close_shared_sessions
 from ifds.data.circuit_breaker import ProviderCircuitBreaker
 from ifds.events.logger import EventLogger
 from ifds.events.types import EventType, Severity
@@ -917,6 +918,7 @@ def run_pipeline(
         )
 
     finally:
+        close_shared_sessions()
         logger.close()
 
 
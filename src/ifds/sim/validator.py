@@ -120,19 +120,32 @@ async def _fetch_bars_for_trades(
     """
     from ifds.data.async_clients import AsyncPolygonClient
 
+    # Use trading calendar for precise range (one bulk lookup for all trades)
+    n_ahead = max_hold_days + fill_window_days + 2
+    # Fallback: calendar days + padding for weekends/holidays
+    padding = timedelta(days=max_hold_days + fill_window_days + 5)
+    try:
+        from ifds.utils.trading_calendar import next_trading_day, next_trading_days_bulk
+    except ImportError:
+        raw_tos = [t.run_date + padding for t in trades]
+    else:
+        try:
+            raw_tos = next_trading_days_bulk((t.run_date for t in trades), n_ahead)
+        except IndexError:
+            # Some dates run past the calendar — fall back for those trades only
+            raw_tos = []
+            for t in trades:
+                try:
+                    raw_tos.append(next_trading_day(t.run_date, n_ahead))
+                except IndexError:
+                    raw_tos.append(t.run_date + padding)
+
     # Deduplicate (ticker, from_date, to_date) requests
     today = date.today()
     requests: dict[tuple[str, str, str], list] = {}
-    for trade in trades:
+    for trade, raw_to in zip(trades, raw_tos):
         from_date = (trade.run_date + timedelta(days=1)).isoformat()
-        # Use trading calendar for precise range, cap at today to avoid stale cache
-        try:
-            from ifds.utils.trading_calendar import add_trading_days
-
-            raw_to = add_trading_days(trade.run_date, max_hold_days + fill_window_days + 2)
-        except Exception:
-            # Fallback: calendar days + padding for weekends/holidays
-            raw_to = trade.run_date + timedelta(days=max_hold_days + fill_window_days + 5)
+        # Cap at today to avoid stale cache
         to_date = min(today, raw_to).isoformat()
         key = (trade.ticker, from_date, to_date)
         if key not in requests:
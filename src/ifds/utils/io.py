@@ -1,10 +1,66 @@
-"""Atomic file write helpers — crash-safe JSON and Parquet persistence."""
+"""JSON helpers and atomic file writes — crash-safe JSON and Parquet persistence."""
 
 import json
+import math
 import os
 import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup (pip install ifds-suite[speedups]); stdlib is the fallback
+    orjson = None
+
+
+def json_loads(data: bytes | str):
+    """Parse JSON — orjson when installed, with stdlib json's leniency.
+
+    orjson rejects the NaN/Infinity literals stdlib json accepts; such
+    documents are re-parsed with stdlib json, so both paths agree and
+    genuinely invalid input raises ``json.JSONDecodeError`` either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _orjson_safe(obj) -> bool:
+    """True if ``obj`` holds only values orjson and stdlib json encode alike.
+
+    Excludes non-finite floats (orjson writes ``null``, stdlib ``NaN``),
+    non-str keys, and anything orjson serializes natively that stdlib
+    rejects or renders differently (dates, dataclasses, enums, subclasses).
+    """
+    t = type(obj)
+    if t is float:
+        return math.isfinite(obj)
+    if t is str or t is int or t is bool or obj is None:
+        return True
+    if t is dict:
+        return all(type(k) is str and _orjson_safe(v) for k, v in obj.items())
+    if t is list or t is tuple:
+        return all(_orjson_safe(v) for v in obj)
+    return False
+
+
+def json_dumps(data, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, identical in content to stdlib json.
+
+    orjson is used only for payloads it encodes the same way (see
+    ``_orjson_safe``); everything else, including >64-bit ints, NaN and
+    values stdlib rejects with TypeError, goes through stdlib json.
+    """
+    if orjson is not None and _orjson_safe(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
 
 def atomic_write_json(path: str | Path, data: dict | list) -> None:
     """Write JSON atomically using temp file + os.replace.
@@ -13,10 +69,11 @@ def atomic_write_json(path: str | Path, data: dict | list) -> None:
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json_dumps(data, indent=True)  # serialize before touching the filesystem
     fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
         os.replace(tmp, str(path))
     except Exception:
         try:
@@ -6,10 +6,12 @@ Provides trading-day-aware date arithmetic for the pipeline and SimEngine.
 
 from __future__ import annotations
 
-from datetime import date, timedelta
+from collections.abc import Iterable
+from datetime import date
 from functools import lru_cache
 
 import exchange_calendars as xcals
+import numpy as np
 
 
 @lru_cache(maxsize=1)
@@ -18,6 +20,28 @@ def _get_nyse_calendar():
     return xcals.get_calendar("XNYS")
 
 
+@lru_cache(maxsize=1)
+def _sessions_ord_arr() -> np.ndarray:
+    """Sorted int32 array of NYSE session ordinals (``date.toordinal()``).
+
+    Built once from the calendar's session index; lets hot counting paths
+    use ``np.searchsorted`` instead of slicing a DatetimeIndex per call.
+    """
+    sessions = _get_nyse_calendar().sessions
+    return np.fromiter((s.toordinal() for s in sessions.date), dtype=np.int32, count=len(sessions))
+
+
+def _check_in_calendar(arr: np.ndarray, ords) -> None:
+    """Raise IndexError if any ordinal lies outside the calendar's session span.
+
+    ``np.searchsorted`` clamps such inputs to the array ends, which would
+    otherwise return valid-looking but wrong dates.
+    """
+    ords = np.asarray(ords)
+    if ords.size and (ords.min() < arr[0] or ords.max() > arr[-1]):
+        raise IndexError("date out of NYSE calendar range")
+
+
 def is_trading_day(d: date) -> bool:
     """Check if a date is a valid NYSE trading day."""
     cal = _get_nyse_calendar()
@@ -36,23 +60,48 @@ def next_trading_day(d: date, n: int = 1) -> date:
 
     Returns:
         The nth trading day strictly after d.
+
+    Raises:
+        IndexError: If d or the result falls outside the calendar range.
     """
     if n < 1:
         raise ValueError("n must be >= 1")
 
-    cal = _get_nyse_calendar()
-    import pandas as pd
+    arr = _sessions_ord_arr()
+    ord_ = d.toordinal()
+    _check_in_calendar(arr, ord_)
+    pos = int(np.searchsorted(arr, ord_, side="right")) + n - 1
+    if pos >= arr.size:
+        raise IndexError("date out of NYSE calendar range")
+    return date.fromordinal(int(arr[pos]))
 
-    ts = pd.Timestamp(d)
 
-    current = ts
-    found = 0
-    while found < n:
-        current = current + pd.Timedelta(days=1)
-        if cal.is_session(current):
-            found += 1
+def next_trading_days_bulk(dates: Iterable[date], n: int = 1) -> list[date]:
+    """Vectorized :func:`next_trading_day` over many dates.
 
-    return current.date()
+    One ``np.searchsorted`` over the session ordinals replaces a Python
+    loop of per-date calls.
+
+    Args:
+        dates: Reference dates.
+        n: Number of trading days forward (must be >= 1).
+
+    Returns:
+        For each input date, the nth trading day strictly after it.
+
+    Raises:
+        IndexError: If an input date or a result falls outside the calendar range.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+
+    arr = _sessions_ord_arr()
+    ords = np.fromiter((d.toordinal() for d in dates), dtype=np.int32)
+    _check_in_calendar(arr, ords)
+    pos = np.searchsorted(arr, ords, side="right") + (n - 1)
+    if pos.size and pos.max() >= arr.size:
+        raise IndexError("date out of NYSE calendar range")
+    return [date.fromordinal(int(o)) for o in arr[pos]]
 
 
 def prev_trading_day(d: date, n: int = 1) -> date:
@@ -64,23 +113,20 @@ def prev_trading_day(d: date, n: int = 1) -> date:
 
     Returns:
         The nth trading day strictly before d.
+
+    Raises:
+        IndexError: If d or the result falls outside the calendar range.
     """
     if n < 1:
         raise ValueError("n must be >= 1")
 
-    cal = _get_nyse_calendar()
-    import pandas as pd
-
-    ts = pd.Timestamp(d)
-
-    current = ts
-    found = 0
-    while found < n:
-        current = current - pd.Timedelta(days=1)
-        if cal.is_session(current):
-            found += 1
-
-    return current.date()
+    arr = _sessions_ord_arr()
+    ord_ = d.toordinal()
+    _check_in_calendar(arr, ord_)
+    pos = int(np.searchsorted(arr, ord_, side="left")) - n
+    if pos < 0:
+        raise IndexError("date out of NYSE calendar range")
+    return date.fromordinal(int(arr[pos]))
 
 
 def trading_days_between(start: date, end: date) -> list[date]:
@@ -110,12 +156,22 @@ def add_trading_days(d: date, n: int) -> date:
 
     Returns:
         The resulting date after moving n trading days.
+
+    Raises:
+        IndexError: If d or the result falls outside the calendar range.
     """
     if n == 0:
         return d
+    arr = _sessions_ord_arr()
+    ord_ = d.toordinal()
+    _check_in_calendar(arr, ord_)
     if n > 0:
-        return next_trading_day(d, n)
-    return prev_trading_day(d, -n)
+        pos = int(np.searchsorted(arr, ord_, side="right")) + n - 1
+    else:
+        pos = int(np.searchsorted(arr, ord_, side="left")) + n
+    if not 0 <= pos < arr.size:
+        raise IndexError("date out of NYSE calendar range")
+    return date.fromordinal(int(arr[pos]))
 
 
 def count_trading_days(start: date, end: date) -> int:
@@ -127,13 +183,15 @@ def count_trading_days(start: date, end: date) -> int:
 
     Returns:
         Number of trading days in (start, end].
+
+    Raises:
+        IndexError: If start or end falls outside the calendar range.
     """
     if end <= start:
         return 0
-    cal = _get_nyse_calendar()
-    import pandas as pd
-
-    # Sessions in (start, end] = sessions_in_range(start+1day, end)
-    next_day = start + timedelta(days=1)
-    sessions = cal.sessions_in_range(pd.Timestamp(next_day), pd.Timestamp(end))
-    return len(sessions)
+    arr = _sessions_ord_arr()
+    _check_in_calendar(arr, (start.toordinal(), end.toordinal()))
+    # Sessions in (start, end] = sessions <= end minus sessions <= start
+    lo = np.searchsorted(arr, start.toordinal(), side="right")
+    hi = np.searchsorted(arr, end.toordinal(), side="right")
+    return int(hi - lo)
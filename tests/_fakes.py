@@ -0,0 +1,33 @@
+"""Lightweight client doubles for hot test paths.
+
+Plain classes instead of MagicMock where a test only needs canned
+responses: no lazy child mocks, no call recording beyond what is kept here.
+"""
+
+
+class FakeUWClient:
+    """UW client serving ``get_dark_pool_recent`` pages in order, then ``[]``."""
+
+    def __init__(self, pages: list[list[dict]]):
+        self._pages = list(pages)
+        self.calls = 0
+
+    def get_dark_pool_recent(self, **kwargs) -> list[dict]:
+        self.calls += 1
+        return self._pages.pop(0) if self._pages else []
+
+
+class FakeCache:
+    """FileCache stand-in: ``get`` returns one canned payload; ``put`` is recorded."""
+
+    def __init__(self, payload=None):
+        self._payload = payload
+        self.gets: list[tuple] = []
+        self.puts: list[tuple] = []
+
+    def get(self, provider: str, endpoint: str, date_str: str, symbol: str):
+        self.gets.append((provider, endpoint, date_str, symbol))
+        return self._payload
+
+    def put(self, provider: str, endpoint: str, date_str: str, symbol: str, data) -> None:
+        self.puts.append((provider, endpoint, date_str, symbol, data))
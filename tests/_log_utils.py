@@ -0,0 +1,17 @@
+"""Helpers for reading EventLogger JSONL output in tests."""
+
+from pathlib import Path
+
+from ifds.utils.io import json_loads
+
+
+def read_events(logger, event_type: str) -> list[dict]:
+    """Return the logged events of ``event_type``, in write order.
+
+    The log is read once as bytes and only lines mentioning the event type
+    are parsed — the rest of the run's events are never decoded.
+    """
+    needle = f'"{event_type}"'.encode()
+    raw = Path(logger.log_file).read_bytes()
+    events = (json_loads(line) for line in raw.split(b"\n") if needle in line)
+    return [ev for ev in events if ev.get("event_type") == event_type]
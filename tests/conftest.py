@@ -24,3 +24,18 @@ os.environ["IFDS_SKIP_TRADING_DAY_GUARD"] = "1"
 os.environ.setdefault(
     "IFDS_PT_EVENT_DIR", tempfile.mkdtemp(prefix="ifds_pt_events_")
 )
+
+# Run async tests on uvloop when it is installed (optional, Linux/macOS). Only
+# registered when both uvloop and a pytest-asyncio with the loop-factory hook
+# are present — without uvloop every test keeps the default asyncio loop.
+try:
+    import uvloop
+    from pytest_asyncio.plugin import PytestAsyncioSpecs
+except ImportError:
+    uvloop = None
+    PytestAsyncioSpecs = None
+
+if uvloop is not None and hasattr(PytestAsyncioSpecs, "pytest_asyncio_loop_factories"):
+
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
@@ -5,28 +5,56 @@ Usage: python tests/live_api_test.py
 Requires: .env with IFDS_POLYGON_API_KEY, IFDS_FMP_API_KEY, IFDS_FRED_API_KEY, IFDS_UW_API_KEY
 """
 
+import asyncio
 import os
+import re
 import sys
 import time
+from contextvars import ContextVar
 from datetime import date, timedelta
 from pathlib import Path
 
-# Load .env manually (no dotenv dependency)
+# Load .env manually (no dotenv dependency) — one regex pass over the file.
+# Comment lines never match; `export KEY=...` (shell-sourced form) is accepted;
+# values may be double-quoted (with \" escapes) or single-quoted, and an
+# unquoted value ends at a ` #` inline comment. Variables already set in the
+# environment win over the file.
+_ENV_RE = re.compile(
+    r"""
+    ^[ \t]*(?:export[ \t]+)?
+    ([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*
+    (?:"((?:[^"\\\n]|\\.)*)"|'([^'\n]*)'|([^\n]*?))
+    [ \t]*(?:[ \t]\#[^\n]*)?$
+    """,
+    re.M | re.X,
+)
+_ENV_ESCAPE_RE = re.compile(r'\\(["\\])')
+
+
+def _env_value(m: re.Match) -> str:
+    double, single, bare = m.group(2, 3, 4)
+    if double is not None:
+        return _ENV_ESCAPE_RE.sub(r"\1", double)
+    return single if single is not None else bare
+
+
 env_path = Path(__file__).resolve().parent.parent / ".env"
 if env_path.exists():
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if line and not line.startswith("#") and "=" in line:
-            key, _, val = line.partition("=")
-            os.environ[key.strip()] = val.strip().strip('"')
+    for m in _ENV_RE.finditer(env_path.read_text()):
+        os.environ.setdefault(m.group(1), _env_value(m))
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from ifds.data.polygon import PolygonClient
 from ifds.data.fmp import FMPClient
-from ifds.data.fred import FREDClient
 from ifds.data.unusual_whales import UnusualWhalesClient
+from ifds.data.async_clients import (
+    AsyncFMPClient,
+    AsyncFREDClient,
+    AsyncPolygonClient,
+    AsyncUWClient,
+)
 from ifds.data.adapters import (
     UWGEXProvider,
     PolygonGEXProvider,
@@ -42,148 +70,204 @@ BOLD = "\033[1m"
 RESET = "\033[0m"
 
 results = {"pass": 0, "fail": 0, "skip": 0}
+_section_out: ContextVar[list[str] | None] = ContextVar("_section_out", default=None)
 
 
 def report(name: str, ok: bool, detail: str = "", skip: bool = False):
+    """Count a result and print it (buffered when inside a concurrent section)."""
     if skip:
         results["skip"] += 1
-        print(f"  {SKIP} {name}: {detail}")
+        line = f"  {SKIP} {name}: {detail}"
     elif ok:
         results["pass"] += 1
-        print(f"  {PASS} {name}: {detail}")
+        line = f"  {PASS} {name}: {detail}"
     else:
         results["fail"] += 1
-        print(f"  {FAIL} {name}: {detail}")
+        line = f"  {FAIL} {name}: {detail}"
+    out = _section_out.get()
+    if out is None:
+        print(line)
+    else:
+        out.append(line)
 
 
-def test_polygon(api_key: str):
-    print(f"\n{BOLD}=== POLYGON ==={RESET}")
-    client = PolygonClient(api_key=api_key, timeout=15)
+async def run_section(title: str, test, *args) -> list[str]:
+    """Run one provider section, buffering its output.
 
-    # Health check
-    health = client.check_health()
-    report(
-        "Health check",
-        health.status.value == "ok",
-        f"status={health.status.value} time={health.response_time_ms:.0f}ms",
-    )
+    Sections run concurrently, so output is collected per section and printed
+    in a fixed order afterwards. A crash in one provider is reported as a
+    FAIL without cancelling the others.
+    """
+    out = [f"\n{BOLD}=== {title} ==={RESET}"]
+    _section_out.set(out)  # gather runs each section in its own task/context
+    try:
+        await test(*args)
+    except Exception as e:
+        report("Section crashed", False, f"{type(e).__name__}: {e}")
+    return out
 
-    # Grouped daily
-    yesterday = (date.today() - timedelta(days=3)).isoformat()
-    bars = client.get_grouped_daily(yesterday)
-    report(
-        "Grouped daily",
-        bars is not None and len(bars) > 0,
-        f"{len(bars)} tickers" if bars else "None returned",
-    )
 
-    # AAPL aggregates (90 days)
+def _raised(name: str, result) -> bool:
+    """Report a FAIL for an exception returned by gather(return_exceptions=True)."""
+    if isinstance(result, BaseException):
+        report(name, False, f"{type(result).__name__}: {result}")
+        return True
+    return False
+
+
+async def test_polygon(api_key: str):
+    client = AsyncPolygonClient(api_key=api_key, timeout=15)
+
+    # Independent GETs — issue them concurrently
+    yesterday = (date.today() - timedelta(days=3)).isoformat()
     from_date = (date.today() - timedelta(days=90)).isoformat()
     to_date = date.today().isoformat()
-    aggs = client.get_aggregates("AAPL", from_date, to_date)
-    report(
-        "AAPL aggregates (90d)",
-        aggs is not None and len(aggs) > 0,
-        f"{len(aggs)} bars" if aggs else "None returned",
+    health, bars, aggs, opts = await asyncio.gather(
+        client.check_health(),
+        client.get_grouped_daily(yesterday),
+        client.get_aggregates("AAPL", from_date, to_date),
+        client.get_options_snapshot("AAPL"),
+        return_exceptions=True,
     )
 
-    # Options snapshot
-    opts = client.get_options_snapshot("AAPL")
-    report(
-        "AAPL options snapshot",
-        opts is not None and len(opts) > 0,
-        f"{len(opts)} contracts" if opts else "None returned",
-    )
+    # Health check
+    if not _raised("Health check", health):
+        report(
+            "Health check",
+            health.status.value == "ok",
+            f"status={health.status.value} time={health.response_time_ms:.0f}ms",
+        )
 
-    if opts and len(opts) > 0:
-        sample = opts[0]
-        has_greeks = "greeks" in sample
-        has_details = "details" in sample
-        has_oi = "open_interest" in sample or "open_interest" in sample.get("day", {})
-        report("  → has greeks", has_greeks, f"keys: {list(sample.get('greeks', {}).keys())[:5]}")
+    # Grouped daily
+    if not _raised("Grouped daily", bars):
         report(
-            "  → has details", has_details, f"keys: {list(sample.get('details', {}).keys())[:5]}"
+            "Grouped daily",
+            bars is not None and len(bars) > 0,
+            f"{len(bars)} tickers" if bars else "None returned",
         )
+
+    # AAPL aggregates (90 days)
+    if not _raised("AAPL aggregates (90d)", aggs):
         report(
-            "  → has open_interest",
-            has_oi,
-            f"root={sample.get('open_interest')}, day={sample.get('day', {}).get('open_interest')}",
+            "AAPL aggregates (90d)",
+            aggs is not None and len(aggs) > 0,
+            f"{len(aggs)} bars" if aggs else "None returned",
         )
 
-    client.close()
+    # Options snapshot
+    if not _raised("AAPL options snapshot", opts):
+        report(
+            "AAPL options snapshot",
+            opts is not None and len(opts) > 0,
+            f"{len(opts)} contracts" if opts else "None returned",
+        )
 
+        if opts and len(opts) > 0:
+            sample = opts[0]
+            has_greeks = "greeks" in sample
+            has_details = "details" in sample
+            has_oi = "open_interest" in sample or "open_interest" in sample.get("day", {})
+            report(
+                "  → has greeks", has_greeks, f"keys: {list(sample.get('greeks', {}).keys())[:5]}"
+            )
+            report(
+                "  → has details",
+                has_details,
+                f"keys: {list(sample.get('details', {}).keys())[:5]}",
+            )
+            report(
+                "  → has open_interest",
+                has_oi,
+                f"root={sample.get('open_interest')}, "
+                f"day={sample.get('day', {}).get('open_interest')}",
+            )
+
+    await client.close()
+
+
+async def test_fmp(api_key: str):
+    client = AsyncFMPClient(api_key=api_key, timeout=15)
+    # Screener + earnings calendar have no async equivalent — run the sync
+    # client in a worker thread so they still overlap with the async calls.
+    sync_client = FMPClient(api_key=api_key, timeout=15)
 
-def test_fmp(api_key: str):
-    print(f"\n{BOLD}=== FMP ==={RESET}")
-    client = FMPClient(api_key=api_key, timeout=15)
+    from_d = date.today().isoformat()
+    to_d = (date.today() + timedelta(days=14)).isoformat()
+    health, screener, earnings, insiders, metrics, growth = await asyncio.gather(
+        client.check_health(),
+        asyncio.to_thread(sync_client.screener, {"marketCapMoreThan": 100_000_000_000, "limit": 5}),
+        asyncio.to_thread(sync_client.get_earnings_calendar, from_d, to_d),
+        client.get_insider_trading("AAPL"),
+        client.get_key_metrics("AAPL"),
+        client.get_financial_growth("AAPL"),
+        return_exceptions=True,
+    )
 
     # Health check
-    health = client.check_health()
-    report(
-        "Health check",
-        health.status.value == "ok",
-        f"status={health.status.value} time={health.response_time_ms:.0f}ms",
-    )
+    if not _raised("Health check", health):
+        report(
+            "Health check",
+            health.status.value == "ok",
+            f"status={health.status.value} time={health.response_time_ms:.0f}ms",
+        )
 
     # Company screener
-    screener = client.screener({"marketCapMoreThan": 100_000_000_000, "limit": 5})
-    report(
-        "Company screener",
-        screener is not None and len(screener) > 0,
-        f"{len(screener)} companies" if screener else "None returned",
-    )
+    if not _raised("Company screener", screener):
+        report(
+            "Company screener",
+            screener is not None and len(screener) > 0,
+            f"{len(screener)} companies" if screener else "None returned",
+        )
 
-    if screener and len(screener) > 0:
-        sample = screener[0]
-        report("  → sample fields", True, f"{list(sample.keys())[:8]}")
+        if screener and len(screener) > 0:
+            sample = screener[0]
+            report("  → sample fields", True, f"{list(sample.keys())[:8]}")
 
     # Earnings calendar
-    from_d = date.today().isoformat()
-    to_d = (date.today() + timedelta(days=14)).isoformat()
-    earnings = client.get_earnings_calendar(from_d, to_d)
-    report(
-        "Earnings calendar",
-        earnings is not None,
-        f"{len(earnings)} entries" if earnings else "None returned",
-    )
+    if not _raised("Earnings calendar", earnings):
+        report(
+            "Earnings calendar",
+            earnings is not None,
+            f"{len(earnings)} entries" if earnings else "None returned",
+        )
 
     # Insider trading
-    insiders = client.get_insider_trading("AAPL")
-    report(
-        "Insider trading (AAPL)",
-        insiders is not None and len(insiders) > 0,
-        f"{len(insiders)} trades" if insiders else "None returned",
-    )
+    if not _raised("Insider trading (AAPL)", insiders):
+        report(
+            "Insider trading (AAPL)",
+            insiders is not None and len(insiders) > 0,
+            f"{len(insiders)} trades" if insiders else "None returned",
+        )
 
-    if insiders and len(insiders) > 0:
-        sample = insiders[0]
-        report("  → sample fields", True, f"{list(sample.keys())[:8]}")
+        if insiders and len(insiders) > 0:
+            sample = insiders[0]
+            report("  → sample fields", True, f"{list(sample.keys())[:8]}")
 
     # Key metrics
-    metrics = client.get_key_metrics("AAPL")
-    report(
-        "Key metrics (AAPL)",
-        metrics is not None,
-        f"keys: {list(metrics.keys())[:6]}" if metrics else "None returned",
-    )
+    if not _raised("Key metrics (AAPL)", metrics):
+        report(
+            "Key metrics (AAPL)",
+            metrics is not None,
+            f"keys: {list(metrics.keys())[:6]}" if metrics else "None returned",
+        )
 
     # Financial growth
-    growth = client.get_financial_growth("AAPL")
-    report(
-        "Financial growth (AAPL)",
-        growth is not None,
-        f"keys: {list(growth.keys())[:6]}" if growth else "None returned",
-    )
+    if not _raised("Financial growth (AAPL)", growth):
+        report(
+            "Financial growth (AAPL)",
+            growth is not None,
+            f"keys: {list(growth.keys())[:6]}" if growth else "None returned",
+        )
 
-    client.close()
+    await client.close()
+    sync_client.close()
 
 
-def test_fred(api_key: str):
-    print(f"\n{BOLD}=== FRED ==={RESET}")
-    client = FREDClient(api_key=api_key, timeout=15)
+async def test_fred(api_key: str):
+    client = AsyncFREDClient(api_key=api_key, timeout=15)
 
     # Health check
-    health = client.check_health()
+    health = await client.check_health()
     report(
         "Health check",
         health.status.value == "ok",
@@ -191,7 +275,7 @@ def test_fred(api_key: str):
     )
 
     # VIX
-    vix = client.get_vix(limit=5)
+    vix = await client.get_vix(limit=5)
     report(
         "VIX data",
         vix is not None and len(vix) > 0,
@@ -199,64 +283,69 @@ def test_fred(api_key: str):
     )
 
     # TNX (10Y yield)
-    tnx = client.get_tnx(limit=5)
+    tnx = await client.get_tnx(limit=5)
     report(
         "TNX (10Y yield)",
         tnx is not None and len(tnx) > 0,
         f"{len(tnx)} obs, latest={tnx[0]}" if tnx else "None returned",
     )
 
-    client.close()
+    await client.close()
 
 
-def test_unusual_whales(api_key: str):
-    print(f"\n{BOLD}=== UNUSUAL WHALES ==={RESET}")
-    client = UnusualWhalesClient(api_key=api_key, timeout=15)
+async def test_unusual_whales(api_key: str):
+    client = AsyncUWClient(api_key=api_key, timeout=15)
 
-    # Health check
-    health = client.check_health()
-    report(
-        "Health check",
-        health.status.value == "ok",
-        f"status={health.status.value} time={health.response_time_ms:.0f}ms",
+    health, dp, greeks = await asyncio.gather(
+        client.check_health(),
+        client.get_dark_pool("SPY"),
+        client.get_greeks("SPY"),
+        return_exceptions=True,
     )
 
-    # Dark Pool
-    dp = client.get_dark_pool("SPY")
-    report(
-        "Dark Pool (SPY)",
-        dp is not None and len(dp) > 0,
-        f"{len(dp)} records" if dp else "None returned",
-    )
+    # Health check
+    if not _raised("Health check", health):
+        report(
+            "Health check",
+            health.status.value == "ok",
+            f"status={health.status.value} time={health.response_time_ms:.0f}ms",
+        )
 
-    if dp and len(dp) > 0:
-        sample = dp[0]
-        report("  → sample fields", True, f"{list(sample.keys())[:8]}")
-        has_nbbo = "nbbo_ask" in sample and "nbbo_bid" in sample
+    # Dark Pool
+    if not _raised("Dark Pool (SPY)", dp):
         report(
-            "  → has NBBO fields",
-            has_nbbo,
-            f"nbbo_ask={sample.get('nbbo_ask')}, nbbo_bid={sample.get('nbbo_bid')}",
+            "Dark Pool (SPY)",
+            dp is not None and len(dp) > 0,
+            f"{len(dp)} records" if dp else "None returned",
         )
 
-    # Greek Exposure
-    greeks = client.get_greeks("SPY")
-    report(
-        "Greek Exposure (SPY)",
-        greeks is not None,
-        f"keys: {list(greeks.keys())[:8]}" if greeks else "None returned",
-    )
+        if dp and len(dp) > 0:
+            sample = dp[0]
+            report("  → sample fields", True, f"{list(sample.keys())[:8]}")
+            has_nbbo = "nbbo_ask" in sample and "nbbo_bid" in sample
+            report(
+                "  → has NBBO fields",
+                has_nbbo,
+                f"nbbo_ask={sample.get('nbbo_ask')}, nbbo_bid={sample.get('nbbo_bid')}",
+            )
 
-    if greeks:
-        has_gamma = "call_gamma" in greeks or "put_gamma" in greeks
+    # Greek Exposure
+    if not _raised("Greek Exposure (SPY)", greeks):
         report(
-            "  → has gamma fields",
-            has_gamma,
-            f"call_gamma={greeks.get('call_gamma')}, put_gamma={greeks.get('put_gamma')}",
+            "Greek Exposure (SPY)",
+            greeks is not None,
+            f"keys: {list(greeks.keys())[:8]}" if greeks else "None returned",
         )
 
-    client.close()
-    return client
+        if greeks:
+            has_gamma = "call_gamma" in greeks or "put_gamma" in greeks
+            report(
+                "  → has gamma fields",
+                has_gamma,
+                f"call_gamma={greeks.get('call_gamma')}, put_gamma={greeks.get('put_gamma')}",
+            )
+
+    await client.close()
 
 
 def test_adapters(polygon_key: str, uw_key: str):
@@ -305,6 +394,25 @@ def test_adapters(polygon_key: str, uw_key: str):
     uw.close()
 
 
+async def run_providers(poly_key, fmp_key, fred_key, uw_key) -> None:
+    """Run the per-provider sections concurrently, print them in fixed order."""
+    sections = [
+        ("POLYGON", test_polygon, poly_key),
+        ("FMP", test_fmp, fmp_key),
+        ("FRED", test_fred, fred_key),
+        ("UNUSUAL WHALES", test_unusual_whales, uw_key),
+    ]
+    active = [(title, test, key) for title, test, key in sections if key]
+    outputs = await asyncio.gather(*(run_section(title, test, key) for title, test, key in active))
+    by_title = dict(zip((title for title, _, _ in active), outputs))
+
+    for title, _, key in sections:
+        if key:
+            print("\n".join(by_title[title]))
+        else:
+            print(f"\n{SKIP} {title}: No API key")
+
+
 def main():
     print(f"{BOLD}IFDS v2.0 — Live API Integration Test{RESET}")
     print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -314,25 +422,7 @@ def main():
     fred_key = os.environ.get("IFDS_FRED_API_KEY")
     uw_key = os.environ.get("IFDS_UW_API_KEY")
 
-    if poly_key:
-        test_polygon(poly_key)
-    else:
-        print(f"\n{SKIP} POLYGON: No API key")
-
-    if fmp_key:
-        test_fmp(fmp_key)
-    else:
-        print(f"\n{SKIP} FMP: No API key")
-
-    if fred_key:
-        test_fred(fred_key)
-    else:
-        print(f"\n{SKIP} FRED: No API key")
-
-    if uw_key:
-        test_unusual_whales(uw_key)
-    else:
-        print(f"\n{SKIP} UW: No API key")
+    asyncio.run(run_providers(poly_key, fmp_key, fred_key, uw_key))
 
     if poly_key and uw_key:
         test_adapters(poly_key, uw_key)
@@ -4,12 +4,15 @@ import pytest
 from unittest.mock import MagicMock
 
 from ifds.data.adapters import (
+    DarkPoolProvider,
     FallbackGEXProvider,
     FallbackDarkPoolProvider,
+    GEXProvider,
     UWGEXProvider,
     PolygonGEXProvider,
     UWDarkPoolProvider,
 )
+from ifds.data.unusual_whales import UnusualWhalesClient
 from ifds.events.logger import EventLogger
 
 
@@ -18,51 +21,86 @@ def logger(tmp_path):
     return EventLogger(log_dir=str(tmp_path), run_id="adapter-test")
 
 
+# Spec-limited mocks are built once per module and reset after every test —
+# tests only configure return values.
+
+
+@pytest.fixture(scope="module")
+def _module_mocks():
+    return {
+        "primary_gex": MagicMock(spec=GEXProvider),
+        "fallback_gex": MagicMock(spec=GEXProvider),
+        "primary_dp": MagicMock(spec=DarkPoolProvider),
+        "uw_client": MagicMock(spec=UnusualWhalesClient),
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(_module_mocks):
+    yield
+    for mock in _module_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def primary_gex(_module_mocks):
+    return _module_mocks["primary_gex"]
+
+
+@pytest.fixture
+def fallback_gex(_module_mocks):
+    return _module_mocks["fallback_gex"]
+
+
+@pytest.fixture
+def primary_dp(_module_mocks):
+    return _module_mocks["primary_dp"]
+
+
+@pytest.fixture
+def uw_client(_module_mocks):
+    return _module_mocks["uw_client"]
+
+
 class TestFallbackGEXProvider:
-    def test_uses_primary_when_available(self, logger):
+    def test_uses_primary_when_available(self, logger, primary_gex, fallback_gex):
         """When primary (UW) returns data, use it."""
-        primary = MagicMock()
-        primary.get_gex.return_value = {"net_gex": 1000, "source": "unusual_whales"}
-        primary.provider_name.return_value = "unusual_whales"
+        primary_gex.get_gex.return_value = {"net_gex": 1000, "source": "unusual_whales"}
+        primary_gex.provider_name.return_value = "unusual_whales"
 
-        fallback = MagicMock()
-        fallback.provider_name.return_value = "polygon"
+        fallback_gex.provider_name.return_value = "polygon"
 
-        provider = FallbackGEXProvider(primary, fallback, logger=logger)
+        provider = FallbackGEXProvider(primary_gex, fallback_gex, logger=logger)
         result = provider.get_gex("NVDA")
 
         assert result["source"] == "unusual_whales"
-        primary.get_gex.assert_called_once_with("NVDA")
-        fallback.get_gex.assert_not_called()
+        primary_gex.get_gex.assert_called_once_with("NVDA")
+        fallback_gex.get_gex.assert_not_called()
 
-    def test_falls_back_when_primary_returns_none(self, logger):
+    def test_falls_back_when_primary_returns_none(self, logger, primary_gex, fallback_gex):
         """When primary (UW) returns None, fall back to Polygon."""
-        primary = MagicMock()
-        primary.get_gex.return_value = None
-        primary.provider_name.return_value = "unusual_whales"
+        primary_gex.get_gex.return_value = None
+        primary_gex.provider_name.return_value = "unusual_whales"
 
-        fallback = MagicMock()
-        fallback.get_gex.return_value = {"net_gex": 500, "source": "polygon_calculated"}
-        fallback.provider_name.return_value = "polygon"
+        fallback_gex.get_gex.return_value = {"net_gex": 500, "source": "polygon_calculated"}
+        fallback_gex.provider_name.return_value = "polygon"
 
-        provider = FallbackGEXProvider(primary, fallback, logger=logger)
+        provider = FallbackGEXProvider(primary_gex, fallback_gex, logger=logger)
         result = provider.get_gex("NVDA")
 
         assert result["source"] == "polygon_calculated"
-        primary.get_gex.assert_called_once()
-        fallback.get_gex.assert_called_once_with("NVDA")
+        primary_gex.get_gex.assert_called_once()
+        fallback_gex.get_gex.assert_called_once_with("NVDA")
 
-    def test_logs_fallback_event(self, logger):
+    def test_logs_fallback_event(self, logger, primary_gex, fallback_gex):
         """Fallback should be logged for audit trail."""
-        primary = MagicMock()
-        primary.get_gex.return_value = None
-        primary.provider_name.return_value = "unusual_whales"
+        primary_gex.get_gex.return_value = None
+        primary_gex.provider_name.return_value = "unusual_whales"
 
-        fallback = MagicMock()
-        fallback.get_gex.return_value = {"net_gex": 0}
-        fallback.provider_name.return_value = "polygon"
+        fallback_gex.get_gex.return_value = {"net_gex": 0}
+        fallback_gex.provider_name.return_value = "polygon"
 
-        provider = FallbackGEXProvider(primary, fallback, logger=logger)
+        provider = FallbackGEXProvider(primary_gex, fallback_gex, logger=logger)
         provider.get_gex("AAPL")
 
         # Check that a fallback event was logged
@@ -71,63 +109,56 @@ class TestFallbackGEXProvider:
         assert fallback_events[0]["data"]["primary"] == "unusual_whales"
         assert fallback_events[0]["data"]["fallback"] == "polygon"
 
-    def test_returns_none_when_both_fail(self, logger):
+    def test_returns_none_when_both_fail(self, logger, primary_gex, fallback_gex):
         """When both primary and fallback return None."""
-        primary = MagicMock()
-        primary.get_gex.return_value = None
-        primary.provider_name.return_value = "unusual_whales"
+        primary_gex.get_gex.return_value = None
+        primary_gex.provider_name.return_value = "unusual_whales"
 
-        fallback = MagicMock()
-        fallback.get_gex.return_value = None
-        fallback.provider_name.return_value = "polygon"
+        fallback_gex.get_gex.return_value = None
+        fallback_gex.provider_name.return_value = "polygon"
 
-        provider = FallbackGEXProvider(primary, fallback, logger=logger)
+        provider = FallbackGEXProvider(primary_gex, fallback_gex, logger=logger)
         result = provider.get_gex("FAIL")
 
         assert result is None
 
-    def test_provider_name_combined(self):
-        primary = MagicMock()
-        primary.provider_name.return_value = "unusual_whales"
-        fallback = MagicMock()
-        fallback.provider_name.return_value = "polygon"
+    def test_provider_name_combined(self, primary_gex, fallback_gex):
+        primary_gex.provider_name.return_value = "unusual_whales"
+        fallback_gex.provider_name.return_value = "polygon"
 
-        provider = FallbackGEXProvider(primary, fallback)
+        provider = FallbackGEXProvider(primary_gex, fallback_gex)
         assert provider.provider_name() == "unusual_whales+polygon"
 
 
 class TestFallbackDarkPoolProvider:
-    def test_uses_primary_when_available(self, logger):
-        primary = MagicMock()
-        primary.get_dark_pool.return_value = {
+    def test_uses_primary_when_available(self, logger, primary_dp):
+        primary_dp.get_dark_pool.return_value = {
             "dp_volume": 1000000,
             "signal": "BULLISH",
             "source": "unusual_whales",
         }
-        primary.provider_name.return_value = "unusual_whales"
+        primary_dp.provider_name.return_value = "unusual_whales"
 
-        provider = FallbackDarkPoolProvider(primary, logger=logger)
+        provider = FallbackDarkPoolProvider(primary_dp, logger=logger)
         result = provider.get_dark_pool("NVDA")
 
         assert result["signal"] == "BULLISH"
 
-    def test_returns_none_when_primary_fails(self, logger):
+    def test_returns_none_when_primary_fails(self, logger, primary_dp):
         """Dark Pool has no fallback — returns None if UW fails."""
-        primary = MagicMock()
-        primary.get_dark_pool.return_value = None
-        primary.provider_name.return_value = "unusual_whales"
+        primary_dp.get_dark_pool.return_value = None
+        primary_dp.provider_name.return_value = "unusual_whales"
 
-        provider = FallbackDarkPoolProvider(primary, logger=logger)
+        provider = FallbackDarkPoolProvider(primary_dp, logger=logger)
         result = provider.get_dark_pool("NVDA")
 
         assert result is None
 
-    def test_logs_no_fallback_available(self, logger):
-        primary = MagicMock()
-        primary.get_dark_pool.return_value = None
-        primary.provider_name.return_value = "unusual_whales"
+    def test_logs_no_fallback_available(self, logger, primary_dp):
+        primary_dp.get_dark_pool.return_value = None
+        primary_dp.provider_name.return_value = "unusual_whales"
 
-        provider = FallbackDarkPoolProvider(primary, logger=logger)
+        provider = FallbackDarkPoolProvider(primary_dp, logger=logger)
         provider.get_dark_pool("AAPL")
 
         fallback_events = [e for e in logger.events if e["event_type"] == "API_FALLBACK"]
@@ -136,9 +167,8 @@ class TestFallbackDarkPoolProvider:
 
 
 class TestUWGEXProvider:
-    def test_returns_gex_from_per_strike_data(self):
+    def test_returns_gex_from_per_strike_data(self, uw_client):
         """UW per-strike endpoint → full GEX dict with walls and zero_gamma."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = [
             {"strike": "150", "call_gamma": "5000000", "put_gamma": "-8000000"},
             {"strike": "155", "call_gamma": "9000000", "put_gamma": "-3000000"},
@@ -156,9 +186,8 @@ class TestUWGEXProvider:
         assert "net_gex" in result
         assert len(result["gex_by_strike"]) == 3
 
-    def test_net_gex_calculation(self):
+    def test_net_gex_calculation(self, uw_client):
         """net_gex = sum(call_gamma + put_gamma) per strike."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = [
             {"strike": "100", "call_gamma": "10000", "put_gamma": "-4000"},
             {"strike": "110", "call_gamma": "8000", "put_gamma": "-6000"},
@@ -170,9 +199,8 @@ class TestUWGEXProvider:
         # (10000-4000) + (8000-6000) = 6000 + 2000 = 8000
         assert result["net_gex"] == 8000.0
 
-    def test_zero_gamma_included(self):
+    def test_zero_gamma_included(self, uw_client):
         """Result includes zero_gamma field as float."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = [
             {"strike": "100", "call_gamma": "3000", "put_gamma": "-1000"},
             {"strike": "110", "call_gamma": "1000", "put_gamma": "-5000"},
@@ -184,25 +212,22 @@ class TestUWGEXProvider:
         assert isinstance(result["zero_gamma"], float)
         assert result["zero_gamma"] > 0
 
-    def test_returns_none_when_no_strike_data(self):
+    def test_returns_none_when_no_strike_data(self, uw_client):
         """Client returns None → provider returns None."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = None
 
         provider = UWGEXProvider(uw_client)
         assert provider.get_gex("FAIL") is None
 
-    def test_empty_strike_data_returns_none(self):
+    def test_empty_strike_data_returns_none(self, uw_client):
         """Empty list → no strikes to process → None."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = []
 
         provider = UWGEXProvider(uw_client)
         assert provider.get_gex("FAIL") is None
 
-    def test_all_zero_gamma_returns_none(self):
+    def test_all_zero_gamma_returns_none(self, uw_client):
         """All strikes have zero gamma → no useful data → None."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = [
             {"strike": "150", "call_gamma": "0", "put_gamma": "0"},
         ]
@@ -210,9 +235,8 @@ class TestUWGEXProvider:
         provider = UWGEXProvider(uw_client)
         assert provider.get_gex("FLAT") is None
 
-    def test_string_values_converted(self):
+    def test_string_values_converted(self, uw_client):
         """All UW values are strings — must be converted to float."""
-        uw_client = MagicMock()
         uw_client.get_greek_exposure_by_strike.return_value = [
             {"strike": "152.5", "call_gamma": "9356683.42", "put_gamma": "-12337386.05"},
         ]
@@ -4,6 +4,8 @@ Verifies that _format_sector_table includes the AGG benchmark row
 when provided, and omits it when None.
 """
 
+import pytest
+
 from ifds.models.market import (
     SectorBreadth,
     SectorScore,
@@ -43,6 +45,20 @@ def _make_agg_benchmark():
     )
 
 
+# Read-only sample data (_format_sector_table never mutates its inputs) —
+# built once per module. _make_sector stays for tests needing custom momentum.
+
+
+@pytest.fixture(scope="module")
+def sector():
+    return _make_sector()
+
+
+@pytest.fixture(scope="module")
+def agg_benchmark():
+    return _make_agg_benchmark()
+
+
 class TestSectorTableBenchmark:
     """Test _format_sector_table benchmark parameter."""
 
@@ -53,44 +69,35 @@ class TestSectorTableBenchmark:
         assert "AGG" not in result
         assert "Benchmark" not in result
 
-    def test_with_benchmark_agg_row_appears(self):
+    def test_with_benchmark_agg_row_appears(self, sector, agg_benchmark):
         """When benchmark provided, AGG row appears after separator."""
-        sectors = [_make_sector("XLK", "Technology", 2.1)]
-        agg = _make_agg_benchmark()
-        result = _format_sector_table(sectors, benchmark=agg)
+        result = _format_sector_table([sector], benchmark=agg_benchmark)
         assert "AGG" in result
         assert "Benchmark" in result
         # Separator line before AGG
         assert "---" in result
 
-    def test_benchmark_row_after_sectors(self):
+    def test_benchmark_row_after_sectors(self, sector, agg_benchmark):
         """AGG row comes after all sector rows."""
-        sectors = [_make_sector("XLK", "Technology", 2.1)]
-        agg = _make_agg_benchmark()
-        result = _format_sector_table(sectors, benchmark=agg)
+        result = _format_sector_table([sector], benchmark=agg_benchmark)
         lines = result.replace("<pre>", "").replace("</pre>", "").split("\n")
         # header, XLK row, separator, AGG row
         assert len(lines) == 4
         assert lines[-1].startswith("AGG")
 
-    def test_benchmark_momentum_displayed(self):
+    def test_benchmark_momentum_displayed(self, sector, agg_benchmark):
         """AGG momentum value is formatted correctly."""
-        sectors = [_make_sector()]
-        agg = _make_agg_benchmark()
-        result = _format_sector_table(sectors, benchmark=agg)
+        result = _format_sector_table([sector], benchmark=agg_benchmark)
         assert "-0.35%" in result
 
-    def test_benchmark_bmi_displayed(self):
+    def test_benchmark_bmi_displayed(self, sector, agg_benchmark):
         """AGG BMI and regime appear."""
-        sectors = [_make_sector()]
-        agg = _make_agg_benchmark()
-        result = _format_sector_table(sectors, benchmark=agg)
+        result = _format_sector_table([sector], benchmark=agg_benchmark)
         assert "48%" in result
         assert "NEUTRAL" in result
 
-    def test_benchmark_no_breadth(self):
+    def test_benchmark_no_breadth(self, sector):
         """AGG without breadth shows N/A."""
-        sectors = [_make_sector()]
         agg = SectorScore(
             etf="AGG",
             sector_name="Bonds (Benchmark)",
@@ -101,7 +108,7 @@ class TestSectorTableBenchmark:
             sector_bmi_regime=SectorBMIRegime.NEUTRAL,
             breadth=None,
         )
-        result = _format_sector_table(sectors, benchmark=agg)
+        result = _format_sector_table([sector], benchmark=agg)
         assert "AGG" in result
         assert "N/A" in result
 
@@ -1,8 +1,9 @@
 """Tests for AsyncBaseAPIClient retry logic (C7)."""
 
 import asyncio
+import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
 
@@ -18,7 +19,7 @@ def _make_response(status, json_data=None):
     """Create a mock aiohttp response as async context manager."""
     resp = MagicMock()
     resp.status = status
-    resp.json = AsyncMock(return_value=json_data)
+    resp.read = AsyncMock(return_value=json.dumps(json_data).encode())
     # Make it work as async context manager
     ctx = MagicMock()
     ctx.__aenter__ = AsyncMock(return_value=resp)
@@ -27,11 +28,12 @@ def _make_response(status, json_data=None):
 
 
 def _setup_client(max_retries=3, timeout=5):
-    """Create client with mock session properly configured."""
+    """Create client with mock session and no-op backoff sleep."""
     client = ConcreteAsyncClient(max_retries=max_retries, timeout=timeout)
     mock_session = MagicMock()
     mock_session.closed = False  # prevent _ensure_session from creating real session
     client._session = mock_session
+    client._sleep = AsyncMock()
     return client, mock_session
 
 
@@ -48,8 +50,7 @@ class TestAsyncBaseClientRetry:
             ]
         )
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await client._get("/test")
+        result = await client._get("/test")
         assert result == {"ok": True}
 
     @pytest.mark.asyncio
@@ -73,8 +74,7 @@ class TestAsyncBaseClientRetry:
             ]
         )
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await client._get("/test")
+        result = await client._get("/test")
         assert result == {"data": "ok"}
 
     @pytest.mark.asyncio
@@ -83,8 +83,7 @@ class TestAsyncBaseClientRetry:
         client, mock_session = _setup_client(max_retries=2)
         mock_session.get = MagicMock(side_effect=aiohttp.ClientConnectionError("refused"))
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await client._get("/test")
+        result = await client._get("/test")
         assert result is None
 
     @pytest.mark.asyncio
@@ -93,7 +92,7 @@ class TestAsyncBaseClientRetry:
         client, mock_session = _setup_client(max_retries=2)
         mock_session.get = MagicMock(side_effect=asyncio.TimeoutError())
 
-        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            result = await client._get("/test")
+        result = await client._get("/test")
         assert result is None
-        assert mock_sleep.call_count == 1
+        assert client._sleep.call_count == 1
+        client._sleep.assert_awaited_once_with(1.0)
@@ -1,11 +1,18 @@
 """Tests for async API clients (AsyncBaseAPIClient + provider clients)."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+import math
+from unittest.mock import AsyncMock
 
 import pytest
 
-from ifds.data.async_base import AsyncBaseAPIClient
+from ifds.data.async_base import (
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+    AsyncBaseAPIClient,
+    create_shared_session,
+)
 from ifds.data.async_clients import (
     AsyncFMPClient,
     AsyncFREDClient,
@@ -14,6 +21,57 @@ from ifds.data.async_clients import (
 )
 from ifds.models.market import APIStatus
 
+
+class _FakeResp:
+    """Minimal aiohttp response stand-in; tracks in-flight request overlap."""
+
+    def __init__(self, status=200, payload=None, delay=0.0):
+        self.status = status
+        self._payload = payload
+        self._delay = delay
+        self.active = 0
+        self.peak = 0
+
+    async def __aenter__(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.active -= 1
+        return False
+
+    async def read(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        if isinstance(self._payload, bytes):
+            return self._payload
+        return json.dumps(self._payload).encode()
+
+
+class _FakeSession:
+    """Minimal aiohttp session stand-in with a synchronous get().
+
+    ``resp`` may be an exception instance, raised from every get().
+    """
+
+    def __init__(self, resp):
+        self.resp = resp
+        self.get_calls = 0
+        self.last_kwargs: dict = {}
+        self.closed = False
+
+    def get(self, *args, **kwargs):
+        self.get_calls += 1
+        self.last_kwargs = kwargs
+        if isinstance(self.resp, BaseException):
+            raise self.resp
+        return self.resp
+
+    async def close(self):
+        self.closed = True
+
+
 # ============================================================================
 # AsyncBaseAPIClient
 # ============================================================================
@@ -30,19 +88,37 @@ class TestAsyncBaseClient:
             api_key="test",
             provider_name="test",
         )
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"results": [1, 2, 3]})
-        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_resp.__aexit__ = AsyncMock(return_value=False)
-
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_resp)
-        mock_session.closed = False
-        client._session = mock_session
+        sess = _FakeSession(_FakeResp(200, {"results": [1, 2, 3]}))
+        client._session = sess
 
         result = await client._get("/test")
         assert result == {"results": [1, 2, 3]}
+        assert sess.get_calls == 1
+        await client.close()
+        assert sess.closed
+
+    @pytest.mark.asyncio
+    async def test_get_parses_raw_body_bytes(self):
+        """_get parses the raw body bytes (orjson when installed, else stdlib)."""
+        client = AsyncBaseAPIClient(base_url="https://example.com", provider_name="test")
+        client._session = _FakeSession(_FakeResp(200, b'{"results": [{"c": 1.5}], "n": null}'))
+
+        result = await client._get("/test")
+        assert result == {"results": [{"c": 1.5}], "n": None}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_accepts_nan_literals(self):
+        """NaN/Infinity bodies parse on the first attempt, as aiohttp's resp.json() did."""
+        client = AsyncBaseAPIClient(
+            base_url="https://example.com", max_retries=3, provider_name="test"
+        )
+        sess = _FakeSession(_FakeResp(200, b'{"iv": NaN, "oi": Infinity}'))
+        client._session = sess
+
+        result = await client._get("/test")
+        assert math.isnan(result["iv"]) and result["oi"] == float("inf")
+        assert sess.get_calls == 1
         await client.close()
 
     @pytest.mark.asyncio
@@ -54,61 +130,79 @@ class TestAsyncBaseClient:
             max_retries=3,
             provider_name="test",
         )
-        mock_resp = AsyncMock()
-        mock_resp.status = 404
-        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_resp.__aexit__ = AsyncMock(return_value=False)
-
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_resp)
-        mock_session.closed = False
-        client._session = mock_session
+        sess = _FakeSession(_FakeResp(404))
+        client._session = sess
 
         result = await client._get("/missing")
         assert result is None
         # 4xx should not retry — only 1 call
-        assert mock_session.get.call_count == 1
+        assert sess.get_calls == 1
         await client.close()
 
     @pytest.mark.asyncio
-    async def test_semaphore_limits_concurrency(self):
-        """Semaphore limits concurrent requests."""
-        sem = asyncio.Semaphore(2)
+    async def test_request_timeout_policy(self):
+        """Each request carries the client's total/connect/sock_read bounds."""
         client = AsyncBaseAPIClient(
             base_url="https://example.com",
-            api_key="test",
             provider_name="test",
-            semaphore=sem,
+            timeout=10,
+            connect_timeout=3,
+            sock_read_timeout=7,
         )
+        sess = _FakeSession(_FakeResp(200, {"ok": True}))
+        client._session = sess
 
-        concurrent = 0
-        max_concurrent = 0
-
-        original_get = client._get
-
-        async def tracking_get(*args, **kwargs):
-            nonlocal concurrent, max_concurrent
-            concurrent += 1
-            max_concurrent = max(max_concurrent, concurrent)
-            await asyncio.sleep(0.01)
-            concurrent -= 1
-            return {"ok": True}
+        await client._get("/test")
+        timeout = sess.last_kwargs["timeout"]
+        assert (timeout.total, timeout.connect, timeout.sock_read) == (10, 3, 7)
+        await client.close()
 
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.json = AsyncMock(return_value={"ok": True})
-        mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
-        mock_resp.__aexit__ = AsyncMock(return_value=False)
+    @pytest.mark.asyncio
+    async def test_timeout_retries_then_returns_none(self):
+        """A stalled request times out, is retried, then gives up with None."""
+        client = AsyncBaseAPIClient(
+            base_url="https://example.com",
+            max_retries=3,
+            provider_name="test",
+        )
+        client._sleep = AsyncMock()
+        sess = _FakeSession(asyncio.TimeoutError())
+        client._session = sess
 
-        mock_session = AsyncMock()
-        mock_session.get = MagicMock(return_value=mock_resp)
-        mock_session.closed = False
-        client._session = mock_session
+        assert await client._get("/slow") is None
+        assert sess.get_calls == 3
+        await client.close()
 
-        tasks = [client._get(f"/test/{i}") for i in range(5)]
-        await asyncio.gather(*tasks)
+    @pytest.mark.asyncio
+    async def test_semaphore_limits_concurrency(self):
+        """Semaphore limits concurrent requests."""
+        sem = asyncio.BoundedSemaphore(2)
+        client = AsyncBaseAPIClient(
+            base_url="https://example.com",
+            api_key="test",
+            provider_name="test",
+            semaphore=sem,
+        )
+        resp = _FakeResp(200, {"ok": True}, delay=0.01)
+        sess = _FakeSession(resp)
+        client._session = sess
+
+        results = await asyncio.gather(*(client._get(f"/test/{i}") for i in range(5)))
+        assert results == [{"ok": True}] * 5
+        assert sess.get_calls == 5
+        assert resp.peak == 2
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_default_semaphore_rejects_over_release(self):
+        """Default semaphore is bounded — a stray release() raises."""
+        client = AsyncBaseAPIClient(base_url="https://example.com", provider_name="test")
+        assert isinstance(client._semaphore, asyncio.BoundedSemaphore)
+        async with client._semaphore:
+            pass
+        with pytest.raises(ValueError):
+            client._semaphore.release()
+
     @pytest.mark.asyncio
     async def test_close_idempotent(self):
         """Closing a client twice doesn't raise."""
@@ -119,6 +213,112 @@ class TestAsyncBaseClient:
         await client.close()  # No session yet
         await client.close()  # Still no error
 
+    @pytest.mark.asyncio
+    async def test_owned_session_connector_limits(self):
+        """Lazily-created session uses the tuned connector pool caps."""
+        client = AsyncBaseAPIClient(
+            base_url="https://example.com",
+            provider_name="test",
+            pool_limit=150,
+            limit_per_host=40,
+        )
+        session = await client._ensure_session()
+        assert session.connector.limit == 150
+        assert session.connector.limit_per_host == 40
+        await client.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_owned_session_connector_defaults(self):
+        """Default pool caps match the Polygon/FMP host concentration."""
+        client = AsyncBaseAPIClient(base_url="https://example.com", provider_name="test")
+        session = await client._ensure_session()
+        assert session.connector.limit == 200
+        assert session.connector.limit_per_host == 50
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_injected_session_shared_and_not_closed(self):
+        """Clients reuse an injected session and leave closing it to the owner."""
+        shared = create_shared_session()
+        poly = AsyncPolygonClient(api_key="k", session=shared)
+        fmp = AsyncFMPClient(api_key="k", session=shared)
+        try:
+            assert await poly._ensure_session() is shared
+            assert await fmp._ensure_session() is shared
+            await poly.close()
+            await fmp.close()
+            assert not shared.closed
+        finally:
+            await shared.close()
+        assert shared.closed
+
+    @pytest.mark.asyncio
+    async def test_shared_session_connector_limits(self):
+        """Shared session pools connections with the configured caps."""
+        shared = create_shared_session(limit=100, limit_per_host=20)
+        try:
+            assert shared.connector.limit == 100
+            assert shared.connector.limit_per_host == 20
+        finally:
+            await shared.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_and_owned_session_defaults_match(self):
+        """Injected shared sessions get the same pool caps as owned client sessions."""
+        shared = create_shared_session()
+        client = AsyncBaseAPIClient(base_url="https://example.com", provider_name="test")
+        try:
+            owned = await client._ensure_session()
+            assert shared.connector.limit == owned.connector.limit == POOL_LIMIT
+            assert (
+                shared.connector.limit_per_host
+                == owned.connector.limit_per_host
+                == POOL_LIMIT_PER_HOST
+            )
+        finally:
+            await client.close()
+            await shared.close()
+
+
+# ============================================================================
+# Provider client fixtures — one client per module, _get re-mocked per test.
+# _get is always mocked, so no aiohttp session is ever opened.
+# ============================================================================
+
+
+@pytest.fixture(scope="module")
+def poly_client():
+    return AsyncPolygonClient(api_key="test_key")
+
+
+@pytest.fixture(scope="module")
+def fmp_client():
+    return AsyncFMPClient(api_key="test_key")
+
+
+@pytest.fixture(scope="module")
+def uw_client():
+    return AsyncUWClient(api_key="test_key")
+
+
+@pytest.fixture(scope="module")
+def uw_client_no_key():
+    return AsyncUWClient(api_key=None)
+
+
+@pytest.fixture(scope="module")
+def fred_client():
+    return AsyncFREDClient(api_key="test_key")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_get(request):
+    """Give each module client a fresh _get mock for the current test."""
+    for name in ("poly_client", "fmp_client", "uw_client", "uw_client_no_key", "fred_client"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name)._get = AsyncMock()
+
 
 # ============================================================================
 # AsyncPolygonClient
@@ -128,53 +328,43 @@ class TestAsyncBaseClient:
 class TestAsyncPolygonClient:
 
     @pytest.mark.asyncio
-    async def test_get_aggregates(self):
+    async def test_get_aggregates(self, poly_client):
         """get_aggregates extracts results from response."""
-        client = AsyncPolygonClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "results": [
-                    {"o": 100, "h": 105, "l": 99, "c": 103, "v": 10000},
-                ],
-                "resultsCount": 1,
-            }
-        )
-
-        result = await client.get_aggregates("AAPL", "2026-01-01", "2026-02-01")
+        poly_client._get.return_value = {
+            "results": [
+                {"o": 100, "h": 105, "l": 99, "c": 103, "v": 10000},
+            ],
+            "resultsCount": 1,
+        }
+
+        result = await poly_client.get_aggregates("AAPL", "2026-01-01", "2026-02-01")
         assert len(result) == 1
         assert result[0]["c"] == 103
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_aggregates_returns_none_on_failure(self):
+    async def test_get_aggregates_returns_none_on_failure(self, poly_client):
         """Returns None when API returns no results."""
-        client = AsyncPolygonClient(api_key="test_key")
-        client._get = AsyncMock(return_value=None)
+        poly_client._get.return_value = None
 
-        result = await client.get_aggregates("AAPL", "2026-01-01", "2026-02-01")
+        result = await poly_client.get_aggregates("AAPL", "2026-01-01", "2026-02-01")
         assert result is None
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_options_snapshot(self):
+    async def test_get_options_snapshot(self, poly_client):
         """get_options_snapshot extracts results."""
-        client = AsyncPolygonClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "results": [{"details": {"strike_price": 150}}],
-            }
-        )
+        poly_client._get.return_value = {
+            "results": [{"details": {"strike_price": 150}}],
+        }
 
-        result = await client.get_options_snapshot("AAPL")
+        result = await poly_client.get_options_snapshot("AAPL")
         assert len(result) == 1
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_auth_headers(self):
+    async def test_auth_headers(self, poly_client):
         """Polygon uses Bearer token auth."""
-        client = AsyncPolygonClient(api_key="my_key")
-        assert client._auth_headers() == {"Authorization": "Bearer my_key"}
-        await client.close()
+        assert poly_client._auth_headers() == {"Authorization": "Bearer test_key"}
+        # Built once per client, not per request
+        assert poly_client._auth_headers() is poly_client._auth_headers()
 
 
 # ============================================================================
@@ -185,56 +375,42 @@ class TestAsyncPolygonClient:
 class TestAsyncFMPClient:
 
     @pytest.mark.asyncio
-    async def test_get_financial_growth(self):
+    async def test_get_financial_growth(self, fmp_client):
         """get_financial_growth returns first element."""
-        client = AsyncFMPClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value=[
-                {"revenueGrowth": 0.15, "epsgrowth": 0.20},
-            ]
-        )
+        fmp_client._get.return_value = [
+            {"revenueGrowth": 0.15, "epsgrowth": 0.20},
+        ]
 
-        result = await client.get_financial_growth("AAPL")
+        result = await fmp_client.get_financial_growth("AAPL")
         assert result["revenueGrowth"] == 0.15
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_key_metrics(self):
+    async def test_get_key_metrics(self, fmp_client):
         """get_key_metrics returns first element."""
-        client = AsyncFMPClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value=[
-                {"roeTTM": 0.25, "debtToEquityTTM": 1.5},
-            ]
-        )
+        fmp_client._get.return_value = [
+            {"roeTTM": 0.25, "debtToEquityTTM": 1.5},
+        ]
 
-        result = await client.get_key_metrics("AAPL")
+        result = await fmp_client.get_key_metrics("AAPL")
         assert result["roeTTM"] == 0.25
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_insider_trading(self):
+    async def test_get_insider_trading(self, fmp_client):
         """get_insider_trading returns list."""
-        client = AsyncFMPClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value=[
-                {"transactionDate": "2026-01-15", "acquistionOrDisposition": "A"},
-            ]
-        )
+        fmp_client._get.return_value = [
+            {"transactionDate": "2026-01-15", "acquistionOrDisposition": "A"},
+        ]
 
-        result = await client.get_insider_trading("AAPL")
+        result = await fmp_client.get_insider_trading("AAPL")
         assert len(result) == 1
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_empty(self):
+    async def test_returns_none_on_empty(self, fmp_client):
         """Returns None when API returns empty list."""
-        client = AsyncFMPClient(api_key="test_key")
-        client._get = AsyncMock(return_value=[])
+        fmp_client._get.return_value = []
 
-        result = await client.get_financial_growth("AAPL")
+        result = await fmp_client.get_financial_growth("AAPL")
         assert result is None
-        await client.close()
 
 
 # ============================================================================
@@ -245,58 +421,44 @@ class TestAsyncFMPClient:
 class TestAsyncUWClient:
 
     @pytest.mark.asyncio
-    async def test_get_dark_pool(self):
+    async def test_get_dark_pool(self, uw_client):
         """get_dark_pool returns data from response."""
-        client = AsyncUWClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "data": [{"ticker": "AAPL", "size": 10000}],
-            }
-        )
+        uw_client._get.return_value = {
+            "data": [{"ticker": "AAPL", "size": 10000}],
+        }
 
-        result = await client.get_dark_pool("AAPL")
+        result = await uw_client.get_dark_pool("AAPL")
         assert len(result) == 1
         assert result[0]["size"] == 10000
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_returns_none_without_key(self):
+    async def test_returns_none_without_key(self, uw_client_no_key):
         """Returns None if no API key configured."""
-        client = AsyncUWClient(api_key=None)
-        result = await client.get_dark_pool("AAPL")
+        result = await uw_client_no_key.get_dark_pool("AAPL")
         assert result is None
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_greeks(self):
+    async def test_get_greeks(self, uw_client):
         """get_greeks unwraps data field."""
-        client = AsyncUWClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "data": [{"call_gamma": 1500.0, "put_gamma": 800.0}],
-            }
-        )
+        uw_client._get.return_value = {
+            "data": [{"call_gamma": 1500.0, "put_gamma": 800.0}],
+        }
 
-        result = await client.get_greeks("AAPL")
+        result = await uw_client.get_greeks("AAPL")
         assert result["call_gamma"] == 1500.0
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_auth_headers(self):
+    async def test_auth_headers(self, uw_client):
         """UW uses Bearer + User-Agent."""
-        client = AsyncUWClient(api_key="my_key")
-        headers = client._auth_headers()
-        assert headers["Authorization"] == "Bearer my_key"
+        headers = uw_client._auth_headers()
+        assert headers["Authorization"] == "Bearer test_key"
         assert headers["User-Agent"] == "PythonClient"
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_health_skipped_without_key(self):
+    async def test_health_skipped_without_key(self, uw_client_no_key):
         """Health check returns SKIPPED without API key."""
-        client = AsyncUWClient(api_key=None)
-        result = await client.check_health()
+        result = await uw_client_no_key.check_health()
         assert result.status == APIStatus.SKIPPED
-        await client.close()
 
 
 # ============================================================================
@@ -307,40 +469,30 @@ class TestAsyncUWClient:
 class TestAsyncFREDClient:
 
     @pytest.mark.asyncio
-    async def test_get_vix(self):
+    async def test_get_vix(self, fred_client):
         """get_vix extracts observations."""
-        client = AsyncFREDClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "observations": [{"date": "2026-02-07", "value": "17.80"}],
-            }
-        )
+        fred_client._get.return_value = {
+            "observations": [{"date": "2026-02-07", "value": "17.80"}],
+        }
 
-        result = await client.get_vix(limit=1)
+        result = await fred_client.get_vix(limit=1)
         assert len(result) == 1
         assert result[0]["value"] == "17.80"
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_get_tnx(self):
+    async def test_get_tnx(self, fred_client):
         """get_tnx extracts observations."""
-        client = AsyncFREDClient(api_key="test_key")
-        client._get = AsyncMock(
-            return_value={
-                "observations": [{"date": "2026-02-07", "value": "4.21"}],
-            }
-        )
+        fred_client._get.return_value = {
+            "observations": [{"date": "2026-02-07", "value": "4.21"}],
+        }
 
-        result = await client.get_tnx(limit=1)
+        result = await fred_client.get_tnx(limit=1)
         assert result[0]["value"] == "4.21"
-        await client.close()
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_missing_observations(self):
+    async def test_returns_none_on_missing_observations(self, fred_client):
         """Returns None when no observations key."""
-        client = AsyncFREDClient(api_key="test_key")
-        client._get = AsyncMock(return_value={})
+        fred_client._get.return_value = {}
 
-        result = await client.get_series("VIXCLS")
+        result = await fred_client.get_series("VIXCLS")
         assert result is None
-        await client.close()
@@ -1,12 +1,15 @@
 """Tests for async Phase 4 and Phase 5 code paths."""
 
 import asyncio
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ifds.config.loader import Config
 from ifds.events.logger import EventLogger
+from ifds.events.types import EventType
 from ifds.models.market import (
     GEXAnalysis,
     GEXRegime,
@@ -27,16 +30,33 @@ from ifds.phases.phase4_stocks import (
     _run_phase4_async,
 )
 from ifds.phases.phase5_gex import _run_phase5_async
+from tests._log_utils import read_events
+
+
+@pytest.fixture(scope="session")
+def config():
+    """One Config per session — per worker under pytest-xdist (as in production: one per run).
+
+    Env is patched only while Config() reads it — keys are captured at
+    construction. Tests here must not mutate it (copy.deepcopy first).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("IFDS_POLYGON_API_KEY", "test_poly")
+        mp.setenv("IFDS_FMP_API_KEY", "test_fmp")
+        mp.setenv("IFDS_FRED_API_KEY", "test_fred")
+        mp.setenv("IFDS_ASYNC_ENABLED", "true")
+        mp.delenv("IFDS_UW_API_KEY", raising=False)
+        return Config()
 
 
 @pytest.fixture
-def config(monkeypatch):
-    monkeypatch.setenv("IFDS_POLYGON_API_KEY", "test_poly")
-    monkeypatch.setenv("IFDS_FMP_API_KEY", "test_fmp")
-    monkeypatch.setenv("IFDS_FRED_API_KEY", "test_fred")
-    monkeypatch.setenv("IFDS_ASYNC_ENABLED", "true")
-    monkeypatch.delenv("IFDS_UW_API_KEY", raising=False)
-    return Config()
+def clients(monkeypatch):
+    """Swap the async provider clients for one AsyncMock each per test."""
+    poly, fmp, uw = AsyncMock(), AsyncMock(), AsyncMock()
+    monkeypatch.setattr("ifds.data.async_clients.AsyncPolygonClient", lambda **kw: poly)
+    monkeypatch.setattr("ifds.data.async_clients.AsyncFMPClient", lambda **kw: fmp)
+    monkeypatch.setattr("ifds.data.async_clients.AsyncUWClient", lambda **kw: uw)
+    return SimpleNamespace(poly=poly, fmp=fmp, uw=uw)
 
 
 @pytest.fixture
@@ -44,13 +64,19 @@ def logger(tmp_path):
     return EventLogger(log_dir=str(tmp_path), run_id="test-async")
 
 
+@lru_cache(maxsize=32)
+def _bars_template(count, base_price, volume):
+    closes = [base_price + i * 0.1 for i in range(count)]
+    return tuple({"o": c, "h": c + 2, "l": c - 2, "c": c, "v": volume} for c in closes)
+
+
 def _make_bars(count=210, base_price=100, volume=1000):
-    """Create mock OHLCV bars (uptrend by default)."""
-    bars = []
-    for i in range(count):
-        c = base_price + i * 0.1
-        bars.append({"o": c, "h": c + 2, "l": c - 2, "c": c, "v": volume})
-    return bars
+    """Create mock OHLCV bars (uptrend by default).
+
+    Built once per shape; each call returns fresh dict copies so tests can
+    mutate ``bars[-1]`` freely.
+    """
+    return [dict(b) for b in _bars_template(count, base_price, volume)]
 
 
 def _make_tickers(count=3, sector="Technology"):
@@ -157,7 +183,7 @@ class TestPhase4Async:
     """Test the async Phase 4 code path."""
 
     @pytest.mark.asyncio
-    async def test_async_phase4_basic(self, config, logger):
+    async def test_async_phase4_basic(self, config, logger, clients):
         """Async Phase 4 processes tickers concurrently."""
         bars = _make_bars(210, base_price=100)
         bars[-1]["c"] = 200  # Above SMA200
@@ -166,50 +192,40 @@ class TestPhase4Async:
         tickers = _make_tickers(2)
         sectors = _make_sector_scores()
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncFMPClient") as MockFMP,
-            patch("ifds.data.async_clients.AsyncUWClient"),
-        ):
-
-            mock_poly = AsyncMock()
-            mock_poly.get_aggregates = AsyncMock(return_value=bars)
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
-
-            mock_fmp = AsyncMock()
-            mock_fmp.get_financial_growth = AsyncMock(
-                return_value={
-                    "revenueGrowth": 0.15,
-                    "epsgrowth": 0.20,
-                }
-            )
-            mock_fmp.get_key_metrics = AsyncMock(
-                return_value={
-                    "roeTTM": 0.20,
-                    "debtToEquityTTM": 0.3,
-                }
-            )
-            mock_fmp.get_insider_trading = AsyncMock(return_value=[])
-            mock_fmp.close = AsyncMock()
-            MockFMP.return_value = mock_fmp
+        mock_poly = clients.poly
+        mock_poly.get_aggregates = AsyncMock(return_value=bars)
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            result = await _run_phase4_async(
-                config,
-                logger,
-                tickers,
-                sectors,
-                StrategyMode.LONG,
-            )
+        mock_fmp = clients.fmp
+        mock_fmp.get_financial_growth = AsyncMock(
+            return_value={
+                "revenueGrowth": 0.15,
+                "epsgrowth": 0.20,
+            }
+        )
+        mock_fmp.get_key_metrics = AsyncMock(
+            return_value={
+                "roeTTM": 0.20,
+                "debtToEquityTTM": 0.3,
+            }
+        )
+        mock_fmp.get_insider_trading = AsyncMock(return_value=[])
+
+        result = await _run_phase4_async(
+            config,
+            logger,
+            tickers,
+            sectors,
+            StrategyMode.LONG,
+        )
 
-            assert len(result.analyzed) == 2
-            # 3 calls: 1 SPY + 2 tickers
-            assert mock_poly.get_aggregates.await_count == 3
-            assert mock_poly.close.await_count == 1
+        assert len(result.analyzed) == 2
+        # 3 calls: 1 SPY + 2 tickers
+        assert mock_poly.get_aggregates.await_count == 3
+        assert mock_poly.close.await_count == 1
 
     @pytest.mark.asyncio
-    async def test_async_phase4_tech_filter(self, config, logger):
+    async def test_async_phase4_tech_filter(self, config, logger, clients):
         """Tickers failing SMA200 are filtered in async path."""
         # Downtrend: price below SMA200
         bars = _make_bars(210, base_price=200)
@@ -218,57 +234,62 @@ class TestPhase4Async:
         tickers = _make_tickers(1)
         sectors = _make_sector_scores()
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncFMPClient") as MockFMP,
-        ):
-
-            mock_poly = AsyncMock()
-            mock_poly.get_aggregates = AsyncMock(return_value=bars)
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
+        mock_poly = clients.poly
+        mock_poly.get_aggregates = AsyncMock(return_value=bars)
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            mock_fmp = AsyncMock()
-            mock_fmp.close = AsyncMock()
-            MockFMP.return_value = mock_fmp
-
-            result = await _run_phase4_async(
-                config,
-                logger,
-                tickers,
-                sectors,
-                StrategyMode.LONG,
-            )
+        result = await _run_phase4_async(
+            config,
+            logger,
+            tickers,
+            sectors,
+            StrategyMode.LONG,
+        )
 
-            assert result.tech_filter_count == 1
-            assert len(result.passed) == 0
-            # FMP should NOT be called if tech filter fails
-            mock_fmp.get_financial_growth.assert_not_awaited()
+        assert result.tech_filter_count == 1
+        assert len(result.passed) == 0
+        # FMP should NOT be called if tech filter fails
+        clients.fmp.get_financial_growth.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_async_phase4_insufficient_data(self, config, logger):
+    async def test_async_phase4_insufficient_data(self, config, logger, clients):
         """Tickers with insufficient bars are skipped."""
         bars = _make_bars(10)  # Only 10 bars (need 50)
 
         tickers = _make_tickers(1)
         sectors = _make_sector_scores()
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncFMPClient") as MockFMP,
-        ):
+        mock_poly = clients.poly
+        mock_poly.get_aggregates = AsyncMock(return_value=bars)
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            mock_poly = AsyncMock()
-            mock_poly.get_aggregates = AsyncMock(return_value=bars)
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
+        result = await _run_phase4_async(
+            config,
+            logger,
+            tickers,
+            sectors,
+            StrategyMode.LONG,
+        )
 
-            mock_fmp = AsyncMock()
-            mock_fmp.close = AsyncMock()
-            MockFMP.return_value = mock_fmp
+        assert len(result.analyzed) == 0
 
+    @pytest.mark.asyncio
+    async def test_async_phase4_streams_results_in_completion_order(self, config, logger, clients):
+        """Fast tickers are booked before a slow one; output keeps input order."""
+        bars = _make_bars(210, base_price=200)
+        bars[-1]["c"] = 50  # Below SMA200 → tech_filter, no FMP calls needed
+
+        tickers = _make_tickers(3)
+        sectors = _make_sector_scores()
+
+        async def aggregates(symbol, *args, **kwargs):
+            if symbol == "TICK0":
+                await asyncio.sleep(0.2)
+            return bars
+
+        clients.poly.get_aggregates = AsyncMock(side_effect=aggregates)
+
+        with patch.object(logger, "log", wraps=logger.log) as spy_log:
             result = await _run_phase4_async(
                 config,
                 logger,
@@ -277,10 +298,17 @@ class TestPhase4Async:
                 StrategyMode.LONG,
             )
 
-            assert len(result.analyzed) == 0
+        booked = [
+            c.kwargs["data"]["ticker"]
+            for c in spy_log.call_args_list
+            if c.args and c.args[0] == EventType.TICKER_FILTERED
+        ]
+        assert sorted(booked[:2]) == ["TICK1", "TICK2"]
+        assert booked[2] == "TICK0"
+        assert [a.ticker for a in result.analyzed] == ["TICK0", "TICK1", "TICK2"]
 
     @pytest.mark.asyncio
-    async def test_async_phase4_fmp_exception(self, config, logger):
+    async def test_async_phase4_fmp_exception(self, config, logger, clients):
         """FMP exception is logged and treated as None — ticker still scored."""
         bars = _make_bars(210, base_price=100)
         bars[-1]["c"] = 200  # Above SMA200
@@ -289,58 +317,88 @@ class TestPhase4Async:
         tickers = _make_tickers(1)
         sectors = _make_sector_scores()
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncFMPClient") as MockFMP,
-            patch("ifds.data.async_clients.AsyncUWClient"),
-        ):
-
-            mock_poly = AsyncMock()
-            mock_poly.get_aggregates = AsyncMock(return_value=bars)
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
-
-            mock_fmp = AsyncMock()
-            mock_fmp.get_financial_growth = AsyncMock(
-                side_effect=ConnectionError("FMP down"),
-            )
-            mock_fmp.get_key_metrics = AsyncMock(
-                side_effect=TimeoutError("FMP timeout"),
-            )
-            mock_fmp.get_insider_trading = AsyncMock(return_value=[])
-            mock_fmp.close = AsyncMock()
-            MockFMP.return_value = mock_fmp
+        mock_poly = clients.poly
+        mock_poly.get_aggregates = AsyncMock(return_value=bars)
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            result = await _run_phase4_async(
-                config,
-                logger,
-                tickers,
-                sectors,
-                StrategyMode.LONG,
-            )
+        mock_fmp = clients.fmp
+        mock_fmp.get_financial_growth = AsyncMock(
+            side_effect=ConnectionError("FMP down"),
+        )
+        mock_fmp.get_key_metrics = AsyncMock(
+            side_effect=TimeoutError("FMP timeout"),
+        )
+        mock_fmp.get_insider_trading = AsyncMock(return_value=[])
+
+        result = await _run_phase4_async(
+            config,
+            logger,
+            tickers,
+            sectors,
+            StrategyMode.LONG,
+        )
 
-            # Ticker should still be analyzed (with None growth/metrics)
-            assert len(result.analyzed) == 1
-            analysis = result.analyzed[0]
-            assert analysis.fundamental.revenue_growth_yoy is None
-            assert analysis.fundamental.roe is None
-            # funda_score = 0 when all metrics are None
-            assert analysis.fundamental.funda_score == 0
-
-            # Verify exceptions were logged
-            log_file = logger.log_file
-            import json
-
-            events = []
-            with open(log_file) as f:
-                for line in f:
-                    ev = json.loads(line)
-                    if ev.get("event_type") == "API_ERROR":
-                        events.append(ev)
-            assert len(events) == 2  # growth + metrics failed
-            assert "FMP down" in events[0]["message"]
-            assert "FMP timeout" in events[1]["message"]
+        # Ticker should still be analyzed (with None growth/metrics)
+        assert len(result.analyzed) == 1
+        analysis = result.analyzed[0]
+        assert analysis.fundamental.revenue_growth_yoy is None
+        assert analysis.fundamental.roe is None
+        # funda_score = 0 when all metrics are None
+        assert analysis.fundamental.funda_score == 0
+
+        # Verify exceptions were logged
+        events = read_events(logger, "API_ERROR")
+        assert len(events) == 2  # growth + metrics failed
+        assert "FMP down" in events[0]["message"]
+        assert "FMP timeout" in events[1]["message"]
+
+    @pytest.mark.asyncio
+    async def test_async_phase4_fmp_calls_are_concurrent(self, config, logger, clients):
+        """Growth/metrics/insider overlap per ticker and across tickers."""
+        bars = _make_bars(210, base_price=100)
+        bars[-1]["c"] = 200  # Above SMA200
+        bars[-1]["v"] = 3000
+
+        tickers = _make_tickers(5)
+        sectors = _make_sector_scores()
+
+        in_flight = 0
+        peak = 0
+        started = 0
+        started_before_first_end: int | None = None
+
+        async def slow_fmp(symbol):
+            nonlocal in_flight, peak, started, started_before_first_end
+            started += 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            if started_before_first_end is None:
+                started_before_first_end = started
+            return None
+
+        mock_poly = clients.poly
+        mock_poly.get_aggregates = AsyncMock(return_value=bars)
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
+
+        mock_fmp = clients.fmp
+        mock_fmp.get_financial_growth = AsyncMock(side_effect=slow_fmp)
+        mock_fmp.get_key_metrics = AsyncMock(side_effect=slow_fmp)
+        mock_fmp.get_insider_trading = AsyncMock(side_effect=slow_fmp)
+
+        result = await _run_phase4_async(
+            config,
+            logger,
+            tickers,
+            sectors,
+            StrategyMode.LONG,
+        )
+
+        assert len(result.analyzed) == 5
+        assert peak == 15  # 5 tickers x 3 FMP calls all in flight together
+        # Ordering, not wall time: every call started before the first finished
+        assert started_before_first_end == 15
 
 
 # ============================================================================
@@ -375,33 +433,26 @@ class TestPhase5Async:
         return analyses
 
     @pytest.mark.asyncio
-    async def test_async_phase5_basic(self, config, logger):
+    async def test_async_phase5_basic(self, config, logger, clients):
         """Async Phase 5 processes GEX concurrently."""
         stocks = self._make_stock_analyses(3)
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncUWClient"),
-        ):
-
-            mock_poly = AsyncMock()
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
+        mock_poly = clients.poly
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            result = await _run_phase5_async(
-                config,
-                logger,
-                stocks,
-                StrategyMode.LONG,
-            )
+        result = await _run_phase5_async(
+            config,
+            logger,
+            stocks,
+            StrategyMode.LONG,
+        )
 
-            # All 3 should pass with POSITIVE default (no GEX data)
-            assert len(result.passed) == 3
-            assert all(g.gex_regime == GEXRegime.POSITIVE for g in result.passed)
+        # All 3 should pass with POSITIVE default (no GEX data)
+        assert len(result.passed) == 3
+        assert all(g.gex_regime == GEXRegime.POSITIVE for g in result.passed)
 
     @pytest.mark.asyncio
-    async def test_async_phase5_with_gex_data(self, config, logger):
+    async def test_async_phase5_with_gex_data(self, config, logger, clients):
         """Async Phase 5 correctly classifies GEX regimes."""
         stocks = self._make_stock_analyses(1)
 
@@ -414,46 +465,58 @@ class TestPhase5Async:
             }
         ]
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncUWClient"),
-        ):
+        mock_poly = clients.poly
+        mock_poly.get_options_snapshot = AsyncMock(return_value=mock_options)
 
-            mock_poly = AsyncMock()
-            mock_poly.get_options_snapshot = AsyncMock(return_value=mock_options)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
+        result = await _run_phase5_async(
+            config,
+            logger,
+            stocks,
+            StrategyMode.LONG,
+        )
 
-            result = await _run_phase5_async(
-                config,
-                logger,
-                stocks,
-                StrategyMode.LONG,
-            )
+        assert len(result.analyzed) == 1
+        assert result.analyzed[0].data_source == "polygon_calculated"
 
-            assert len(result.analyzed) == 1
-            assert result.analyzed[0].data_source == "polygon_calculated"
+    @pytest.mark.asyncio
+    async def test_async_phase5_one_failure_does_not_cancel_siblings(self, config, logger, clients):
+        """A raising GEX fetch is contained; the other tickers still complete."""
+        stocks = self._make_stock_analyses(3)
+        fetched: list[str] = []
+
+        async def snapshot(ticker, *args, **kwargs):
+            if ticker == "TICK2":  # highest score → first task
+                raise ConnectionError("Polygon reset")
+            await asyncio.sleep(0.01)
+            fetched.append(ticker)
+            return None
+
+        clients.poly.get_options_snapshot = AsyncMock(side_effect=snapshot)
+
+        result = await _run_phase5_async(
+            config,
+            logger,
+            stocks,
+            StrategyMode.LONG,
+        )
+
+        assert sorted(fetched) == ["TICK0", "TICK1"]
+        assert len(result.analyzed) == 3
+        assert {g.data_source for g in result.analyzed} == {"none"}
 
     @pytest.mark.asyncio
-    async def test_async_phase5_cleanup(self, config, logger):
+    async def test_async_phase5_cleanup(self, config, logger, clients):
         """Async Phase 5 closes clients even on success."""
         stocks = self._make_stock_analyses(1)
 
-        with (
-            patch("ifds.data.async_clients.AsyncPolygonClient") as MockPoly,
-            patch("ifds.data.async_clients.AsyncUWClient"),
-        ):
-
-            mock_poly = AsyncMock()
-            mock_poly.get_options_snapshot = AsyncMock(return_value=None)
-            mock_poly.close = AsyncMock()
-            MockPoly.return_value = mock_poly
+        mock_poly = clients.poly
+        mock_poly.get_options_snapshot = AsyncMock(return_value=None)
 
-            await _run_phase5_async(
-                config,
-                logger,
-                stocks,
-                StrategyMode.LONG,
-            )
+        await _run_phase5_async(
+            config,
+            logger,
+            stocks,
+            StrategyMode.LONG,
+        )
 
-            mock_poly.close.assert_awaited_once()
+        mock_poly.close.assert_awaited_once()
@@ -1,9 +1,12 @@
 """Tests for atomic file write helpers (F-16/17)."""
 
 import json
+import math
+from datetime import date
+
 import pytest
 
-from ifds.utils.io import atomic_write_json
+from ifds.utils.io import atomic_write_json, json_dumps, json_loads
 
 
 class TestAtomicWriteJson:
@@ -37,6 +40,73 @@ class TestAtomicWriteJson:
         atomic_write_json(path, [{"a": 1}, {"b": 2}])
         assert json.loads(path.read_text()) == [{"a": 1}, {"b": 2}]
 
+    def test_unicode_and_int_keys(self, tmp_path):
+        path = tmp_path / "keys.json"
+        atomic_write_json(path, {"név": "Ő", 7: [1.5, None]})
+        assert json.loads(path.read_text(encoding="utf-8")) == {"név": "Ő", "7": [1.5, None]}
+
+    def test_huge_int_falls_back_to_stdlib(self, tmp_path):
+        path = tmp_path / "big.json"
+        atomic_write_json(path, {"n": 2**70})
+        assert json.loads(path.read_text()) == {"n": 2**70}
+
+    def test_unserializable_leaves_original(self, tmp_path):
+        path = tmp_path / "keep.json"
+        path.write_text('{"original": true}')
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"bad": object()})
+        assert json.loads(path.read_text()) == {"original": True}
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("ifds.utils.io.orjson", None)
+    return request.param
+
+
+class TestAtomicWriteJsonParity:
+    """State files read back the same whether or not orjson is installed."""
+
+    def test_non_finite_floats_round_trip(self, tmp_path, json_backend):
+        path = tmp_path / "state.json"
+        atomic_write_json(path, {"atr": float("nan"), "trail_sl": [float("inf"), 1.5]})
+        data = json.loads(path.read_text())
+        assert math.isnan(data["atr"])
+        assert data["trail_sl"] == [float("inf"), 1.5]
+
+    def test_date_value_raises(self, tmp_path, json_backend):
+        path = tmp_path / "state.json"
+        path.write_text('{"original": true}')
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"entry_date": date(2026, 1, 2)})
+        assert json.loads(path.read_text()) == {"original": True}
+
+
+class TestJsonLoads:
+
+    def test_nan_literals_accepted(self, json_backend):
+        data = json_loads(b'{"a": NaN, "b": -Infinity, "c": [1]}')
+        assert math.isnan(data["a"]) and data["b"] == float("-inf") and data["c"] == [1]
+
+    def test_invalid_raises_stdlib_error(self, json_backend):
+        with pytest.raises(json.JSONDecodeError):
+            json_loads(b"<html>502</html>")
+
+
+class TestJsonDumps:
+
+    def test_compact_round_trip_matches_stdlib(self, json_backend):
+        payload = [{"symbol": "AAPL", "market_cap": float("nan"), "sector": "Tech"}]
+        raw = json_dumps(payload)
+        assert b"\n" not in raw
+        data = json_loads(raw)
+        assert data[0]["symbol"] == "AAPL" and math.isnan(data[0]["market_cap"])
+
 
 try:
     import pandas as pd
@@ -1,10 +1,14 @@
 """Tests for BaseAPIClient retry logic (C6)."""
 
+import http.client
+import math
+
 import pytest
 from unittest.mock import MagicMock, patch
 import requests
+from requests.cookies import MockRequest, MockResponse
 
-from ifds.data.base import BaseAPIClient
+from ifds.data.base import BaseAPIClient, close_shared_sessions
 
 
 class ConcreteClient(BaseAPIClient):
@@ -12,29 +16,45 @@ class ConcreteClient(BaseAPIClient):
         super().__init__(base_url="https://api.example.com", **kwargs)
 
 
+@pytest.fixture(scope="module")
+def client():
+    """One stateless client (session + pooled adapter) shared by the module.
+
+    Tests only swap ``client._session.get`` via ``patch.object``, which is
+    restored on exit; tests needing other settings build their own.
+    """
+    c = ConcreteClient(max_retries=3, timeout=5)
+    yield c
+    c.close()
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    """No-op backoff for every test: records requested sleeps; jitter draws its lower bound."""
+    calls: list[float] = []
+    monkeypatch.setattr("time.sleep", calls.append)
+    monkeypatch.setattr("random.uniform", lambda a, b: a)
+    return calls
+
+
 class TestBaseClientRetry:
 
-    def test_retry_on_500_then_success(self):
+    def test_retry_on_500_then_success(self, client):
         """Retry on 5xx, succeed on 2nd attempt."""
-        client = ConcreteClient(max_retries=3, timeout=5)
         mock_resp_500 = MagicMock()
         mock_resp_500.status_code = 500
         mock_resp_500.raise_for_status.side_effect = requests.HTTPError(response=mock_resp_500)
         mock_resp_200 = MagicMock()
         mock_resp_200.status_code = 200
         mock_resp_200.raise_for_status.return_value = None
-        mock_resp_200.json.return_value = {"ok": True}
+        mock_resp_200.content = b'{"ok": true}'
 
-        with (
-            patch.object(client._session, "get", side_effect=[mock_resp_500, mock_resp_200]),
-            patch("time.sleep"),
-        ):
+        with patch.object(client._session, "get", side_effect=[mock_resp_500, mock_resp_200]):
             result = client._get("/test")
         assert result == {"ok": True}
 
-    def test_no_retry_on_404(self):
+    def test_no_retry_on_404(self, client):
         """4xx (except 429) — no retry, immediate return None."""
-        client = ConcreteClient(max_retries=3, timeout=5)
         mock_resp = MagicMock()
         mock_resp.status_code = 404
         mock_resp.raise_for_status.side_effect = requests.HTTPError(response=mock_resp)
@@ -44,43 +64,150 @@ class TestBaseClientRetry:
         assert result is None
         assert mock_get.call_count == 1  # no retry
 
-    def test_retry_on_429_rate_limit(self):
+    def test_retry_on_429_rate_limit(self, client):
         """429 rate limit triggers retry."""
-        client = ConcreteClient(max_retries=3, timeout=5)
         mock_resp_429 = MagicMock()
         mock_resp_429.status_code = 429
         mock_resp_429.raise_for_status.side_effect = requests.HTTPError(response=mock_resp_429)
         mock_resp_200 = MagicMock()
         mock_resp_200.status_code = 200
         mock_resp_200.raise_for_status.return_value = None
-        mock_resp_200.json.return_value = {"ok": True}
+        mock_resp_200.content = b'{"ok": true}'
 
-        with (
-            patch.object(client._session, "get", side_effect=[mock_resp_429, mock_resp_200]),
-            patch("time.sleep"),
-        ):
+        with patch.object(client._session, "get", side_effect=[mock_resp_429, mock_resp_200]):
             result = client._get("/test")
         assert result == {"ok": True}
 
-    def test_all_retries_exhausted_returns_none(self):
+    def test_all_retries_exhausted_returns_none(self, client):
         """All retries fail → return None, no exception raised."""
-        client = ConcreteClient(max_retries=3, timeout=5)
-        with (
-            patch.object(
-                client._session, "get", side_effect=requests.exceptions.ConnectionError("refused")
-            ),
-            patch("time.sleep"),
+        with patch.object(
+            client._session, "get", side_effect=requests.exceptions.ConnectionError("refused")
         ):
             result = client._get("/test")
         assert result is None
 
-    def test_timeout_triggers_retry(self):
+    def test_timeout_triggers_retry(self, sleeps):
         """Timeout triggers retry up to max_retries."""
         client = ConcreteClient(max_retries=2, timeout=5)
+        with patch.object(client._session, "get", side_effect=requests.exceptions.Timeout()):
+            result = client._get("/test")
+        assert result is None
+        assert sleeps == [1.0]  # one sleep, between attempt 1 and 2 (jitter → lower bound)
+
+
+class TestBaseClientRetryClassification:
+
+    @staticmethod
+    def _error_resp(status):
+        resp = MagicMock()
+        resp.status_code = status
+        resp.raise_for_status.side_effect = requests.HTTPError(response=resp)
+        return resp
+
+    @pytest.mark.parametrize("status", [408, 425, 429, 500, 502, 503, 504])
+    def test_retries_transient_statuses(self, client, status):
+        with patch.object(
+            client._session, "get", return_value=self._error_resp(status)
+        ) as mock_get:
+            assert client._get("/test") is None
+        assert mock_get.call_count == 3
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404, 422, 501, 505])
+    def test_fails_fast_on_other_statuses(self, client, status):
+        with patch.object(
+            client._session, "get", return_value=self._error_resp(status)
+        ) as mock_get:
+            assert client._get("/test") is None
+        assert mock_get.call_count == 1
+
+
+class TestBaseClientSession:
+
+    def test_parses_raw_body_bytes(self):
+        """_get decodes resp.content (orjson when installed, else stdlib json)."""
+        client = ConcreteClient(max_retries=1, timeout=5)
+        mock_resp = MagicMock()
+        mock_resp.content = '{"results": [{"c": 1.5}], "name": "caf\u00e9", "n": null}'.encode()
+        with patch.object(client._session, "get", return_value=mock_resp):
+            result = client._get("/test")
+        assert result == {"results": [{"c": 1.5}], "name": "café", "n": None}
+
+    def test_nan_literal_body_parses_like_stdlib(self):
+        """NaN/Infinity literals (rejected by orjson) still parse on the first attempt."""
+        client = ConcreteClient(max_retries=3, timeout=5)
+        mock_resp = MagicMock()
+        mock_resp.content = b'{"iv": NaN, "oi": Infinity, "n": 1}'
+        with patch.object(client._session, "get", return_value=mock_resp) as mock_get:
+            result = client._get("/test")
+        assert mock_get.call_count == 1
+        assert math.isnan(result["iv"])
+        assert result["oi"] == float("inf") and result["n"] == 1
+
+    def test_invalid_json_body_is_retried_then_none(self):
+        client = ConcreteClient(max_retries=2, timeout=5)
+        mock_resp = MagicMock()
+        mock_resp.content = b"<html>502 Bad Gateway</html>"
+        with patch.object(client._session, "get", return_value=mock_resp) as mock_get:
+            assert client._get("/test") is None
+        assert mock_get.call_count == 2
+
+    def test_session_reused_across_calls(self):
+        """One pooled adapter per client, persisting across requests."""
+        client = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=16)
+        adapter = client._session.get_adapter("https://api.example.com/test")
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 0  # our retry loop is authoritative
+
+        mock_resp = MagicMock()
+        mock_resp.content = b'{"ok": true}'
+        with patch.object(client._session, "get", return_value=mock_resp):
+            assert client._get("/a") == {"ok": True}
+            assert client._get("/b") == {"ok": True}
+        assert client._session.get_adapter("https://api.example.com/x") is adapter
+
+    def test_session_shared_per_host_and_survives_close(self):
+        """Clients for the same host share one pooled session across close()."""
+        first = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=8)
+        first.close()
+        second = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=8)
+        assert second._session is first._session
+        other = BaseAPIClient(base_url="https://other.example.com", pool_maxsize=8)
+        assert other._session is not first._session
+
+    def test_close_shared_sessions_releases_and_replaces(self):
+        first = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=4)
+        with patch.object(first._session, "close", wraps=first._session.close) as mock_close:
+            close_shared_sessions()
+        mock_close.assert_called_once()
+        second = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=4)
+        assert second._session is not first._session
+
+    def test_shared_session_refuses_cookies(self):
+        """No Set-Cookie from one client's response can ride along on another's."""
+        client = ConcreteClient(max_retries=1, timeout=5, pool_maxsize=4)
+        headers = http.client.HTTPMessage()
+        headers["Set-Cookie"] = "sid=abc; Path=/"
+        req = requests.Request("GET", "https://api.example.com/x").prepare()
+        client._session.cookies.extract_cookies(MockResponse(headers), MockRequest(req))
+        assert len(client._session.cookies) == 0
+
+
+class TestBaseClientBackoff:
+
+    def test_decorrelated_jitter_bounds_and_cap(self, sleeps):
+        """Each delay is drawn from [base, prev*3] and capped at max_delay."""
+        client = ConcreteClient(max_retries=5, timeout=5, base_delay=1.0, max_delay=10.0)
         with (
             patch.object(client._session, "get", side_effect=requests.exceptions.Timeout()),
-            patch("time.sleep") as mock_sleep,
+            patch("random.uniform", side_effect=lambda a, b: b) as mock_uniform,
         ):
-            result = client._get("/test")
-        assert result is None
-        assert mock_sleep.call_count == 1  # sleep between attempt 1 and 2
+            client._get("/test")
+        bounds = [c.args for c in mock_uniform.call_args_list]
+        assert bounds == [(1.0, 3.0), (1.0, 9.0), (1.0, 27.0), (1.0, 30.0)]
+        assert sleeps == [3.0, 9.0, 10.0, 10.0]
+
+    def test_no_jitter_is_plain_exponential(self, sleeps):
+        client = ConcreteClient(max_retries=4, timeout=5, base_delay=0.5, jitter=False)
+        with patch.object(client._session, "get", side_effect=requests.exceptions.Timeout()):
+            client._get("/test")
+        assert sleeps == [0.5, 1.0, 2.0]
@@ -7,11 +7,15 @@ from unittest.mock import MagicMock, AsyncMock, patch
 
 from ifds.data.adapters import (
     _aggregate_dp_records,
+    _aggregate_dp_trades,
+    _DPTrade,
+    _group_dp_page,
     UWBatchDarkPoolProvider,
     UWDarkPoolProvider,
 )
 from ifds.data.async_adapters import AsyncUWBatchDarkPoolProvider
 from ifds.events.logger import EventLogger
+from tests._fakes import FakeUWClient
 
 
 @pytest.fixture
@@ -101,6 +105,67 @@ class TestAggregateDpRecords:
         assert result["dp_pct"] == 0.0
         assert result["total_volume"] == 0
 
+    def test_unparseable_fields_count_as_zero(self):
+        """None / malformed numerics are treated as 0, like _safe_int/_safe_float."""
+        records = [
+            {"size": None, "price": "10.0", "nbbo_ask": "10.5", "nbbo_bid": "9.5"},
+            {"size": "1.5", "price": "10.0", "premium": "n/a", "volume": "bad"},
+            {"size": "100", "price": "x", "nbbo_ask": "10.5", "nbbo_bid": "9.5"},
+            {"size": "200", "price": "10.0", "nbbo_ask": "10.5", "nbbo_bid": None},
+            {"size": 300, "price": 10.0, "nbbo_ask": 10.5, "nbbo_bid": 9.5, "premium": 3000},
+        ]
+        result = _aggregate_dp_records(records)
+        assert result["dp_volume"] == 600
+        assert result["dp_volume_dollars"] == 3000.0
+        assert result["total_volume"] == 0
+        assert result["dp_buys"] == 300  # only the fully-numeric record is classified
+        assert result["dp_sells"] == 0
+
+    def test_large_batch_matches_per_record_sum(self):
+        """Aggregating many records equals summing the single-record results."""
+        records = [
+            {
+                "size": str(100 + i),
+                "price": f"{100 + (i % 7) * 0.01:.2f}",
+                "nbbo_ask": "100.05",
+                "nbbo_bid": "100.01",
+                "premium": str((100 + i) * 100),
+                "market_center": "ABC"[i % 3],
+            }
+            for i in range(500)
+        ]
+        result = _aggregate_dp_records(records)
+        singles = [_aggregate_dp_records([r]) for r in records]
+        assert result["dp_volume"] == sum(r["dp_volume"] for r in singles)
+        assert result["dp_buys"] == sum(r["dp_buys"] for r in singles)
+        assert result["dp_sells"] == sum(r["dp_sells"] for r in singles)
+        assert result["venue_entropy"] == pytest.approx(1.0986, abs=1e-3)
+
+
+class TestGroupDpPage:
+    def test_groups_normalized_trades_across_pages(self):
+        cache: dict = {}
+        a1 = {"ticker": "AAPL", "size": "100", "price": "10.5", "market_center": "L"}
+        n1 = {"ticker": "NVDA", "size": "7", "nbbo_ask": None}
+        a2 = {"ticker": "AAPL", "size": "bad", "premium": "1050.0"}
+        _group_dp_page(cache, [a1, n1])
+        _group_dp_page(cache, [a2, {"ticker": ""}, {"size": "5"}])
+        assert list(cache) == ["AAPL", "NVDA"]
+        assert cache["AAPL"] == [
+            _DPTrade(100, 0.0, 0, 10.5, "L", 0.0, 0.0),
+            _DPTrade(0, 1050.0, 0, 0.0, "UNKNOWN", 0.0, 0.0),
+        ]
+        assert cache["NVDA"][0].size == 7
+
+    def test_trades_aggregate_like_records(self):
+        records = [
+            {"size": "500", "price": "150.50", "nbbo_ask": "150.30", "nbbo_bid": "150.10"},
+            {"size": "300", "price": "150.01", "nbbo_ask": "150.15", "nbbo_bid": "150.05"},
+        ]
+        cache: dict = {}
+        _group_dp_page(cache, [dict(r, ticker="SPY") for r in records])
+        assert _aggregate_dp_trades(cache["SPY"]) == _aggregate_dp_records(records)
+
 
 # ============================================================================
 # UWBatchDarkPoolProvider — sync batch provider
@@ -126,7 +191,6 @@ class TestUWBatchDarkPoolProvider:
 
     def test_prefetch_groups_by_ticker(self, logger):
         """3 tickers mixed → correct grouping."""
-        client = MagicMock()
         page1 = self._make_records(
             [
                 ("AAPL", 100, "2026-02-09T10:00:00"),
@@ -135,7 +199,7 @@ class TestUWBatchDarkPoolProvider:
                 ("TSLA", 300, "2026-02-09T10:03:00"),
             ]
         )
-        client.get_dark_pool_recent.side_effect = [page1, []]
+        client = FakeUWClient([page1])
 
         provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
         provider.prefetch()
@@ -148,14 +212,13 @@ class TestUWBatchDarkPoolProvider:
 
     def test_get_dark_pool_from_cache(self, logger):
         """After prefetch, returns aggregated data for cached ticker."""
-        client = MagicMock()
         page1 = self._make_records(
             [
                 ("SPY", 500, "2026-02-09T10:00:00"),
                 ("SPY", 300, "2026-02-09T10:01:00"),
             ]
         )
-        client.get_dark_pool_recent.side_effect = [page1, []]
+        client = FakeUWClient([page1])
 
         provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
         provider.prefetch()
@@ -165,6 +228,53 @@ class TestUWBatchDarkPoolProvider:
         assert result["dp_volume"] == 800
         assert result["signal"] == "BULLISH"
 
+    def test_aggregate_memoised_per_ticker(self, logger):
+        """Repeat lookups reuse the aggregate; a new prefetch drops it."""
+        client = MagicMock()
+        page1 = self._make_records([("SPY", 500, "2026-02-09T10:00:00")])
+        page2 = self._make_records([("SPY", 300, "2026-02-09T11:00:00")])
+        client.get_dark_pool_recent.side_effect = [page1, [], page2, []]
+
+        provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
+        provider.prefetch()
+        with patch(
+            "ifds.data.adapters._aggregate_dp_trades", wraps=_aggregate_dp_trades
+        ) as mock_agg:
+            first = provider.get_dark_pool("SPY")
+            second = provider.get_dark_pool("SPY")
+        assert second is first
+        assert mock_agg.call_count == 1
+
+        provider.prefetch()
+        assert provider.get_dark_pool("SPY")["dp_volume"] == 300
+
+    def test_dedupe_page_overlap(self, logger):
+        """A trade repeated at the page boundary is counted once."""
+        client = MagicMock()
+        page1 = self._make_records(
+            [("SPY", 500, "2026-02-09T10:01:00"), ("SPY", 300, "2026-02-09T10:00:00")]
+        )
+        page2 = self._make_records(
+            [("SPY", 300, "2026-02-09T10:00:00"), ("SPY", 200, "2026-02-09T09:59:00")]
+        )
+        client.get_dark_pool_recent.side_effect = [page1, page2, []]
+
+        provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
+        provider.prefetch()
+
+        assert len(provider._cache["SPY"]) == 3
+        assert provider.get_dark_pool("SPY")["dp_volume"] == 1000
+
+    def test_identical_fills_within_a_page_are_kept(self, logger):
+        client = MagicMock()
+        page1 = self._make_records([("SPY", 100, "ts1"), ("SPY", 100, "ts1")])
+        client.get_dark_pool_recent.side_effect = [page1, []]
+
+        provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
+        provider.prefetch()
+
+        assert provider.get_dark_pool("SPY")["dp_volume"] == 200
+
     def test_cache_miss_returns_none(self, logger):
         """Ticker not in cache → None."""
         client = MagicMock()
@@ -206,15 +316,11 @@ class TestUWBatchDarkPoolProvider:
 
     def test_stops_on_empty_page(self, logger):
         """Empty response → stop pagination."""
-        client = MagicMock()
-        client.get_dark_pool_recent.side_effect = [
-            self._make_records([("AAPL", 100, "ts1")]),
-            [],
-        ]
+        client = FakeUWClient([self._make_records([("AAPL", 100, "ts1")]), []])
         provider = UWBatchDarkPoolProvider(client, logger=logger, max_pages=10, page_delay=0)
         provider.prefetch()
 
-        assert client.get_dark_pool_recent.call_count == 2
+        assert client.calls == 2
 
     def test_max_pages_respected(self, logger):
         """Stops after max_pages even if data keeps coming."""
@@ -241,6 +347,41 @@ class TestUWBatchDarkPoolProvider:
         assert result["dp_volume"] == 500
         assert provider._prefetched is True
 
+    def test_disk_cache_hit_skips_api(self, logger, tmp_path):
+        """A fresh on-disk prefetch is reused by the next provider instance."""
+        page1 = self._make_records([("SPY", 500, "ts2"), ("QQQ", 300, "ts1")])
+        first = UWBatchDarkPoolProvider(
+            FakeUWClient([page1]), logger=logger, page_delay=0, cache_dir=tmp_path
+        )
+        first.prefetch(date="2026-02-09")
+        assert (tmp_path / "dp_2026-02-09.json").exists()
+
+        client = MagicMock()
+        second = UWBatchDarkPoolProvider(client, logger=logger, page_delay=0, cache_dir=tmp_path)
+        second.prefetch(date="2026-02-09")
+
+        assert client.get_dark_pool_recent.call_count == 0
+        assert second.get_dark_pool("SPY") == first.get_dark_pool("SPY")
+        assert second.get_dark_pool("QQQ")["dp_volume"] == 300
+        assert "(disk cache)" in logger.events[-1]["message"]
+
+    def test_disk_cache_expired_or_corrupt_refetches(self, logger, tmp_path):
+        path = tmp_path / "dp_2026-02-09.json"
+        path.write_text("{not json")
+        client = FakeUWClient([self._make_records([("SPY", 100, "ts1")])])
+        provider = UWBatchDarkPoolProvider(client, logger=logger, page_delay=0, cache_dir=tmp_path)
+        provider.prefetch(date="2026-02-09")
+        assert client.calls == 2
+        assert provider.get_dark_pool("SPY")["dp_volume"] == 100
+
+        client = FakeUWClient([])
+        stale = UWBatchDarkPoolProvider(
+            client, logger=logger, page_delay=0, cache_dir=tmp_path, cache_ttl_s=-1
+        )
+        stale.prefetch(date="2026-02-09")
+        assert client.calls == 1
+        assert stale.get_dark_pool("SPY") is None
+
     def test_provider_name(self):
         """Returns 'unusual_whales_batch'."""
         client = MagicMock()
@@ -340,6 +481,19 @@ class TestAsyncUWBatchDarkPoolProvider:
         assert result is not None
         assert result["dp_volume"] == 800
 
+    @pytest.mark.asyncio
+    async def test_dedupe_page_overlap(self, logger):
+        """Async: a trade repeated at the page boundary is counted once."""
+        client = AsyncMock()
+        page1 = self._make_records([("SPY", 500, "ts2"), ("SPY", 300, "ts1")])
+        page2 = self._make_records([("SPY", 300, "ts1"), ("SPY", 200, "ts0")])
+        client.get_dark_pool_recent.side_effect = [page1, page2, []]
+
+        provider = AsyncUWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0)
+        await provider.prefetch()
+
+        assert (await provider.get_dark_pool("SPY"))["dp_volume"] == 1000
+
     @pytest.mark.asyncio
     async def test_cache_miss_returns_none(self, logger):
         """Async: ticker not in cache → None."""
@@ -365,6 +519,62 @@ class TestAsyncUWBatchDarkPoolProvider:
         assert result["dp_volume"] == 1000
         assert provider._prefetched is True
 
+    @pytest.mark.asyncio
+    async def test_page_delay_overlaps_request_time(self, logger):
+        """page_delay spaces request starts — the round-trip counts toward it."""
+        pages = [
+            self._make_records([("AAPL", 100, "ts3")]),
+            self._make_records([("NVDA", 200, "ts2")]),
+            self._make_records([("TSLA", 300, "ts1")]),
+            [],
+        ]
+
+        async def slow_page(**kwargs):
+            await asyncio.sleep(0.05)  # simulated RTT
+            return pages.pop(0)
+
+        client = MagicMock()
+        client.get_dark_pool_recent = AsyncMock(side_effect=slow_page)
+        provider = AsyncUWBatchDarkPoolProvider(client, logger=logger, max_pages=5, page_delay=0.5)
+        sleeps: list[float] = []
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+
+        provider._sleep = record_sleep
+        await provider.prefetch()
+
+        assert client.get_dark_pool_recent.call_count == 4
+        assert len(sleeps) == 3
+        assert all(0 < d <= 0.5 - 0.04 for d in sleeps)
+        assert set(provider._cache) == {"AAPL", "NVDA", "TSLA"}
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_shared_with_sync_provider(self, logger, tmp_path):
+        """Async: reuses a prefetch persisted by the sync provider, and vice versa."""
+        page1 = self._make_records([("SPY", 500, "ts2"), ("QQQ", 300, "ts1")])
+        sync_first = UWBatchDarkPoolProvider(
+            FakeUWClient([page1]), logger=logger, page_delay=0, cache_dir=tmp_path
+        )
+        sync_first.prefetch(date="2026-02-09")
+
+        client = AsyncMock()
+        provider = AsyncUWBatchDarkPoolProvider(
+            client, logger=logger, page_delay=0, cache_dir=tmp_path
+        )
+        await provider.prefetch(date="2026-02-09")
+        assert client.get_dark_pool_recent.await_count == 0
+        assert await provider.get_dark_pool("SPY") == sync_first.get_dark_pool("SPY")
+        assert "(disk cache)" in logger.events[-1]["message"]
+
+        client = AsyncMock()
+        client.get_dark_pool_recent.side_effect = [page1, []]
+        writer = AsyncUWBatchDarkPoolProvider(
+            client, logger=logger, page_delay=0, cache_dir=tmp_path
+        )
+        await writer.prefetch(date="2026-02-10")
+        assert (tmp_path / "dp_2026-02-10.json").exists()
+
     def test_provider_name(self):
         """Returns 'unusual_whales_batch'."""
         client = AsyncMock()
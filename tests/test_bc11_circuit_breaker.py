@@ -5,7 +5,6 @@
 2. BaseAPIClient integration with circuit breaker
 """
 
-import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +13,25 @@ import requests
 from ifds.data.circuit_breaker import CBState, ProviderCircuitBreaker
 from ifds.data.base import BaseAPIClient
 
+
+class FakeClock:
+    """Monotonic clock stand-in: tests advance time instead of sleeping."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
 # ============================================================================
 # TestProviderCircuitBreaker — State Machine
 # ============================================================================
@@ -82,9 +100,9 @@ class TestProviderCircuitBreaker:
         assert cb.state == CBState.OPEN
         assert cb.allow_request() is False
 
-    def test_cooldown_transitions_to_half_open(self):
+    def test_cooldown_transitions_to_half_open(self, clock):
         """After cooldown expires, OPEN → HALF_OPEN."""
-        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.1)
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.1, clock=clock)
         # Trip the breaker
         for _ in range(7):
             cb.record_success()
@@ -93,31 +111,31 @@ class TestProviderCircuitBreaker:
         assert cb.state == CBState.OPEN
 
         # Wait for cooldown
-        time.sleep(0.15)
+        clock.advance(0.15)
         assert cb.state == CBState.HALF_OPEN
         assert cb.allow_request() is True
 
-    def test_half_open_success_closes(self):
+    def test_half_open_success_closes(self, clock):
         """Successful probe in HALF_OPEN → CLOSED."""
-        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05)
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05, clock=clock)
         for _ in range(7):
             cb.record_success()
         for _ in range(3):
             cb.record_failure()
-        time.sleep(0.1)
+        clock.advance(0.1)
         assert cb.state == CBState.HALF_OPEN
 
         cb.record_success()
         assert cb.state == CBState.CLOSED
 
-    def test_half_open_failure_reopens(self):
+    def test_half_open_failure_reopens(self, clock):
         """Failed probe in HALF_OPEN → OPEN again."""
-        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05)
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05, clock=clock)
         for _ in range(7):
             cb.record_success()
         for _ in range(3):
             cb.record_failure()
-        time.sleep(0.1)
+        clock.advance(0.1)
         assert cb.state == CBState.HALF_OPEN
 
         cb.record_failure()
@@ -142,25 +160,95 @@ class TestProviderCircuitBreaker:
             cb.record_failure()
         assert cb.state == CBState.OPEN
 
-        # Reset to HALF_OPEN via cooldown trick
+        # Force CLOSED so the window keeps recording
         cb._state = CBState.CLOSED
-        cb._results.clear()
 
-        # Fill with 10 successes (old failures evicted)
-        for _ in range(10):
+        # Each success evicts one failure until the window is all successes
+        for i in range(1, 11):
             cb.record_success()
-        assert cb.error_rate == 0.0
+            assert cb.error_rate == pytest.approx((10 - i) / 10)
+        assert cb.call_count == 10
 
     def test_provider_property(self):
         cb = ProviderCircuitBreaker("polygon")
         assert cb.provider == "polygon"
 
+    def test_concurrent_records_keep_window_consistent(self):
+        """Racing threads neither lose ring updates nor double-open the breaker."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cb = ProviderCircuitBreaker("fmp", window_size=1000, threshold=0.99)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i in range(800):
+                pool.submit(cb.record_failure if i % 2 else cb.record_success)
+        assert cb.call_count == 800
+        assert cb.error_rate == 0.5
+        assert cb.state == CBState.CLOSED
+
+    def test_half_open_admits_single_probe(self, clock):
+        """Only one of many concurrent callers gets the HALF_OPEN probe."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05, clock=clock)
+        for _ in range(10):
+            cb.record_failure()
+        clock.advance(0.1)
+        assert cb.state == CBState.HALF_OPEN
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            admitted = list(pool.map(lambda _: cb.allow_request(), range(32)))
+        assert admitted.count(True) == 1
+
+        cb.record_success()
+        assert cb.state == CBState.CLOSED
+        assert cb.allow_request() is True
+
+    def test_failed_probe_releases_permit_after_next_cooldown(self, clock):
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05, clock=clock)
+        for _ in range(10):
+            cb.record_failure()
+        clock.advance(0.1)
+        assert cb.allow_request() is True
+        cb.record_failure()
+        assert cb.allow_request() is False  # OPEN again
+
+        clock.advance(0.1)
+        assert cb.allow_request() is True  # fresh permit for the new probe
+        assert cb.allow_request() is False
+
+    def test_is_open_does_not_take_probe_permit(self, clock):
+        cb = ProviderCircuitBreaker("fmp", threshold=0.3, cooldown_seconds=0.05, clock=clock)
+        for _ in range(10):
+            cb.record_failure()
+        assert cb.is_open() is True
+        clock.advance(0.1)
+        assert cb.is_open() is False  # HALF_OPEN
+        assert cb.is_open() is False
+        assert cb.allow_request() is True  # permit still free for the probe
+        assert cb.is_open() is False
+
+    def test_transition_is_compare_and_set(self):
+        cb = ProviderCircuitBreaker("fmp")
+        assert cb._transition(CBState.OPEN, CBState.HALF_OPEN) is False
+        assert cb.state == CBState.CLOSED
+        assert cb._transition(CBState.CLOSED, CBState.OPEN) is True
+        assert cb._transition(CBState.CLOSED, CBState.OPEN) is False
+
 
 # ============================================================================
 # TestBaseClientCircuitBreaker — Integration
 # ============================================================================
 
 
+@pytest.fixture(scope="module")
+def ok_response():
+    """One canned 200 response shared by the success-path tests."""
+    resp = MagicMock()
+    resp.content = b'{"data": "ok"}'
+    resp.raise_for_status.return_value = None
+    return resp
+
+
 class TestBaseClientCircuitBreaker:
     """Test BaseAPIClient integration with circuit breaker."""
 
@@ -168,6 +256,7 @@ class TestBaseClientCircuitBreaker:
         """When circuit breaker is OPEN, _get() returns None immediately."""
         cb = MagicMock()
         cb.allow_request.return_value = False
+        cb.note_rejection.return_value = 1  # first refusal of the episode
 
         client = BaseAPIClient(
             base_url="https://example.com",
@@ -181,7 +270,101 @@ class TestBaseClientCircuitBreaker:
         captured = capsys.readouterr()
         assert "[CIRCUIT BREAKER]" in captured.err
 
-    def test_get_records_success(self):
+    def test_open_breaker_reports_once_per_episode(self, capsys):
+        """Thousands of refusals → one stderr line until the breaker transitions."""
+        cb = ProviderCircuitBreaker("test", window_size=10, threshold=0.5)
+        for _ in range(10):
+            cb.record_failure()
+        client = BaseAPIClient(
+            base_url="https://example.com", provider_name="test", circuit_breaker=cb
+        )
+        for _ in range(1000):
+            assert client._get("/test") is None
+        assert capsys.readouterr().err.count("[CIRCUIT BREAKER]") == 1
+
+        assert cb._transition(CBState.OPEN, CBState.HALF_OPEN)
+        assert cb._transition(CBState.HALF_OPEN, CBState.OPEN)  # failed probe
+        client._get("/test")
+        assert capsys.readouterr().err.count("[CIRCUIT BREAKER]") == 1
+
+    def test_open_breaker_skips_network(self):
+        """A tripped real breaker short-circuits before any HTTP call."""
+        cb = ProviderCircuitBreaker("test", window_size=10, threshold=0.5)
+        for _ in range(10):
+            cb.record_failure()
+        assert cb.state == CBState.OPEN
+
+        client = BaseAPIClient(
+            base_url="https://example.com", provider_name="test", circuit_breaker=cb
+        )
+        with patch.object(client._session, "get") as mock_get:
+            assert client._get("/test") is None
+        assert mock_get.call_count == 0
+
+    def test_breaker_tripping_mid_retry_stops_retries(self):
+        """If the breaker opens while a request is failing, no further retries/sleeps."""
+        cb = ProviderCircuitBreaker("test", window_size=10, threshold=0.5)
+        client = BaseAPIClient(
+            base_url="https://example.com",
+            provider_name="test",
+            max_retries=3,
+            circuit_breaker=cb,
+        )
+
+        def fail_and_trip(*args, **kwargs):
+            for _ in range(10):  # sibling threads' failures
+                cb.record_failure()
+            raise requests.exceptions.Timeout()
+
+        with (
+            patch.object(client._session, "get", side_effect=fail_and_trip) as mock_get,
+            patch("time.sleep") as mock_sleep,
+        ):
+            assert client._get("/test") is None
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_half_open_probe_retries_after_failed_attempt(self, clock, ok_response):
+        """The probe keeps its retries: its own permit must not end the retry loop."""
+        cb = ProviderCircuitBreaker(
+            "test", window_size=10, threshold=0.5, cooldown_seconds=0.05, clock=clock
+        )
+        for _ in range(10):
+            cb.record_failure()
+        clock.advance(0.1)
+        assert cb.state == CBState.HALF_OPEN
+
+        client = BaseAPIClient(
+            base_url="https://example.com",
+            provider_name="test",
+            max_retries=3,
+            circuit_breaker=cb,
+        )
+        with (
+            patch.object(
+                client._session,
+                "get",
+                side_effect=[requests.exceptions.Timeout(), ok_response],
+            ) as mock_get,
+            patch("time.sleep"),
+        ):
+            assert client._get("/test") == {"data": "ok"}
+        assert mock_get.call_count == 2
+        assert cb.state == CBState.CLOSED
+
+    def test_half_open_rejection_reports_actual_state(self, clock, capsys):
+        cb = ProviderCircuitBreaker("test", window_size=10, threshold=0.5, clock=clock)
+        for _ in range(10):
+            cb.record_failure()
+        clock.advance(120)
+        assert cb.allow_request() is True  # another caller holds the probe
+        client = BaseAPIClient(
+            base_url="https://example.com", provider_name="test", circuit_breaker=cb
+        )
+        assert client._get("/test") is None
+        assert "test HALF_OPEN — skipping /test" in capsys.readouterr().err
+
+    def test_get_records_success(self, ok_response):
         """Successful _get() records success on circuit breaker."""
         cb = MagicMock()
         cb.allow_request.return_value = True
@@ -191,11 +374,8 @@ class TestBaseClientCircuitBreaker:
             provider_name="test",
             circuit_breaker=cb,
         )
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"data": "ok"}
-        mock_resp.raise_for_status.return_value = None
 
-        with patch.object(client._session, "get", return_value=mock_resp):
+        with patch.object(client._session, "get", return_value=ok_response):
             result = client._get("/test")
 
         assert result == {"data": "ok"}
@@ -219,7 +399,7 @@ class TestBaseClientCircuitBreaker:
         assert result is None
         cb.record_failure.assert_called_once()
 
-    def test_get_works_without_circuit_breaker(self):
+    def test_get_works_without_circuit_breaker(self, ok_response):
         """Backwards compat: _get() works fine with no circuit breaker."""
         client = BaseAPIClient(
             base_url="https://example.com",
@@ -227,11 +407,7 @@ class TestBaseClientCircuitBreaker:
         )
         assert client._circuit_breaker is None
 
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {"ok": True}
-        mock_resp.raise_for_status.return_value = None
-
-        with patch.object(client._session, "get", return_value=mock_resp):
+        with patch.object(client._session, "get", return_value=ok_response):
             result = client._get("/test")
 
-        assert result == {"ok": True}
+        assert result == {"data": "ok"}
@@ -6,6 +6,7 @@
 3. GlobalGuard exposure log formatting
 """
 
+import hashlib
 import json
 import os
 from datetime import date
@@ -51,7 +52,7 @@ def logger(tmp_path):
 
 
 class TestSignalDedup:
-    """Test SHA256-based signal deduplication."""
+    """Test BLAKE2b-based signal deduplication."""
 
     def test_no_duplicate_first_call(self, tmp_path):
         dedup = SignalDedup(str(tmp_path / "hashes.json"))
@@ -95,7 +96,52 @@ class TestSignalDedup:
         with open(path) as f:
             data = json.load(f)
         assert data["date"] == date.today().isoformat()
-        assert len(data["hashes"]) == 1
+        assert data["hashes"] == [SignalDedup._compute_hash("AAPL", "BUY")]
+
+    def test_save_skips_when_clean(self, tmp_path):
+        """save() only writes when record() added something new."""
+        path = tmp_path / "hashes.json"
+        dedup = SignalDedup(str(path))
+        dedup.save()
+        assert not path.exists()
+
+        dedup.record("AAPL", "BUY")
+        dedup.save(durable=True)
+        assert json.loads(path.read_text())["hashes"]
+        path.write_text("sentinel")  # any rewrite would replace this
+
+        dedup.record("AAPL", "BUY")  # already known → still clean
+        dedup.save()
+        assert path.read_text() == "sentinel"
+
+    def test_load_legacy_dict_format(self, tmp_path):
+        """Pre-upgrade {sha256_prefix: ticker} files still dedup today's signals."""
+        path = str(tmp_path / "hashes.json")
+        today = date.today().isoformat()
+
+        def sha_key(ticker, direction):
+            return hashlib.sha256(f"{ticker}|{direction}|{today}".encode()).hexdigest()[:16]
+
+        legacy = {
+            "date": today,
+            "hashes": {
+                sha_key("AAPL", "BUY"): "AAPL",
+                sha_key("TSLA", "SELL_SHORT"): "TSLA",
+                sha_key("MSFT", "BUY"): "NVDA",  # ticker does not match the key
+                "zz": "BAD",
+                "0x12345678abcdef": "BAD",
+                "abc123": "SHORT",
+            },
+        }
+        with open(path, "w") as f:
+            json.dump(legacy, f)
+
+        dedup = SignalDedup(path)
+        assert dedup.count == 2
+        assert dedup.is_duplicate("AAPL", "BUY") is True
+        assert dedup.is_duplicate("AAPL", "SELL_SHORT") is False
+        assert dedup.is_duplicate("TSLA", "SELL_SHORT") is True
+        assert dedup.is_duplicate("MSFT", "BUY") is False
 
     def test_ttl_cleanup_old_date(self, tmp_path):
         """Hashes from a different date are discarded on load."""
@@ -110,11 +156,44 @@ class TestSignalDedup:
         dedup = SignalDedup(path)
         assert dedup.count == 0  # Old hashes discarded
 
+    def test_stale_mtime_skips_parse(self, tmp_path):
+        """A file last written before today is ignored without being parsed."""
+        path = tmp_path / "hashes.json"
+        dedup = SignalDedup(str(path))
+        dedup.record("AAPL", "BUY")
+        dedup.save()
+        yesterday = path.stat().st_mtime - 86_400
+        os.utime(path, (yesterday, yesterday))
+
+        with patch("ifds.data.signal_dedup.json.load") as mock_load:
+            assert SignalDedup(str(path)).count == 0
+        mock_load.assert_not_called()
+
+    def test_day_fixed_per_instance(self, tmp_path, monkeypatch):
+        """A run straddling midnight keeps hashing and saving under its start day."""
+        from datetime import timedelta
+
+        path = tmp_path / "hashes.json"
+        dedup = SignalDedup(str(path))
+        dedup.record("AAPL", "BUY")
+        start_day = date.today().isoformat()
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+
+        monkeypatch.setattr("ifds.data.signal_dedup.date", Tomorrow)
+        assert dedup.is_duplicate("AAPL", "BUY") is True
+        dedup.record("MSFT", "BUY")
+        dedup.save()
+        assert json.loads(path.read_text())["date"] == start_day
+
     def test_hash_format(self):
         """Hash is 16-char hex string."""
         h = SignalDedup._compute_hash("AAPL", "BUY")
         assert len(h) == 16
-        assert all(c in "0123456789abcdef" for c in h)
+        assert h == h.lower() and int(h, 16) >= 0
 
     def test_count_property(self, tmp_path):
         dedup = SignalDedup(str(tmp_path / "hashes.json"))
@@ -176,6 +255,13 @@ class TestVIXSanityCheck:
         assert valid is False
         assert vix == 20.0
 
+    @pytest.mark.parametrize("bad", [float("nan"), float("inf")])
+    def test_vix_non_finite(self, logger, bad):
+        """NaN/Inf fail the single range comparison → default, no extra branch."""
+        vix, valid = _validate_vix(bad, "polygon", logger)
+        assert valid is False
+        assert vix == 20.0
+
 
 # ============================================================================
 # TestGlobalGuardLogging
@@ -6,14 +6,17 @@ Interpolation, Fat Finger Protection, VIX EXTREME, Institutional Ownership.
 
 import math
 from datetime import date, timedelta
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from ifds.config.loader import Config
 from ifds.data.adapters import (
     PolygonGEXProvider,
+    _calculate_polygon_gex,
     _find_zero_gamma,
+    _zero_gamma_from_sorted,
 )
 from ifds.events.logger import EventLogger
 from ifds.models.market import (
@@ -29,12 +32,17 @@ from ifds.models.market import (
 )
 from ifds.phases.phase0_diagnostics import _classify_vix, _calculate_vix_multiplier
 from ifds.phases.phase4_stocks import _analyze_fundamental_from_data
+from ifds.phases.phase5_gex import _filter_call_wall
 from ifds.phases.phase6_sizing import _calculate_position
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
+# GEX tests call _calculate_gex directly, so the provider's client is never
+# used: a bare namespace (any access raises AttributeError) beats a MagicMock.
+_NO_CLIENT = SimpleNamespace()
+
 
 @pytest.fixture
 def config(monkeypatch):
@@ -134,6 +142,11 @@ class TestZeroGammaInterpolation:
         result = _find_zero_gamma({})
         assert result == 0.0
 
+    def test_presorted_items_match_dict_entry_point(self):
+        """GEX builders sort once and call the pair-based helper directly."""
+        gex = {110.0: 12.0, 90.0: -5.0, 100.0: -3.0}
+        assert _zero_gamma_from_sorted(sorted(gex.items())) == _find_zero_gamma(gex)
+
 
 # ============================================================================
 # TestFrontMonthFilter
@@ -143,9 +156,9 @@ class TestZeroGammaInterpolation:
 class TestFrontMonthFilter:
     """Test DTE filter in PolygonGEXProvider._calculate_gex()."""
 
-    def _make_option(self, strike, gamma, oi, spot, ctype, exp_days_from_now):
+    def _make_option(self, strike, gamma, oi, spot, ctype, exp_days_from_now, today=None):
         """Create a mock option dict."""
-        exp_date = (date.today() + timedelta(days=exp_days_from_now)).isoformat()
+        exp_date = ((today or date.today()) + timedelta(days=exp_days_from_now)).isoformat()
         return {
             "details": {
                 "strike_price": strike,
@@ -159,7 +172,7 @@ class TestFrontMonthFilter:
 
     def test_dte_filter_excludes_far_options(self):
         """Options >35 DTE excluded from GEX calc (when ≥5 near contracts remain)."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=35)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
         # 5 near contracts + 1 far → filter keeps 5 near (≥5 threshold met)
         nears = [self._make_option(100 + i, 0.05, 1000, 100, "call", 20) for i in range(5)]
         far = self._make_option(200, 0.10, 5000, 100, "call", 60)
@@ -171,14 +184,14 @@ class TestFrontMonthFilter:
 
     def test_dte_filter_keeps_near_options(self):
         """Options ≤35 DTE included."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=35)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
         nears = [self._make_option(100 + i, 0.05, 1000, 100, "call", 10 + i) for i in range(6)]
         result = provider._calculate_gex("TEST", nears, max_dte=35)
         assert len(result["gex_by_strike"]) == 6
 
     def test_dte_filter_fallback_few_contracts(self):
         """DTE filter leaves <5 contracts → fallback to all contracts."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=35)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
         # Only 2 near + 3 far → filtered = 2 near (<5) → fallback to all 5
         nears = [self._make_option(100 + i, 0.05, 1000, 100, "call", 20) for i in range(2)]
         fars = [self._make_option(200 + i, 0.05, 1000, 100, "call", 60) for i in range(3)]
@@ -186,9 +199,28 @@ class TestFrontMonthFilter:
         # All 5 contracts used (fallback)
         assert len(result["gex_by_strike"]) == 5
 
+    def test_explicit_today_anchors_dte(self):
+        """A caller-supplied ``today`` is used for DTE instead of the wall clock."""
+        anchor = date(2020, 1, 2)
+        nears = [self._make_option(100 + i, 0.05, 1000, 100, "call", 5, anchor) for i in range(5)]
+        far = self._make_option(200, 0.05, 1000, 100, "call", 60, anchor)
+        result = _calculate_polygon_gex(nears + [far], max_dte=35, today=anchor)
+        assert [e["strike"] for e in result["gex_by_strike"]] == [100, 101, 102, 103, 104]
+
+    def test_open_interest_falls_back_to_day_block(self):
+        """Contracts without a snapshot OI use day.open_interest instead."""
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
+        snap = self._make_option(100, 0.05, 1000, 100, "call", 10)
+        day = self._make_option(105, 0.05, 1000, 100, "call", 10)
+        del day["open_interest"]
+        day["day"] = {"open_interest": 1000}
+        result = provider._calculate_gex("TEST", [snap, day], max_dte=35)
+        gex = {e["strike"]: e["gex"] for e in result["gex_by_strike"]}
+        assert gex[100] == gex[105] > 0
+
     def test_dte_zero_disables_filter(self):
         """max_dte=0 includes all options."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=0)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=0)
         near = self._make_option(100, 0.05, 1000, 100, "call", 20)
         far = self._make_option(105, 0.10, 5000, 100, "call", 200)
         result = provider._calculate_gex("TEST", [near, far], max_dte=0)
@@ -196,7 +228,7 @@ class TestFrontMonthFilter:
 
     def test_no_expiration_included(self):
         """Missing expiration_date field → include the option."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=35)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
         # 5 contracts with no expiration → all pass DTE filter → ≥5 threshold met
         opts = [
             {
@@ -210,6 +242,22 @@ class TestFrontMonthFilter:
         result = provider._calculate_gex("TEST", opts, max_dte=35)
         assert len(result["gex_by_strike"]) == 5
 
+    def test_bad_expiration_included_and_sync_async_agree(self):
+        """Unparseable expiration → included; sync and async share one kernel."""
+        from ifds.data.async_adapters import AsyncPolygonGEXProvider
+
+        opts = [self._make_option(100 + i, 0.05, 1000, 100, "call", 20) for i in range(3)]
+        opts += [self._make_option(90 + i, 0.04, 800, 100, "put", 60) for i in range(2)]
+        bad = self._make_option(120, 0.02, 500, 100, "put", 10)
+        bad["details"]["expiration_date"] = "not-a-date"
+        opts += [bad, dict(bad)]  # repeated expiration string hits the parse cache
+
+        sync_result = PolygonGEXProvider(_NO_CLIENT)._calculate_gex("TEST", opts, max_dte=35)
+        async_result = AsyncPolygonGEXProvider(_NO_CLIENT)._calculate_gex("TEST", opts, max_dte=35)
+        assert sync_result == async_result
+        strikes = [e["strike"] for e in sync_result["gex_by_strike"]]
+        assert strikes == [100, 101, 102, 120]  # far puts dropped, bad date kept
+
 
 # ============================================================================
 # TestCallWallATRFilter
@@ -219,51 +267,28 @@ class TestFrontMonthFilter:
 class TestCallWallATRFilter:
     """Test call wall ATR distance filter in Phase 5."""
 
+    def _filtered(self, config, call_wall, price=150.0, atr=3.0):
+        stock = _make_stock(price=price, atr=atr)
+        max_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
+        return _filter_call_wall(call_wall, stock.technical.price, stock.technical.atr_14, max_dist)
+
     def test_call_wall_within_atr_kept(self, config):
         """Call wall within 5*ATR → preserved."""
         # price=150, atr=3, call_wall=160, distance=10, 5*3=15 → within
-        stock = _make_stock(price=150.0, atr=3.0)
-        call_wall = 160.0
-        atr = stock.technical.atr_14
-        max_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-        if call_wall > 0 and atr > 0:
-            if abs(call_wall - stock.technical.price) > atr * max_dist:
-                call_wall = 0.0
-        assert call_wall == 160.0
+        assert self._filtered(config, 160.0) == 160.0
 
     def test_call_wall_beyond_atr_zeroed(self, config):
         """Call wall beyond 5*ATR → zeroed."""
         # price=150, atr=3, call_wall=200, distance=50, 5*3=15 → beyond
-        stock = _make_stock(price=150.0, atr=3.0)
-        call_wall = 200.0
-        atr = stock.technical.atr_14
-        max_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-        if call_wall > 0 and atr > 0:
-            if abs(call_wall - stock.technical.price) > atr * max_dist:
-                call_wall = 0.0
-        assert call_wall == 0.0
+        assert self._filtered(config, 200.0) == 0.0
 
     def test_call_wall_zero_passthrough(self, config):
         """call_wall=0 → stays 0 (no filter applied)."""
-        stock = _make_stock(price=150.0, atr=3.0)
-        call_wall = 0.0
-        atr = stock.technical.atr_14
-        max_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-        if call_wall > 0 and atr > 0:
-            if abs(call_wall - stock.technical.price) > atr * max_dist:
-                call_wall = 0.0
-        assert call_wall == 0.0
+        assert self._filtered(config, 0.0) == 0.0
 
     def test_no_atr_skips_filter(self, config):
         """atr=0 → filter skipped, call_wall preserved."""
-        stock = _make_stock(price=150.0, atr=0.0)
-        call_wall = 500.0
-        atr = stock.technical.atr_14
-        max_dist = config.tuning.get("call_wall_max_atr_distance", 5.0)
-        if call_wall > 0 and atr > 0:
-            if abs(call_wall - stock.technical.price) > atr * max_dist:
-                call_wall = 0.0
-        assert call_wall == 500.0  # Filter not applied (atr=0)
+        assert self._filtered(config, 500.0, atr=0.0) == 500.0  # Filter not applied (atr=0)
 
 
 # ============================================================================
@@ -461,6 +486,35 @@ class TestDTEFilterInPhase4Flow:
         if result.pcr is not None:
             assert result.pcr < 0.1  # Near-zero because far puts were excluded
 
+    def test_tally_falls_back_to_full_chain(self, config):
+        """<5 near-term contracts → PCR over the whole chain, counted in one pass."""
+        from ifds.phases.phase4_stocks import _analyze_flow_from_data, _tally_option_volumes
+
+        today = date.today()
+        near_exp = (today + timedelta(days=20)).isoformat()
+        far_exp = (today + timedelta(days=120)).isoformat()
+        options = [
+            {
+                "details": {
+                    "contract_type": "call",
+                    "strike_price": 105,
+                    "expiration_date": near_exp,
+                },
+                "day": {"volume": 100},
+            },
+            {
+                "details": {"contract_type": "put", "strike_price": 95, "expiration_date": far_exp},
+                "day": {"volume": 300},
+            },
+        ]
+        assert _tally_option_volumes(options, 100.0, 90) == (100, 0, 100, 1)
+        assert _tally_option_volumes(options, 100.0, 0) == (100, 300, 100, 2)
+
+        bars = [{"c": 100.0, "h": 102.0, "l": 98.0, "v": 1_000_000}] * 50
+        result = _analyze_flow_from_data("TEST", bars, None, config, options_data=options)
+        assert result.pcr == 3.0
+        assert result.otm_call_ratio == 1.0
+
 
 # ============================================================================
 # TestIntegration
@@ -472,7 +526,7 @@ class TestIntegration:
 
     def test_dte_filter_end_to_end_gex(self):
         """Full _calculate_gex with mixed DTE options (≥5 near contracts)."""
-        provider = PolygonGEXProvider(MagicMock(), max_dte=35)
+        provider = PolygonGEXProvider(_NO_CLIENT, max_dte=35)
         today = date.today()
         near_exp = (today + timedelta(days=20)).isoformat()
         far_exp = (today + timedelta(days=90)).isoformat()
@@ -4,6 +4,7 @@ Notional Limits.
 25+ tests covering all 4 BC13 features.
 """
 
+import copy
 import json
 import os
 from datetime import date, timedelta
@@ -46,13 +47,15 @@ from ifds.phases.phase6_sizing import (
 # ============================================================================
 
 
-@pytest.fixture
-def config(monkeypatch):
-    monkeypatch.setenv("IFDS_POLYGON_API_KEY", "test_poly")
-    monkeypatch.setenv("IFDS_FMP_API_KEY", "test_fmp")
-    monkeypatch.setenv("IFDS_FRED_API_KEY", "test_fred")
-    monkeypatch.setenv("IFDS_ASYNC_ENABLED", "false")
-    c = Config()
+@pytest.fixture(scope="module")
+def _base_config():
+    """One Config per module; env is patched only while Config() reads it."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("IFDS_POLYGON_API_KEY", "test_poly")
+        mp.setenv("IFDS_FMP_API_KEY", "test_fmp")
+        mp.setenv("IFDS_FRED_API_KEY", "test_fred")
+        mp.setenv("IFDS_ASYNC_ENABLED", "false")
+        c = Config()
     # Pin legacy Phase 6 path — BC13 tests target legacy daily-trade /
     # notional limits which the swing-sizing path bypasses.
     c.tuning["swing_sizing_enabled"] = False
@@ -62,11 +65,37 @@ def config(monkeypatch):
     return c
 
 
+@pytest.fixture
+def config(_base_config):
+    """The shared Config, with core/tuning/runtime restored after each test's edits."""
+    sections = ("core", "tuning", "runtime")
+    snapshot = {name: copy.deepcopy(getattr(_base_config, name)) for name in sections}
+    yield _base_config
+    for name in sections:
+        section = getattr(_base_config, name)
+        section.clear()
+        section.update(snapshot[name])
+
+
 @pytest.fixture
 def logger(tmp_path):
     return EventLogger(log_dir=str(tmp_path), run_id="test-bc13")
 
 
+@pytest.fixture
+def today(monkeypatch):
+    """ISO date Phase 6 sees for the whole test, pinned so midnight can't split it."""
+    frozen = date.today()
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return frozen
+
+    monkeypatch.setattr("ifds.phases.phase6_sizing.date", FrozenDate)
+    return frozen.isoformat()
+
+
 def _make_stock(ticker="AAPL", price=150.0, atr=3.0, combined=80.0, flow_score=10, funda_score=15):
     """Helper to create a StockAnalysis for testing."""
     return StockAnalysis(
@@ -309,6 +338,35 @@ class TestSurvivorshipBias:
         remaining = [fn for fn in os.listdir(snap_dir) if fn.endswith(".json")]
         assert len(remaining) == 3
 
+    def test_ignores_non_snapshot_files(self, tmp_path, config, logger):
+        """Only YYYY-MM-DD.json files are diffed and pruned."""
+        from ifds.phases.phase2_universe import _save_universe_snapshot
+
+        snap_dir = tmp_path / "snaps"
+        config.runtime["survivorship_snapshot_dir"] = str(snap_dir)
+        config.runtime["survivorship_max_snapshots"] = 1
+        os.makedirs(snap_dir, exist_ok=True)
+
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        (snap_dir / f"{yesterday}.json").write_text('[{"symbol": "AAPL"}]')
+        (snap_dir / "notes.json").write_text('[{"symbol": "ZZZZ"}]')  # sorts after dates
+
+        tickers = [
+            Ticker(
+                symbol="AAPL",
+                company_name="Apple",
+                sector="Technology",
+                market_cap=3_000_000_000_000,
+                price=150.0,
+                avg_volume=1_000_000,
+            ),
+        ]
+        _save_universe_snapshot(tickers, config, logger)
+
+        assert sorted(os.listdir(snap_dir)) == [f"{date.today().isoformat()}.json", "notes.json"]
+        messages = [e.get("message", "") for e in logger.events]
+        assert not any("ZZZZ" in m for m in messages)  # diffed against yesterday, not notes
+
     def test_no_previous_snapshot(self, tmp_path, config, logger):
         """First run with no previous snapshot: no diff logged."""
         from ifds.phases.phase2_universe import _save_universe_snapshot
@@ -414,7 +472,7 @@ class TestTelegramDailyReport:
         config.runtime["telegram_chat_id"] = "456"
 
         ctx = _make_ctx(positions=[])
-        with patch("ifds.output.telegram.requests.post") as mock_post:
+        with patch("ifds.output.telegram._SESSION.post") as mock_post:
             mock_post.return_value = MagicMock()
             result = send_daily_report(ctx, config, logger, 5.0)
 
@@ -422,7 +480,7 @@ class TestTelegramDailyReport:
         text = mock_post.call_args[1]["json"]["text"]
         assert "No positions today" in text
 
-    @patch("ifds.output.telegram.requests.post")
+    @patch("ifds.output.telegram._SESSION.post")
     def test_successful_send(self, mock_post, config, logger):
         """Sends unified message with all phases."""
         from ifds.output.telegram import send_daily_report
@@ -450,7 +508,7 @@ class TestTelegramDailyReport:
         assert "[ 0/6 ]" in text
         assert "[ 1/6 ]" in text
 
-    @patch("ifds.output.telegram.requests.post", side_effect=Exception("Network error"))
+    @patch("ifds.output.telegram._SESSION.post", side_effect=Exception("Network error"))
     def test_failure_returns_false(self, mock_post, config, logger):
         """Returns False on network failure."""
         from ifds.output.telegram import send_daily_report
@@ -498,7 +556,7 @@ class TestTelegramDailyReport:
         config.runtime["telegram_chat_id"] = "456"
 
         ctx = _make_ctx(positions=[_make_position()])
-        with patch("ifds.output.telegram.requests.post") as mock_post:
+        with patch("ifds.output.telegram._SESSION.post") as mock_post:
             mock_post.return_value = MagicMock()
             send_daily_report(ctx, config, logger, 5.0)
 
@@ -515,7 +573,7 @@ class TestTelegramDailyReport:
         for i in range(7):
             assert f"[ {i}/6 ]" in full
 
-    @patch("ifds.output.telegram.requests.post")
+    @patch("ifds.output.telegram._SESSION.post")
     def test_failure_report(self, mock_post, config, logger):
         """Failure report sends error message with HTML."""
         from ifds.output.telegram import send_failure_report
@@ -534,7 +592,7 @@ class TestTelegramDailyReport:
         assert "Connection refused" in text
         assert "2.5s" in text
 
-    @patch("ifds.output.telegram.requests.post")
+    @patch("ifds.output.telegram._SESSION.post")
     def test_message_splitting(self, mock_post, config, logger):
         """Long messages are split into 2 sends."""
         from ifds.output.telegram import send_daily_report, _MAX_MSG_LEN
@@ -565,19 +623,19 @@ class TestTelegramDailyReport:
 class TestDailyTradeCounter:
     """Test daily trade state file loading and saving."""
 
-    def test_load_no_file(self, tmp_path):
+    def test_load_no_file(self, tmp_path, today):
         """Missing file returns today with count=0."""
         result = _load_daily_counter(str(tmp_path / "nonexistent.json"))
-        assert result["date"] == date.today().isoformat()
+        assert result["date"] == today
         assert result["count"] == 0
 
-    def test_load_today(self, tmp_path):
+    def test_load_today(self, tmp_path, today):
         """Today's file returns stored count."""
         state_file = tmp_path / "trades.json"
         state_file.write_text(
             json.dumps(
                 {
-                    "date": date.today().isoformat(),
+                    "date": today,
                     "count": 5,
                 }
             )
@@ -585,14 +643,14 @@ class TestDailyTradeCounter:
         result = _load_daily_counter(str(state_file))
         assert result["count"] == 5
 
-    def test_load_old_date_resets(self, tmp_path):
+    def test_load_old_date_resets(self, tmp_path, today):
         """Yesterday's file resets to count=0."""
         state_file = tmp_path / "trades.json"
-        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        yesterday = (date.fromisoformat(today) - timedelta(days=1)).isoformat()
         state_file.write_text(json.dumps({"date": yesterday, "count": 15}))
         result = _load_daily_counter(str(state_file))
         assert result["count"] == 0
-        assert result["date"] == date.today().isoformat()
+        assert result["date"] == today
 
     def test_load_corrupt_json(self, tmp_path):
         """Corrupt JSON returns fresh counter."""
@@ -601,20 +659,20 @@ class TestDailyTradeCounter:
         result = _load_daily_counter(str(state_file))
         assert result["count"] == 0
 
-    def test_save_and_reload(self, tmp_path):
+    def test_save_and_reload(self, tmp_path, today):
         """Save writes valid JSON that loads back correctly."""
         state_file = tmp_path / "trades.json"
-        counter = {"date": date.today().isoformat(), "count": 7}
+        counter = {"date": today, "count": 7}
         _save_daily_counter(str(state_file), counter)
 
         assert state_file.exists()
         result = _load_daily_counter(str(state_file))
         assert result["count"] == 7
 
-    def test_save_creates_dirs(self, tmp_path):
+    def test_save_creates_dirs(self, tmp_path, today):
         """Save creates parent directories if needed."""
         state_file = tmp_path / "sub" / "dir" / "trades.json"
-        counter = {"date": date.today().isoformat(), "count": 3}
+        counter = {"date": today, "count": 3}
         _save_daily_counter(str(state_file), counter)
         assert state_file.exists()
 
@@ -622,7 +680,7 @@ class TestDailyTradeCounter:
 class TestMaxDailyTrades:
     """Test daily trade limit enforcement in Phase 6."""
 
-    def test_daily_limit_enforced(self, config, logger, tmp_path):
+    def test_daily_limit_enforced(self, config, logger, tmp_path, today):
         """Candidates beyond max_daily_trades are skipped."""
         config.runtime["max_daily_trades"] = 2
         config.runtime["max_positions"] = 20
@@ -634,7 +692,7 @@ class TestMaxDailyTrades:
         trades_file.write_text(
             json.dumps(
                 {
-                    "date": date.today().isoformat(),
+                    "date": today,
                     "count": 2,
                 }
             )
@@ -746,7 +804,7 @@ class TestNotionalLimits:
         # Some positions should be excluded by daily notional
         assert result.excluded_notional_limit >= 1
 
-    def test_daily_notional_persisted(self, config, logger, tmp_path):
+    def test_daily_notional_persisted(self, config, logger, tmp_path, today):
         """Daily notional counter is saved after Phase 6."""
         config.runtime["max_daily_trades"] = 100
         config.runtime["max_daily_notional"] = 10_000_000
@@ -771,9 +829,19 @@ class TestNotionalLimits:
         notional_path = tmp_path / "notional.json"
         assert notional_path.exists()
         data = json.loads(notional_path.read_text())
-        assert data["date"] == date.today().isoformat()
+        assert data["date"] == today
         assert data["count"] > 0  # At least one position's notional recorded
 
+    def test_unchanged_counters_not_rewritten(self, config, logger, tmp_path):
+        """A run that sizes no positions leaves the counter files untouched."""
+        config.runtime["daily_notional_file"] = str(tmp_path / "notional.json")
+        config.runtime["daily_trades_file"] = str(tmp_path / "trades.json")
+
+        run_phase6(config, logger, [], [], _make_macro(), StrategyMode.LONG)
+
+        assert not (tmp_path / "notional.json").exists()
+        assert not (tmp_path / "trades.json").exists()
+
 
 # ============================================================================
 # Replace Quantity Helper
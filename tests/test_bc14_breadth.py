@@ -6,6 +6,8 @@ score adjustment, FMP ETF holdings, and Phase 3 integration.
 """
 
 from datetime import date, timedelta
+from functools import lru_cache
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -33,6 +35,7 @@ from ifds.phases.phase3_sectors import (
     _calculate_sector_breadth,
     run_phase3,
 )
+from tests._fakes import FakeCache
 
 # ============================================================================
 # Fixtures
@@ -53,6 +56,14 @@ def logger(tmp_path):
     return EventLogger(log_dir=str(tmp_path), run_id="test-bc14")
 
 
+def _breadth_cfg(periods=(20, 50, 200), weights=(0.20, 0.50, 0.30)):
+    """Minimal config for _calculate_breadth, which only reads ``core``."""
+    return SimpleNamespace(
+        core={"breadth_sma_periods": list(periods), "breadth_composite_weights": weights},
+        tuning={},
+    )
+
+
 def _make_grouped_bars(num_days=250, tickers=None):
     """Create fake grouped daily bars with predictable closes.
 
@@ -88,6 +99,15 @@ def _make_grouped_bars(num_days=250, tickers=None):
     return daily_data
 
 
+@lru_cache(maxsize=None)
+def _shared_grouped_bars(num_days=250, tickers=None) -> tuple[dict, ...]:
+    """Grouped bars built once per (num_days, tickers) and shared by read-only tests.
+
+    A tuple so no caller can append; tests that edit bars use _make_grouped_bars.
+    """
+    return tuple(_make_grouped_bars(num_days, list(tickers) if tickers else None))
+
+
 def _make_sector_score(etf="XLK", sector_name="Technology", momentum_5d=1.5) -> SectorScore:
     """Create a basic SectorScore for testing."""
     return SectorScore(
@@ -163,6 +183,15 @@ class TestBuildTickerCloseHistory:
         assert "AAPL" in histories
         assert "MSFT" not in histories
 
+    def test_missing_days_and_null_closes_skipped(self):
+        bars = _make_grouped_bars(num_days=25, tickers=["AAPL", "MSFT"])
+        bars[3]["bars"] = [b for b in bars[3]["bars"] if b["T"] != "AAPL"]  # no AAPL bar
+        bars[4]["bars"][0]["c"] = None  # AAPL bar without a close
+        histories = _build_ticker_close_history(bars, {"AAPL", "MSFT"})
+        assert len(histories["AAPL"]) == 23
+        assert None not in histories["AAPL"]
+        assert len(histories["MSFT"]) == 25
+
 
 # ============================================================================
 # TestCalculateBreadth
@@ -172,14 +201,10 @@ class TestBuildTickerCloseHistory:
 class TestCalculateBreadth:
     def test_all_above_sma(self):
         """All tickers in uptrend → 100% above all SMAs."""
-        bars = _make_grouped_bars(num_days=250, tickers=["A", "B", "C"])
+        bars = _shared_grouped_bars(250, ("A", "B", "C"))
         histories = _build_ticker_close_history(bars, {"A", "B", "C"})
         # All tickers trend up (100 + idx*0.1), so last close > any SMA
-        cfg = MagicMock()
-        cfg.core = {
-            "breadth_sma_periods": [20, 50, 200],
-            "breadth_composite_weights": (0.20, 0.50, 0.30),
-        }
+        cfg = _breadth_cfg()
         breadth = _calculate_breadth("XLK", ["A", "B", "C"], histories, cfg)
         assert breadth.pct_above_sma20 == pytest.approx(100.0)
         assert breadth.pct_above_sma50 == pytest.approx(100.0)
@@ -188,11 +213,7 @@ class TestCalculateBreadth:
 
     def test_no_data_returns_zeros(self):
         """No matching tickers → all percentages 0."""
-        cfg = MagicMock()
-        cfg.core = {
-            "breadth_sma_periods": [20, 50, 200],
-            "breadth_composite_weights": (0.20, 0.50, 0.30),
-        }
+        cfg = _breadth_cfg()
         breadth = _calculate_breadth("XLK", ["NONE1", "NONE2"], {}, cfg)
         assert breadth.pct_above_sma20 == 0.0
         assert breadth.breadth_score == 0.0
@@ -205,20 +226,12 @@ class TestCalculateBreadth:
             "A": [100.0] * 19 + [200.0],  # Last price 200 > SMA20(~105.x)
             "B": [200.0] * 19 + [100.0],  # Last price 100 < SMA20(~195.x)
         }
-        cfg = MagicMock()
-        cfg.core = {
-            "breadth_sma_periods": [20],
-            "breadth_composite_weights": (1.0,),
-        }
+        cfg = _breadth_cfg(periods=(20,), weights=(1.0,))
         breadth = _calculate_breadth("XLK", ["A", "B"], histories, cfg)
         assert breadth.pct_above_sma20 == pytest.approx(50.0)
 
     def test_default_regime_is_neutral(self):
-        cfg = MagicMock()
-        cfg.core = {
-            "breadth_sma_periods": [20, 50, 200],
-            "breadth_composite_weights": (0.20, 0.50, 0.30),
-        }
+        cfg = _breadth_cfg()
         breadth = _calculate_breadth("XLK", [], {}, cfg)
         assert breadth.breadth_regime == BreadthRegime.NEUTRAL
 
@@ -357,16 +370,15 @@ class TestFMPGetEtfHoldings:
 
     def test_sync_get_etf_holdings_cached(self):
         from ifds.data.fmp import FMPClient
-        from ifds.data.cache import FileCache
 
-        cache = MagicMock(spec=FileCache)
         cached_data = [{"asset": "AAPL"}]
-        cache.get.return_value = cached_data
+        cache = FakeCache(cached_data)
 
         client = FMPClient(api_key="test_key", cache=cache)
         result = client.get_etf_holdings("XLK")
         assert result == cached_data
-        cache.get.assert_called_once()
+        assert len(cache.gets) == 1
+        assert cache.puts == []
         client.close()
 
 
@@ -411,7 +423,7 @@ class TestComputePctAboveSmaNDaysAgo:
 class TestCalculateSectorBreadth:
     def test_breadth_attached_to_scores(self, config, logger):
         scores = [_make_sector_score("XLK", "Technology")]
-        bars = _make_grouped_bars(num_days=250, tickers=["AAPL", "MSFT", "GOOGL"])
+        bars = _shared_grouped_bars(250, ("AAPL", "MSFT", "GOOGL"))
 
         mock_fmp = MagicMock()
         mock_fmp.get_etf_holdings.return_value = [
@@ -431,7 +443,7 @@ class TestCalculateSectorBreadth:
 
     def test_no_holdings_skips(self, config, logger):
         scores = [_make_sector_score("XLK", "Technology")]
-        bars = _make_grouped_bars(num_days=250)
+        bars = _shared_grouped_bars(250)
 
         mock_fmp = MagicMock()
         mock_fmp.get_etf_holdings.return_value = None
@@ -441,7 +453,7 @@ class TestCalculateSectorBreadth:
 
     def test_score_adjustment_applied(self, config, logger):
         scores = [_make_sector_score("XLK", "Technology")]
-        bars = _make_grouped_bars(num_days=250, tickers=["A", "B", "C"])
+        bars = _shared_grouped_bars(250, ("A", "B", "C"))
 
         mock_fmp = MagicMock()
         mock_fmp.get_etf_holdings.return_value = [
@@ -474,7 +486,7 @@ class TestPhase3BreadthIntegration:
                 "sma20": 102.0,
             },
         }
-        bars = _make_grouped_bars(num_days=250, tickers=["AAPL", "MSFT", "GOOGL"])
+        bars = _shared_grouped_bars(250, ("AAPL", "MSFT", "GOOGL"))
 
         mock_fmp = MagicMock()
         mock_fmp.get_etf_holdings.return_value = [
@@ -519,7 +531,7 @@ class TestPhase3BreadthIntegration:
                 "sma20": 102.0,
             },
         }
-        bars = _make_grouped_bars(num_days=250)
+        bars = _shared_grouped_bars(250)
         mock_polygon = MagicMock()
         result = run_phase3(
             config, logger, mock_polygon, StrategyMode.LONG, grouped_daily_bars=bars, fmp=None
@@ -10,6 +10,7 @@ Covers:
 """
 
 import json
+import math
 import os
 from datetime import date, timedelta
 from unittest.mock import MagicMock, call
@@ -97,6 +98,19 @@ def test_save_load_ewma_roundtrip(tmp_path):
     assert loaded == scores
 
 
+def test_load_ewma_keeps_state_with_nan_literal(tmp_path):
+    """A file stdlib json wrote with a NaN score still loads (no silent reset)."""
+    from ifds.phases.phase6_sizing import _load_ewma_scores
+
+    path = tmp_path / "ewma.json"
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    path.write_text(json.dumps({"date": yesterday, "scores": {"AAPL": 80.0, "BAD": float("nan")}}))
+
+    loaded = _load_ewma_scores(str(path))
+    assert loaded["AAPL"] == 80.0
+    assert math.isnan(loaded["BAD"])
+
+
 def test_load_ewma_same_day_returns_empty(tmp_path):
     """Same-day EWMA file returns empty (prevent double-application)."""
     from ifds.phases.phase6_sizing import _save_ewma_scores, _load_ewma_scores
@@ -112,6 +112,29 @@ class TestTradingCalendar:
         # 0 trading days = same date
         assert add_trading_days(date(2026, 2, 18), 0) == date(2026, 2, 18)
 
+    def test_add_trading_days_from_holiday(self):
+        from ifds.utils.trading_calendar import add_trading_days
+
+        # Presidents' Day Feb 16: +1 = Tue Feb 17, -1 = Fri Feb 13
+        assert add_trading_days(date(2026, 2, 16), 1) == date(2026, 2, 17)
+        assert add_trading_days(date(2026, 2, 16), -1) == date(2026, 2, 13)
+
+    def test_add_trading_days_out_of_range(self):
+        from ifds.utils.trading_calendar import add_trading_days
+
+        with pytest.raises(IndexError):
+            add_trading_days(date(2026, 2, 12), 100_000)
+        with pytest.raises(IndexError):
+            add_trading_days(date(2026, 2, 12), -100_000)
+
+    def test_add_trading_days_rejects_dates_outside_calendar(self):
+        from ifds.utils.trading_calendar import add_trading_days
+
+        with pytest.raises(IndexError):
+            add_trading_days(date(2040, 6, 3), -1)
+        with pytest.raises(IndexError):
+            add_trading_days(date(1990, 1, 1), 1)
+
     def test_count_trading_days(self):
         from ifds.utils.trading_calendar import count_trading_days
 
@@ -119,6 +142,87 @@ class TestTradingCalendar:
         # = Feb 13, Feb 17, Feb 18 = 3 trading days
         assert count_trading_days(date(2026, 2, 12), date(2026, 2, 18)) == 3
 
+    def test_count_trading_days_non_session_bounds(self):
+        from ifds.utils.trading_calendar import count_trading_days
+
+        # Sat Feb 14 → Mon Feb 16 (Presidents' Day): no sessions in (start, end]
+        assert count_trading_days(date(2026, 2, 14), date(2026, 2, 16)) == 0
+        # Sat Feb 14 → Tue Feb 17 = 1 (Feb 17)
+        assert count_trading_days(date(2026, 2, 14), date(2026, 2, 17)) == 1
+        # end before start
+        assert count_trading_days(date(2026, 2, 18), date(2026, 2, 12)) == 0
+
+    def test_count_trading_days_matches_session_list(self):
+        from ifds.utils.trading_calendar import count_trading_days, trading_days_between
+
+        start, end = date(2025, 11, 20), date(2026, 1, 10)
+        expected = len([d for d in trading_days_between(start, end) if d > start])
+        assert count_trading_days(start, end) == expected
+
+    def test_count_trading_days_out_of_range(self):
+        from ifds.utils.trading_calendar import count_trading_days
+
+        with pytest.raises(IndexError):
+            count_trading_days(date(2026, 1, 1), date(2040, 1, 1))
+        with pytest.raises(IndexError):
+            count_trading_days(date(1990, 1, 1), date(2026, 1, 1))
+
+    def test_next_prev_trading_day_match_session_walk(self):
+        from ifds.utils.trading_calendar import (
+            is_trading_day,
+            next_trading_day,
+            prev_trading_day,
+        )
+
+        # Thanksgiving + Christmas + New Year window, incl. non-session anchors
+        for offset in range(45):
+            d = date(2025, 11, 20) + timedelta(days=offset)
+            fwd = d + timedelta(days=1)
+            while not is_trading_day(fwd):
+                fwd += timedelta(days=1)
+            back = d - timedelta(days=1)
+            while not is_trading_day(back):
+                back -= timedelta(days=1)
+            assert next_trading_day(d) == fwd
+            assert prev_trading_day(d) == back
+
+    def test_prev_trading_day_out_of_range(self):
+        from ifds.utils.trading_calendar import prev_trading_day
+
+        with pytest.raises(IndexError):
+            prev_trading_day(date(1990, 1, 2))
+
+    def test_next_prev_trading_day_reject_dates_outside_calendar(self):
+        from ifds.utils.trading_calendar import next_trading_day, prev_trading_day
+
+        # searchsorted would clamp these to the calendar ends instead of failing
+        with pytest.raises(IndexError):
+            prev_trading_day(date(2040, 6, 3))
+        with pytest.raises(IndexError):
+            next_trading_day(date(1990, 1, 1))
+
+    def test_next_trading_days_bulk_matches_scalar(self):
+        from ifds.utils.trading_calendar import next_trading_day, next_trading_days_bulk
+
+        dates = [date(2026, 2, 12), date(2026, 2, 13), date(2026, 2, 14), date(2026, 2, 16)]
+        for n in (1, 3):
+            assert next_trading_days_bulk(dates, n) == [next_trading_day(d, n) for d in dates]
+
+    def test_next_trading_days_bulk_empty_and_invalid(self):
+        from ifds.utils.trading_calendar import next_trading_days_bulk
+
+        assert next_trading_days_bulk([], 2) == []
+        with pytest.raises(ValueError):
+            next_trading_days_bulk([date(2026, 2, 12)], n=0)
+
+    def test_next_trading_days_bulk_rejects_dates_outside_calendar(self):
+        from ifds.utils.trading_calendar import next_trading_days_bulk
+
+        with pytest.raises(IndexError):
+            next_trading_days_bulk([date(2026, 2, 12), date(1990, 1, 1)], 1)
+        with pytest.raises(IndexError):
+            next_trading_days_bulk([date(2040, 6, 3)], 1)
+
     def test_next_trading_day_invalid_n(self):
         from ifds.utils.trading_calendar import next_trading_day
 
@@ -361,3 +465,62 @@ class TestCacheTTLFix:
         to_date = date.fromisoformat(to_date_str)
         # For 30-day-old trade, to_date should be well in the past
         assert to_date < date.today()
+
+    def test_out_of_calendar_trade_falls_back_alone(self):
+        """A trade past the calendar end must not push others onto the fallback."""
+        from ifds.sim.validator import _fetch_bars_for_trades
+        from ifds.sim.models import Trade
+        from ifds.sim.broker_sim import compute_qty_split
+        from ifds.utils.trading_calendar import next_trading_day
+        import asyncio
+
+        old_date = date.today() - timedelta(days=60)
+        far_date = date.today() + timedelta(days=365 * 50)
+        qty_tp1, qty_tp2 = compute_qty_split(100)
+        trades = [
+            Trade(
+                run_id="run_20260118_120000_abc",
+                run_date=run_date,
+                ticker=ticker,
+                score=85.0,
+                gex_regime="positive",
+                multiplier=1.0,
+                entry_price=150.0,
+                quantity=100,
+                direction="BUY",
+                stop_loss=145.0,
+                tp1=158.0,
+                tp2=165.0,
+                qty_tp1=qty_tp1,
+                qty_tp2=qty_tp2,
+            )
+            for ticker, run_date in (("AAPL", old_date), ("MSFT", far_date))
+        ]
+
+        captured_calls = []
+
+        async def mock_get_aggregates(ticker, from_d, to_d):
+            captured_calls.append((ticker, from_d, to_d))
+            return []
+
+        async def mock_close():
+            pass
+
+        with patch("ifds.data.async_clients.AsyncPolygonClient") as MockClient:
+            instance = MagicMock()
+            instance.get_aggregates = mock_get_aggregates
+            instance.close = mock_close
+            MockClient.return_value = instance
+
+            asyncio.run(
+                _fetch_bars_for_trades(
+                    trades,
+                    "fake_key",
+                    max_hold_days=10,
+                    fill_window_days=1,
+                )
+            )
+
+        to_dates = {ticker: to_d for ticker, _, to_d in captured_calls}
+        assert to_dates["AAPL"] == next_trading_day(old_date, 13).isoformat()
+        assert to_dates["MSFT"] == date.today().isoformat()
@@ -1,6 +1,8 @@
 """Tests for EventLogger structured JSON output."""
 
 import json
+from unittest.mock import patch
+
 import pytest
 
 from ifds.events.logger import EventLogger
@@ -106,3 +108,27 @@ class TestEventLogger:
     def test_close_is_idempotent(self, logger):
         logger.close()
         logger.close()  # Should not raise
+
+    def test_batched_flush(self, logger):
+        """log_batch writes N events with one write/flush, same lines as log()."""
+        entries = [
+            {"event_type": EventType.EARNINGS_EXCLUSION, "phase": 2, "ticker": t, "message": t}
+            for t in ("AAA", "BBB", "CCC")
+        ]
+        entries.append(
+            {"event_type": EventType.API_ERROR, "severity": Severity.ERROR, "message": "boom"}
+        )
+        handle = logger._file_handle
+        with (
+            patch.object(handle, "write", wraps=handle.write) as mock_write,
+            patch.object(handle, "flush", wraps=handle.flush) as mock_flush,
+        ):
+            logger.log_batch(entries)
+            logger.log_batch([])
+        assert mock_write.call_count == 1
+        assert mock_flush.call_count == 1
+
+        assert [e.get("ticker") for e in logger.events] == ["AAA", "BBB", "CCC", None]
+        with open(logger.log_file) as f:
+            lines = [json.loads(line) for line in f]
+        assert lines == logger.events
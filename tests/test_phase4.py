@@ -21,6 +21,7 @@ from ifds.models.market import (
 from ifds.phases.phase4_stocks import (
     run_phase4,
     _calculate_sma,
+    _compute_smas,
     _calculate_rsi,
     _calculate_atr,
     _check_trend_filter,
@@ -28,6 +29,7 @@ from ifds.phases.phase4_stocks import (
     _score_rvol,
     _analyze_technical,
     _analyze_flow,
+    _analyze_flow_from_data,
     _analyze_fundamental,
     _calculate_insider_score,
     _insider_multiplier,
@@ -98,6 +100,11 @@ class TestSMA:
     def test_period_one(self):
         assert _calculate_sma([10, 20, 30], 1) == 30.0
 
+    def test_compute_smas_windows(self, config):
+        closes = [float(i) for i in range(1, 251)]
+        smas = _compute_smas(closes, config)
+        assert (smas.sma_20, smas.sma_50, smas.sma_200) == (240.5, 225.5, 150.5)
+
 
 # ============================================================================
 # RSI Tests
@@ -136,6 +143,11 @@ class TestRSI:
         rsi = _calculate_rsi(bars, 14)
         assert rsi == 100.0
 
+    def test_only_last_period_changes_matter(self):
+        # Long decline, then 14 straight gains → RSI(14) = 100
+        closes = [300 - i for i in range(195)] + [106 + i for i in range(15)]
+        assert _calculate_rsi(_make_bars(closes), 14) == 100.0
+
 
 # ============================================================================
 # ATR Tests
@@ -178,6 +190,11 @@ class TestATR:
         atr = _calculate_atr(bars, period=14)
         assert atr == 20.0  # max(110-90, |110-100|, |90-100|) = 20
 
+    def test_only_last_period_bars_matter(self):
+        # Wild history, then 15 flat bars (H-L = 2) → ATR(14) = 2 regardless
+        closes = [50 if i % 2 else 150 for i in range(195)] + [100] * 15
+        assert _calculate_atr(_make_bars(closes), period=14) == 2.0
+
 
 # ============================================================================
 # Trend Filter Tests
@@ -303,6 +320,14 @@ class TestFlowAnalysis:
         assert flow.squat_bar is True
         assert flow.squat_bar_bonus == 10
 
+    @pytest.mark.parametrize("count", [0, 1, 4])
+    def test_empty_bars_returns_empty_flow(self, config, count):
+        """Fewer than 5 bars → neutral FlowAnalysis, provider data ignored."""
+        bars = _make_bars([100] * count) if count else []
+        dp = {"dp_volume": 10_000, "signal": "BULLISH", "block_trade_count": 99}
+        flow = _analyze_flow_from_data("HALT", bars, dp, config)
+        assert flow == FlowAnalysis()
+
     def test_squat_bar_not_detected_low_rvol(self, config):
         bars = _make_bars([100] * 25)
         flow = _analyze_flow("TEST", bars, None, config)